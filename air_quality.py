@@ -1,309 +1,555 @@
-"""Indoor Air Quality (IAQ)"""
-
-from typing import Union, List
-import pandas as pd
-import numpy as np
-
-
-def iaq_co2(
-    co2_indoor: Union[float, int, np.ndarray, pd.Series, List[float], List[int]],
-    co2_outdoor: Union[float, int, np.ndarray, pd.Series, List[float], List[int]] = 400,
-    standard: str = "EN",
-) -> dict:
-    """
-    Calculate IAQ indices based on different standards.
-
-    Warnings
-    --------
-        CO2 is only suitable for assessing IAQ as an indirect indicator of ventilation rate.
-        The assessment should be made aware of the following limitations:
-        1. CO2 below the threshold does not ensure an acceptable overall IAQ, but an excessively high CO2
-        may indicate that the room is not well ventilated, e.g. the ventilation system is not functioning
-        correctly or the windows are closed for a long period of time.
-        2. The direct impact of CO2 on health, well-being, and performance is still controversial.
-        At the same time CO2 should not be used directly as a direct indicator of the risk of disease transmission,
-        but should only be considered as an indirect indicator of ventilation rates.
-        3. CO2 measurements are greatly influenced by the accuracy of the sensor, its installation location
-        and calibration method.
-        Therefore, ASHRAE does not have a CO2-based IAQ index, see [1]_.
-
-    Parameters
-    ----------
-    co2_indoor : float, int or 1d array-like, support numpy array or pandas series
-        CO2 concentration indoors in ppm.
-
-    co2_outdoor : float, int or 1d array-like, support numpy array or pandas series, default=400
-        CO2 concentration outdoors in ppm.
-
-    standard : str
-        standard applied for evaluation, support "EN", "LEHB", "SS", "HK", "UBA", "DOSH", see Notes.
-
-    Returns
-    -------
-    report : dict
-        IAQ report as dictionary, includes calculated 'indices' / applied 'standard'
-        raw data indoors 'co2_indoor' / outdoors 'co2_outdoor'.
-
-    Notes
-    -----
-    - EN: European standard CEN/EN 16798-1, based on german version DIN EN 16798-1:2019 (Page 55).
-    Evaluation based on CO2 concentration differences between indoors and outdoors.
-        - [Index = 1] Category I: delta(CO2) <= 550 ppm
-        - [Index = 2] Category II: delta(CO2) <= 800 ppm
-        - [Index = 3] Category III: delta(CO2) <= 1350 ppm
-        - [Index = 4] Category IV: delta(CO2) > 1350 ppm
-
-    - LEHB: Japanese law for environmental health in buildings (LEHB).
-    Evaluation based on CO2 concentration indoors.
-        - [Index = 1] Acceptable: CO2 <= 1000 ppm
-        - [Index = 2] Unacceptable: CO2 > 1000 ppm
-
-    - SS: Singapore standard SS 554:2016 (Page 22).
-    Evaluation based on CO2 concentration differences between indoors and outdoors.
-        - [Index = 1] Acceptable: delta(CO2) <= 700 ppm
-        - [Index = 2] Unacceptable: delta(CO2) > 700 ppm
-
-    - HK: Hong Kong Environmental Protection Department.
-    "Hongkong Guidance Notes for the Management of Indoor Air Quality in Offices and Public Places" (Page 17).
-    Evaluation based on CO2 concentration indoors (averaging time 8-hour). Here the average is changed
-    to an instantaneous evaluation for each measurment.
-        - [Index = 1] Excellent Class: CO2 <= 800 ppm
-        - [Index = 2] Good Class: CO2 <= 1000 ppm
-        - [Index = 3] Unacceptable: CO2 > 1000 ppm
-
-    - UBA: German environmental protection agency (Umweltbundesamt).
-    "Gesundheitsschutz 11-2008: Gesundheitliche Bewertung von Kohlendioxid in der Innenraumluft" (Page 1368).
-    Evaluation based on CO2 concentration indoors.
-        - [Index = 1] Hygienically safe: CO2 < 1000 ppm
-        - [Index = 2] Hygienically conspicuous: CO2 <= 2000 ppm
-        - [Index = 3] Hygienically unacceptable: CO2 > 2000 ppm
-
-    - DOSH: Department of Occupational Safety and Health (DOSH) Malaysia.
-    "Industry Code of Practice on Indoor Air Quality 2010 (ICOP IAQ 2010)."
-    Evaluation based on CO2 concentration indoors.
-        - [Index = 1] Acceptable: CO2 <= 1000 ppm
-        - [Index = 2] Unacceptable: CO2 > 1000 ppm
-
-    References
-    ----------
-    .. [1] Persily A. 2020. Quit Blaming ASHRAE Standard 62.1 for 1000 ppm CO2, The 16th Conference of the Internatinal
-        Society of Indoor Air Quality & Climate.
-
-    Examples
-    --------
-    >>> from py2oc import iaq
-    >>> import pandas as pd
-    >>> co2 = [400, 420, 450, 480, 600, 800, 850, 900, 800, 850, 1000, 1200, 1500, 1600, 2000, 3000, 1600, 800]
-    >>> iaq_en = pd.DataFrame(iaq.iaq_co2(co2, standard="EN"))
-    >>> iaq_en.info()
-    >>> iaq_en.to_csv(f"./example.csv")
-    <class 'pandas.core.frame.DataFrame'>
-    RangeIndex: 18 entries, 0 to 17
-    Data columns (total 4 columns):
-     #   Column       Non-Null Count  Dtype
-    ---  ------       --------------  -----
-     0   indices      18 non-null     int64
-     1   standard     18 non-null     object
-     2   co2_indoor   18 non-null     int64
-     3   co2_outdoor  18 non-null     int64
-    dtypes: int64(3), object(1)
-    memory usage: 704.0+ bytes
-    """
-    standards = ["EN", "LEHB", "SS", "HK", "UBA", "DOSH"]
-    if standard not in standards:
-        raise ValueError(
-            f"Error: Unknow standard for iaq_co2(). Supported standards are {standards}."
-        )
-
-    report = {}
-    indices = []
-
-    if co2_indoor is float or int:
-        co2_indoor = [co2_indoor]
-
-    for i in range(0, len(co2_indoor)):
-        co2_indoor_i = (
-            co2_indoor.iloc[i] if isinstance(co2_indoor, pd.Series) else co2_indoor[i]
-        )
-        if isinstance(co2_outdoor, (pd.Series, np.ndarray, List)):
-            if len(co2_indoor) == len(co2_outdoor):
-                co2_outdoor_i = (
-                    co2_outdoor.iloc[i]
-                    if isinstance(co2_outdoor, pd.Series)
-                    else co2_outdoor[i]
-                )
-            else:
-                raise ValueError("Error: co2_indoor and co2_outdoor have different length. "
-                                 "They have to be aligned if using dynamic outdoor CO2 concentration!")
-        else:
-            co2_outdoor_i = co2_outdoor
-
-        if standard == "LEHB":
-            index = _iaq_co2_single_th(co2_indoor_i, threshold=1000, includingth=True)
-        elif standard == "SS":
-            index = _iaq_delta_co2_single_th(
-                co2_indoor_i, co2_outdoor_i, threshold=700, includingth=True
-            )
-        elif standard == "HK":
-            index = _iaq_co2_hk(co2_indoor_i)
-        elif standard == "UBA":
-            index = _iaq_co2_uba(co2_indoor_i)
-        elif standard == "DOSH":
-            index = _iaq_co2_single_th(co2_indoor_i, threshold=1000, includingth=True)
-        else:
-            # default: EN standard
-            index = _iaq_co2_en(co2_indoor_i, co2_outdoor_i)
-
-        indices.append(index)
-
-    report["indices"] = indices
-    report["standard"] = standard
-    report["co2_indoor"] = co2_indoor
-    report["co2_outdoor"] = co2_outdoor
-
-    return report
-
-
-def _iaq_co2_en(co2_indoor: Union[float, int], co2_outdoor: Union[float, int]) -> int:
-    """
-    Helper function to calculate IAQ index for a single measurement based on CEN/EN 16798-1.
-
-    Parameters
-    ----------
-    co2_indoor : float or int
-        single data point of CO2 concentration indoors in ppm.
-    co2_outdoor : float or int
-        single data point of CO2 concentration outdoors in ppm.
-
-    Returns
-    -------
-    index : int
-        single IAQ index, range 1 (best) - 4 (worst), corresponds to categories I-IV in EN 16798-1.
-    """
-    delta_co2 = co2_indoor - co2_outdoor
-    if delta_co2 <= 550:
-        index = 1
-    elif delta_co2 <= 800:
-        index = 2
-    elif delta_co2 <= 1350:
-        index = 3
-    else:
-        index = 4
-
-    return index
-
-
-def _iaq_co2_hk(co2_indoor: Union[float, int]) -> int:
-    """
-    Helper function to calculate IAQ index for a single measurement based on Hongkong EPD standard.
-
-    Parameters
-    ----------
-    co2_indoor : float or int
-        single data point of CO2 concentration indoors in ppm.
-
-    Returns
-    -------
-    index : int
-        single IAQ index, range 1 (best) - 3 (worst), corresponds to
-        categories Excellent Class (1) / Good Class (2) / Unacceptable (3).
-    """
-    if co2_indoor <= 800:
-        index = 1
-    elif co2_indoor <= 1000:
-        index = 2
-    else:
-        index = 3
-
-    return index
-
-
-def _iaq_co2_uba(co2_indoor: Union[float, int]) -> int:
-    """
-    Helper function to calculate IAQ index for a single measurement based on German EPA standard (Umweltbundesamt).
-
-    Parameters
-    ----------
-    co2_indoor : float or int
-        single data point of CO2 concentration indoors in ppm.
-
-    Returns
-    -------
-    index : int
-        single IAQ index, range 1 (best) - 3 (worst), corresponds to
-        categories hygienically safe (1) / hygienically conspicuous (2) / Hygienically unacceptable (3).
-    """
-    if co2_indoor < 1000:
-        index = 1
-    elif co2_indoor <= 2000:
-        index = 2
-    else:
-        index = 3
-
-    return index
-
-
-def _iaq_co2_single_th(
-    co2_indoor: Union[float, int], threshold: Union[float, int], includingth: bool
-) -> int:
-    """
-    Helper function to calculate IAQ index for a single measurement based on co2 concentration indoors and
-    a single threshold value.
-
-    Parameters
-    ----------
-    co2_indoor : float or int
-        single data point of CO2 concentration indoors in ppm.
-    threshold : float or int
-        threshold value for acceptable IAQ
-    includingth : bool
-        whether or not the threshold value is included for acceptable IAQ, depends on standard.
-
-    Returns
-    -------
-    index : int
-        single IAQ index, range 1 (accpetable) - 2 (unacceptable).
-    """
-    if includingth is True:
-        # acceptable including threshold, 1: acceptable, 2: unacceptable
-        index = 1 if co2_indoor <= threshold else 2
-    else:
-        index = 1 if co2_indoor < threshold else 2
-
-    return index
-
-
-def _iaq_delta_co2_single_th(
-    co2_indoor: Union[float, int],
-    co2_outdoor: Union[float, int],
-    threshold: Union[float, int],
-    includingth: bool,
-) -> int:
-    """
-    Helper function to calculate IAQ index for a single measurement based on co2 concentration difference
-    indoors/outdoors and a single threshold value.
-
-    Parameters
-    ----------
-    co2_indoor : float or int
-        single data point of CO2 concentration indoors in ppm.
-    co2_outdoor : float or int
-        single data point of CO2 concentration outdoors in ppm.
-    threshold : float or int
-        threshold value for acceptable IAQ
-    includingth : bool
-        whether or not the threshold value is included for acceptable IAQ, depends on standard.
-
-    Returns
-    -------
-    index : int
-        single IAQ index, range 1 (accpetable) - 2 (unacceptable).
-    """
-    delta_co2 = co2_indoor - co2_outdoor
-    if includingth is True:
-        # acceptable including threshold, 1: acceptable, 2: unacceptable
-        index = 1 if delta_co2 <= threshold else 2
-    else:
-        index = 1 if delta_co2 < threshold else 2
-
-    return index
\ No newline at end of file
+"""Indoor Air Quality (IAQ)"""
+
+from __future__ import annotations
+from typing import Union, List
+from collections import deque
+from datetime import datetime, timedelta
+from lazy_import import lazy_import
+import numpy as np
+
+# imported on first use, only needed for time series
+pd = lazy_import("pandas")
+
+
+def iaq_co2(
+    co2_indoor: Union[float, int, np.ndarray, pd.Series, List[float], List[int]],
+    co2_outdoor: Union[float, int, np.ndarray, pd.Series, List[float], List[int]] = 400,
+    standard: str = "EN",
+) -> dict:
+    """
+    Calculate IAQ indices based on different standards.
+
+    Warnings
+    --------
+        CO2 is only suitable for assessing IAQ as an indirect indicator of ventilation rate.
+        The assessment should be made aware of the following limitations:
+        1. CO2 below the threshold does not ensure an acceptable overall IAQ, but an excessively high CO2
+        may indicate that the room is not well ventilated, e.g. the ventilation system is not functioning
+        correctly or the windows are closed for a long period of time.
+        2. The direct impact of CO2 on health, well-being, and performance is still controversial.
+        At the same time CO2 should not be used directly as a direct indicator of the risk of disease transmission,
+        but should only be considered as an indirect indicator of ventilation rates.
+        3. CO2 measurements are greatly influenced by the accuracy of the sensor, its installation location
+        and calibration method.
+        Therefore, ASHRAE does not have a CO2-based IAQ index, see [1]_.
+
+    Parameters
+    ----------
+    co2_indoor : float, int or 1d array-like, support numpy array or pandas series
+        CO2 concentration indoors in ppm.
+
+    co2_outdoor : float, int or 1d array-like, support numpy array or pandas series, default=400
+        CO2 concentration outdoors in ppm.
+
+    standard : str
+        standard applied for evaluation, support "EN", "LEHB", "SS", "HK", "UBA", "DOSH", see Notes.
+
+    Returns
+    -------
+    report : dict
+        IAQ report as dictionary, includes calculated 'indices' (int8 numpy array, 0 for missing values) /
+        applied 'standard' / raw data indoors 'co2_indoor' / outdoors 'co2_outdoor' (as float numpy array
+        if not a single value).
+
+    Notes
+    -----
+    - EN: European standard CEN/EN 16798-1, based on german version DIN EN 16798-1:2019 (Page 55).
+    Evaluation based on CO2 concentration differences between indoors and outdoors.
+        - [Index = 1] Category I: delta(CO2) <= 550 ppm
+        - [Index = 2] Category II: delta(CO2) <= 800 ppm
+        - [Index = 3] Category III: delta(CO2) <= 1350 ppm
+        - [Index = 4] Category IV: delta(CO2) > 1350 ppm
+
+    - LEHB: Japanese law for environmental health in buildings (LEHB).
+    Evaluation based on CO2 concentration indoors.
+        - [Index = 1] Acceptable: CO2 <= 1000 ppm
+        - [Index = 2] Unacceptable: CO2 > 1000 ppm
+
+    - SS: Singapore standard SS 554:2016 (Page 22).
+    Evaluation based on CO2 concentration differences between indoors and outdoors.
+        - [Index = 1] Acceptable: delta(CO2) <= 700 ppm
+        - [Index = 2] Unacceptable: delta(CO2) > 700 ppm
+
+    - HK: Hong Kong Environmental Protection Department.
+    "Hongkong Guidance Notes for the Management of Indoor Air Quality in Offices and Public Places" (Page 17).
+    Evaluation based on CO2 concentration indoors (averaging time 8-hour). Here the average is changed
+    to an instantaneous evaluation for each measurment, use iaq_co2_rolling() or RollingIAQ for the 8-hour average.
+        - [Index = 1] Excellent Class: CO2 <= 800 ppm
+        - [Index = 2] Good Class: CO2 <= 1000 ppm
+        - [Index = 3] Unacceptable: CO2 > 1000 ppm
+
+    - UBA: German environmental protection agency (Umweltbundesamt).
+    "Gesundheitsschutz 11-2008: Gesundheitliche Bewertung von Kohlendioxid in der Innenraumluft" (Page 1368).
+    Evaluation based on CO2 concentration indoors.
+        - [Index = 1] Hygienically safe: CO2 < 1000 ppm
+        - [Index = 2] Hygienically conspicuous: CO2 <= 2000 ppm
+        - [Index = 3] Hygienically unacceptable: CO2 > 2000 ppm
+
+    - DOSH: Department of Occupational Safety and Health (DOSH) Malaysia.
+    "Industry Code of Practice on Indoor Air Quality 2010 (ICOP IAQ 2010)."
+    Evaluation based on CO2 concentration indoors.
+        - [Index = 1] Acceptable: CO2 <= 1000 ppm
+        - [Index = 2] Unacceptable: CO2 > 1000 ppm
+
+    References
+    ----------
+    .. [1] Persily A. 2020. Quit Blaming ASHRAE Standard 62.1 for 1000 ppm CO2, The 16th Conference of the Internatinal
+        Society of Indoor Air Quality & Climate.
+
+    Examples
+    --------
+    >>> from py2oc import iaq
+    >>> import pandas as pd
+    >>> co2 = [400, 420, 450, 480, 600, 800, 850, 900, 800, 850, 1000, 1200, 1500, 1600, 2000, 3000, 1600, 800]
+    >>> iaq_en = pd.DataFrame(iaq.iaq_co2(co2, standard="EN"))
+    >>> iaq_en.info()
+    >>> iaq_en.to_csv(f"./example.csv")
+    <class 'pandas.core.frame.DataFrame'>
+    RangeIndex: 18 entries, 0 to 17
+    Data columns (total 4 columns):
+     #   Column       Non-Null Count  Dtype
+    ---  ------       --------------  -----
+     0   indices      18 non-null     int8
+     1   standard     18 non-null     object
+     2   co2_indoor   18 non-null     float64
+     3   co2_outdoor  18 non-null     float64
+    dtypes: float64(2), int8(1), object(1)
+    memory usage: 578.0+ bytes
+    """
+    if standard not in _IAQ_CO2_THRESHOLDS:
+        raise ValueError(
+            f"Error: Unknow standard for iaq_co2(). Supported standards are {list(_IAQ_CO2_THRESHOLDS)}."
+        )
+
+    co2_indoor, co2_outdoor = _co2_as_arrays(co2_indoor, co2_outdoor)
+
+    report = {}
+    report["indices"] = _iaq_co2_classify(co2_indoor, co2_outdoor, standard)
+    report["standard"] = standard
+    report["co2_indoor"] = co2_indoor
+    report["co2_outdoor"] = co2_outdoor if co2_outdoor.ndim else co2_outdoor.item()
+
+    return report
+
+
+def iaq_co2_multi(
+    co2_indoor: Union[float, int, np.ndarray, pd.Series, List[float], List[int]],
+    co2_outdoor: Union[float, int, np.ndarray, pd.Series, List[float], List[int]] = 400,
+    standards: Union[List[str], None] = None,
+) -> dict:
+    """
+    Calculate IAQ indices for several standards at once, e.g. for compliance reports of different regions.
+    The inputs are converted and the CO2 difference indoors/outdoors is calculated only once for all standards.
+    See iaq_co2() for the warnings and the categories of each standard.
+
+    Parameters
+    ----------
+    co2_indoor : float, int or 1d array-like, support numpy array or pandas series
+        CO2 concentration indoors in ppm.
+
+    co2_outdoor : float, int or 1d array-like, support numpy array or pandas series, default=400
+        CO2 concentration outdoors in ppm.
+
+    standards : list of str, optional
+        standards applied for evaluation, subset of "EN", "LEHB", "SS", "HK", "UBA", "DOSH".
+        All standards are evaluated if not given.
+
+    Returns
+    -------
+    indices : dict
+        IAQ indices as int8 numpy array for each standard, keyed by standard. Raw data is not included,
+        so it can be directly converted into a compact table, e.g. with pd.DataFrame(indices).
+
+    Examples
+    --------
+    >>> from air_quality import iaq_co2_multi
+    >>> import pandas as pd
+    >>> co2 = [400, 420, 450, 480, 600, 800, 850, 900, 800, 850, 1000, 1200, 1500, 1600, 2000, 3000, 1600, 800]
+    >>> iaq_table = pd.DataFrame(iaq_co2_multi(co2, standards=["EN", "SS", "HK", "UBA"]), index=co2)
+    """
+    if standards is None:
+        standards = list(_IAQ_CO2_THRESHOLDS)
+    unknown = [standard for standard in standards if standard not in _IAQ_CO2_THRESHOLDS]
+    if unknown:
+        raise ValueError(
+            f"Error: Unknow standard {unknown} for iaq_co2_multi(). "
+            f"Supported standards are {list(_IAQ_CO2_THRESHOLDS)}."
+        )
+
+    co2_indoor, co2_outdoor = _co2_as_arrays(co2_indoor, co2_outdoor)
+    # only calculate CO2 difference if needed, shared by all standards based on it
+    co2_delta = None
+    if any(_IAQ_CO2_THRESHOLDS[standard][0] for standard in standards):
+        co2_delta = co2_indoor - co2_outdoor
+
+    indices = {}
+    for standard in standards:
+        use_delta, thresholds = _IAQ_CO2_THRESHOLDS[standard]
+        indices[standard] = _iaq_co2_lookup(co2_delta if use_delta else co2_indoor, thresholds)
+
+    return indices
+
+
+def iaq_co2_rolling(
+    co2_indoor: Union[np.ndarray, pd.Series, List[float], List[int]],
+    timestamps: Union[np.ndarray, pd.Series, pd.DatetimeIndex, List[datetime], None] = None,
+    co2_outdoor: Union[float, int, np.ndarray, pd.Series, List[float], List[int]] = 400,
+    standard: str = "HK",
+    window: Union[str, float, int, timedelta, None] = None,
+    max_gap: Union[str, float, int, timedelta] = "10min",
+) -> dict:
+    """
+    Calculate IAQ indices based on time-weighted rolling averages of CO2 concentration,
+    e.g. the 8-hour average defined in the Hong Kong EPD standard. Works on irregularly sampled data.
+    Use RollingIAQ for the same evaluation on live data, one measurement at a time.
+
+    Parameters
+    ----------
+    co2_indoor : 1d array-like, support numpy array or pandas series
+        CO2 concentration indoors in ppm. If it is a pandas series with DatetimeIndex, the index is used
+        as timestamps, so columns of a time-indexed DataFrame can be passed directly.
+
+    timestamps : 1d array-like of datetimes or float, optional
+        time of each measurement, sorted in ascending order. Numeric values are interpreted as seconds.
+
+    co2_outdoor : float, int or 1d array-like, support numpy array or pandas series, default=400
+        CO2 concentration outdoors in ppm, averaged over the same window if aligned with co2_indoor.
+
+    standard : str
+        standard applied for evaluation, see iaq_co2().
+
+    window : str, float, int or timedelta, optional
+        averaging time, e.g. "8h" or 3600 (seconds). Defaults to the averaging time of the standard,
+        8 hours for "HK" and 1 hour for "EN", has to be given for all other standards.
+
+    max_gap : str, float, int or timedelta, default="10min"
+        maximum time a measurement is assumed to be valid for. Longer gaps between measurements
+        (e.g. sensor offline) only count with this duration, so the average is not biased by stale values.
+
+    Returns
+    -------
+    report : dict
+        IAQ report as dictionary, includes calculated 'indices' (int8 numpy array) / applied 'standard' /
+        averaging time 'window' in seconds / time-weighted average CO2 concentration indoors 'co2_indoor_avg'.
+
+    Notes
+    -----
+    Each measurement is assumed to represent the period since the previous measurement (at most max_gap).
+    The rolling average at a measurement covers this period for all measurements within the window,
+    the part of the oldest period reaching out of the window is cut off.
+    """
+    if standard not in _IAQ_CO2_THRESHOLDS:
+        raise ValueError(
+            f"Error: Unknow standard for iaq_co2_rolling(). Supported standards are {list(_IAQ_CO2_THRESHOLDS)}."
+        )
+    window = _window_seconds(window, standard)
+    max_gap = _as_seconds(max_gap)
+
+    if timestamps is None:
+        if not isinstance(co2_indoor, pd.Series) or not isinstance(co2_indoor.index, pd.DatetimeIndex):
+            raise ValueError("Error: timestamps are required if co2_indoor is not a series with DatetimeIndex.")
+        timestamps = co2_indoor.index
+    t = _timestamps_as_seconds(timestamps)
+    co2_indoor, co2_outdoor = _co2_as_arrays(co2_indoor, co2_outdoor)
+    if t.shape != co2_indoor.shape:
+        raise ValueError("Error: co2_indoor and timestamps have different length.")
+    if np.any(np.diff(t) < 0):
+        raise ValueError("Error: timestamps have to be sorted in ascending order.")
+
+    # duration each measurement is valid for, the first one has no previous measurement
+    duration = np.clip(np.diff(t, prepend=t[:1]), 0, max_gap)
+    # index of the oldest measurement within the window (t > t_now - window)
+    oldest = np.searchsorted(t, t - window, side="right")
+    # part of the period of the oldest measurement reaching out of the window
+    overhang = np.clip((t - window) - (t[oldest] - duration[oldest]), 0, None)
+    covered = _window_sums(duration, oldest) - overhang
+
+    co2_indoor_avg = _rolling_avg(co2_indoor, duration, oldest, overhang, covered)
+    if co2_outdoor.ndim:
+        co2_outdoor = _rolling_avg(co2_outdoor, duration, oldest, overhang, covered)
+
+    report = {}
+    report["indices"] = _iaq_co2_classify(co2_indoor_avg, co2_outdoor, standard)
+    report["standard"] = standard
+    report["window"] = window
+    report["co2_indoor_avg"] = co2_indoor_avg
+
+    return report
+
+
+class RollingIAQ:
+    def __init__(
+        self,
+        standard: str = "HK",
+        window: Union[str, float, int, timedelta, None] = None,
+        max_gap: Union[str, float, int, timedelta] = "10min",
+    ):
+        """
+        Incremental version of iaq_co2_rolling() for live data, e.g. from serial_reader.microcontroller.get_data().
+        Keeps running sums over the measurements within the window, each update takes O(1) amortized time.
+
+        Example:
+        iaq_rolling = RollingIAQ(standard="HK")  # 8-hour average
+        index = iaq_rolling.update(co2_indoor=CO2)
+        """
+        if standard not in _IAQ_CO2_THRESHOLDS:
+            raise ValueError(
+                f"Error: Unknow standard for RollingIAQ. Supported standards are {list(_IAQ_CO2_THRESHOLDS)}."
+            )
+        self.standard = standard
+        self.window = _window_seconds(window, standard)
+        self.max_gap = _as_seconds(max_gap)
+        # measurements within the window: (timestamp, duration, co2_indoor, co2_outdoor)
+        self._measurements = deque()
+        self._duration_sum = 0.0
+        self._co2_indoor_sum = 0.0
+        self._co2_outdoor_sum = 0.0
+        self.co2_indoor_avg = None
+        self.co2_outdoor_avg = None
+        self.index = None
+
+    def update(
+        self,
+        co2_indoor: Union[float, int],
+        timestamp: Union[datetime, float, int, None] = None,
+        co2_outdoor: Union[float, int] = 400,
+    ) -> int:
+        """
+        Add a measurement and return the IAQ index of the rolling average.
+        Timestamp defaults to now, numeric values are interpreted as seconds.
+        """
+        if timestamp is None:
+            timestamp = datetime.now()
+        t = timestamp.timestamp() if isinstance(timestamp, datetime) else float(timestamp)
+
+        if self._measurements:
+            t_last = self._measurements[-1][0]
+            if t < t_last:
+                raise ValueError("Error: timestamps have to be sorted in ascending order.")
+            duration = min(t - t_last, self.max_gap)
+        else:
+            duration = 0.0
+        self._measurements.append((t, duration, co2_indoor, co2_outdoor))
+        self._duration_sum += duration
+        self._co2_indoor_sum += duration * co2_indoor
+        self._co2_outdoor_sum += duration * co2_outdoor
+
+        # drop measurements out of the window
+        window_start = t - self.window
+        while self._measurements[0][0] <= window_start:
+            _, duration_old, co2_indoor_old, co2_outdoor_old = self._measurements.popleft()
+            self._duration_sum -= duration_old
+            self._co2_indoor_sum -= duration_old * co2_indoor_old
+            self._co2_outdoor_sum -= duration_old * co2_outdoor_old
+        if len(self._measurements) == 1:
+            # avoid accumulating rounding errors of the running sums
+            self._duration_sum = duration
+            self._co2_indoor_sum = duration * co2_indoor
+            self._co2_outdoor_sum = duration * co2_outdoor
+
+        # part of the period of the oldest measurement reaching out of the window
+        t_oldest, duration_oldest, co2_indoor_oldest, co2_outdoor_oldest = self._measurements[0]
+        overhang = max(window_start - (t_oldest - duration_oldest), 0.0)
+        covered = self._duration_sum - overhang
+        if covered > 0:
+            self.co2_indoor_avg = (self._co2_indoor_sum - overhang * co2_indoor_oldest) / covered
+            self.co2_outdoor_avg = (self._co2_outdoor_sum - overhang * co2_outdoor_oldest) / covered
+        else:
+            self.co2_indoor_avg = co2_indoor
+            self.co2_outdoor_avg = co2_outdoor
+
+        use_delta, thresholds = _IAQ_CO2_THRESHOLDS[self.standard]
+        co2 = self.co2_indoor_avg - self.co2_outdoor_avg if use_delta else self.co2_indoor_avg
+        self.index = int(_iaq_co2_lookup(co2, thresholds))
+
+        return self.index
+
+
+def _rolling_avg(
+    values: np.ndarray, duration: np.ndarray, oldest: np.ndarray, overhang: np.ndarray, covered: np.ndarray
+) -> np.ndarray:
+    """
+    Helper function to calculate time-weighted rolling averages, see iaq_co2_rolling().
+
+    Parameters
+    ----------
+    values : np.ndarray
+        measured values.
+    duration : np.ndarray
+        duration each measurement is valid for in seconds.
+    oldest : np.ndarray
+        index of the oldest measurement within the window of each measurement.
+    overhang : np.ndarray
+        part of the period of the oldest measurement reaching out of the window in seconds.
+    covered : np.ndarray
+        total duration covered by the measurements within the window in seconds.
+
+    Returns
+    -------
+    values_avg : np.ndarray
+        time-weighted rolling averages, the measured value itself if the window covers no duration.
+    """
+    integral = _window_sums(duration * values, oldest) - overhang * values[oldest]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.where(covered > 0, integral / covered, values)
+
+
+def _window_sums(values: np.ndarray, oldest: np.ndarray) -> np.ndarray:
+    """
+    Helper function to sum up values from the oldest measurement within the window to each measurement,
+    using a cumulative sum so that each window costs O(1).
+    """
+    cumsum = np.concatenate(([0.0], np.cumsum(values)))
+
+    return cumsum[1:] - cumsum[oldest]
+
+
+def _timestamps_as_seconds(timestamps) -> np.ndarray:
+    """
+    Helper function to convert timestamps (datetimes or numeric seconds) into float64 seconds.
+    """
+    timestamps = np.asarray(timestamps)
+    if np.issubdtype(timestamps.dtype, np.number):
+        return timestamps.astype(np.float64)
+
+    return pd.to_datetime(timestamps).to_numpy(dtype="datetime64[ns]").astype(np.int64) / 1e9
+
+
+def _as_seconds(duration: Union[str, float, int, timedelta]) -> float:
+    """
+    Helper function to convert a duration, e.g. "8h" / timedelta / numeric seconds, into seconds.
+    """
+    if isinstance(duration, (int, float)):
+        return float(duration)
+
+    return pd.Timedelta(duration).total_seconds()
+
+
+def _window_seconds(window: Union[str, float, int, timedelta, None], standard: str) -> float:
+    """
+    Helper function to get the averaging time in seconds, defaults to the averaging time of the standard.
+    """
+    if window is None:
+        if standard not in _IAQ_CO2_AVERAGING_TIME:
+            raise ValueError(
+                f"Error: No averaging time defined for standard {standard}, please set the window explicitly."
+            )
+        window = _IAQ_CO2_AVERAGING_TIME[standard]
+
+    return _as_seconds(window)
+
+
+def _co2_as_arrays(
+    co2_indoor: Union[float, int, np.ndarray, pd.Series, List[float], List[int]],
+    co2_outdoor: Union[float, int, np.ndarray, pd.Series, List[float], List[int]],
+) -> tuple:
+    """
+    Helper function to convert CO2 inputs into float64 numpy arrays, without copying if they already are.
+
+    Parameters
+    ----------
+    co2_indoor : float, int or 1d array-like
+        CO2 concentration indoors in ppm.
+    co2_outdoor : float, int or 1d array-like
+        CO2 concentration outdoors in ppm, either a single value or aligned with co2_indoor.
+
+    Returns
+    -------
+    co2_indoor : np.ndarray
+        1d array of CO2 concentration indoors in ppm.
+    co2_outdoor : np.ndarray
+        0d array (single value) or 1d array aligned with co2_indoor in ppm.
+    """
+    co2_indoor = np.atleast_1d(np.asarray(co2_indoor, dtype=np.float64))
+    co2_outdoor = np.asarray(co2_outdoor, dtype=np.float64)
+    if co2_outdoor.ndim > 0 and co2_outdoor.shape != co2_indoor.shape:
+        raise ValueError("Error: co2_indoor and co2_outdoor have different length. "
+                         "They have to be aligned if using dynamic outdoor CO2 concentration!")
+
+    return co2_indoor, co2_outdoor
+
+
+def _iaq_co2_classify(co2_indoor: np.ndarray, co2_outdoor: np.ndarray, standard: str) -> np.ndarray:
+    """
+    Helper function to calculate IAQ indices for all measurements with one vectorized threshold lookup.
+
+    Parameters
+    ----------
+    co2_indoor : np.ndarray
+        CO2 concentration indoors in ppm.
+    co2_outdoor : np.ndarray
+        CO2 concentration outdoors in ppm, single value or aligned with co2_indoor.
+    standard : str
+        standard applied for evaluation, see iaq_co2().
+
+    Returns
+    -------
+    indices : np.ndarray
+        IAQ indices as int8 array, range 1 (best) - n (worst) depending on the standard, see iaq_co2().
+    """
+    use_delta, thresholds = _IAQ_CO2_THRESHOLDS[standard]
+    co2 = co2_indoor - co2_outdoor if use_delta else co2_indoor
+
+    return _iaq_co2_lookup(co2, thresholds)
+
+
+def _iaq_co2_lookup(co2: np.ndarray, thresholds: np.ndarray) -> np.ndarray:
+    """
+    Helper function to look up IAQ indices of CO2 values (concentration or difference) in a threshold array.
+
+    Parameters
+    ----------
+    co2 : np.ndarray
+        CO2 concentration indoors or CO2 difference indoors/outdoors in ppm, depends on standard.
+    thresholds : np.ndarray
+        sorted threshold array, see _iaq_co2_thresholds().
+
+    Returns
+    -------
+    indices : np.ndarray
+        IAQ indices as int8 array, range 1 (best) - len(thresholds) + 1 (worst), 0 for NaN.
+    """
+    # index = 1 + number of thresholds below the measurement
+    indices = np.searchsorted(thresholds, co2, side="left") + 1
+    # missing measurements (e.g. gaps in recorded data) are not evaluated
+    # np.where instead of item assignment: co2 is a scalar for single readings, e.g. RollingIAQ.update()
+    return np.where(np.isnan(co2), 0, indices).astype(np.int8)
+
+
+def _iaq_co2_thresholds(*thresholds: tuple) -> np.ndarray:
+    """
+    Helper function to build the sorted threshold array of a standard for _iaq_co2_classify().
+
+    Parameters
+    ----------
+    *thresholds : tuple of (threshold, includingth)
+        threshold value in ppm, and whether or not the threshold value is included in the better category
+        ("<=" if True, "<" if False), depends on standard.
+
+    Returns
+    -------
+    thresholds : np.ndarray
+        float64 array of thresholds. Thresholds not included in the better category are shifted to the next
+        smaller float, so that "number of thresholds below the measurement" is correct in both cases.
+    """
+    return np.array(
+        [th if includingth else np.nextafter(th, -np.inf) for th, includingth in thresholds],
+        dtype=np.float64,
+    )
+
+
+# standard: (evaluation based on CO2 difference indoors/outdoors, thresholds), see Notes in iaq_co2()
+_IAQ_CO2_THRESHOLDS = {
+    "EN": (True, _iaq_co2_thresholds((550, True), (800, True), (1350, True))),
+    "LEHB": (False, _iaq_co2_thresholds((1000, True))),
+    "SS": (True, _iaq_co2_thresholds((700, True))),
+    "HK": (False, _iaq_co2_thresholds((800, True), (1000, True))),
+    "UBA": (False, _iaq_co2_thresholds((1000, False), (2000, True))),
+    "DOSH": (False, _iaq_co2_thresholds((1000, True))),
+}
+
+# standard: averaging time, used by iaq_co2_rolling() and RollingIAQ if no window is given
+_IAQ_CO2_AVERAGING_TIME = {
+    "EN": "1h",
+    "HK": "8h",
+}
@@ -1,98 +1,284 @@
-from thermal_comfort import clo_prediction
-from get_weather import th_outdoor_avg_today
-from pythermalcomfort.models import pmv_ppd
-
-"""
-Total clothing insulation of typical ensembles.
-Based on ASHRAE55:2017 - Table 5.2.2.2 A/B.
-All clothing ensembles, except where otherwise indicated in parentheses, include shoes, socks,
-and briefs or panties. All skirt/dress clothing ensembles include pantyhose and no additional socks.
-"""
-# Type A
-clo_indoor_typical_ensembles_typeA = {
-    "Walking shorts, short-sleeve shirt": 0.36,
-    "Trousers, short-sleeve shirt, socks, shoes, underwear": 0.57,
-    "Trousers, long-sleeve shirt": 0.61,
-    "Sweat pants, long-sleeve sweatshirt": 0.74,
-    "Sweat pants, long-sleeve sweatshirt, boots": 0.82,
-    "Trousers, long-sleeve shirt plus suit jacket": 0.96,
-    "Trousers, long-sleeve shirt plus long-sleeve sweater, t-shirt": 1.01,
-    "Trousers, long-sleeve shirt plus suit jacket, vest, t-shirt": 1.14,
-}
-
-# Type B
-clo_indoor_typical_ensembles_typeB = {
-    "Walking shorts, short-sleeve shirt": 0.36,
-    "Thin long-sleeve shirtdress": 0.41,
-    "Knee-length skirt, short-sleeve shirt, sandals": 0.54,
-    "Knee-length skirt, long-sleeve shirt, full slip": 0.67,
-    "Sweat pants, long-sleeve sweatshirt": 0.74,
-    "Sweat pants, long-sleeve sweatshirt, boots": 0.82,
-    "Knee-length skirt, long-sleeve shirt, half slip, suit jacket": 1.04,
-    "Knee-length skirt, long-sleeve shirt, half slip, long-sleeve sweater": 1.10,
-}
-
-"""
-Typical thermal insulation values for individual outdoor garments.
-Based on ISO 9920:2007 - Table B.1/B.2
-"""
-clo_outdoor_typical = {
-    "No additional jacket needed": 0,
-    "Vest": 0.17,
-    "Light jacket": 0.249,
-    "Jacket": 0.349,
-    "Heavy jacket": 0.399,
-    "Down jacket": 0.549,
-    "Parka": 0.699,
-    "Heavy Parka": 0.799,
-    "Heavy Parka, thick socks and gloves": 1.0,
-}
-
-
-def clothing_suggestion(type="A") -> list:
-    # predict clothing indoors based on outdoor temperature at 6 a.m.
-    clo_indoor_predicted = clo_prediction()
-    print("clo_indoor_predicted: ", clo_indoor_predicted)
-    # find the closest insulation value of typical ensembles
-    if type == "A":
-        closest_ensembles_indoor, closest_clo_indoor = min(
-            clo_indoor_typical_ensembles_typeA.items(),
-            key=lambda x: abs(clo_indoor_predicted - x[1]),
-        )
-    else:
-        closest_ensembles_indoor, closest_clo_indoor = min(
-            clo_indoor_typical_ensembles_typeB.items(),
-            key=lambda x: abs(clo_indoor_predicted - x[1]),
-        )
-    print("closest_ensembles_indoor: ", closest_ensembles_indoor)
-    print("closest_clo_indoor: ", closest_clo_indoor)
-
-    # For reference only, may not be accurate since Fanger's PMV/PPD model is primarily designed for indoor thermal environments.
-    # Get today's average air temperature outdoors
-    tout_avg_today, hout_avg_today = th_outdoor_avg_today()
-    print(f"tout_avg_today: {tout_avg_today} °C")
-    print(f"hout_avg_today: {hout_avg_today} %")
-    # met for slow walking (2 km/h)
-    met = 1.9
-    # calculate PMV outdoors with suggested clothing ensembles indoors
-    pmv_outdoor = pmv_ppd(tdb=tout_avg_today, tr=tout_avg_today, vr=0, rh=hout_avg_today, met=met, clo=closest_clo_indoor, limit_inputs=False)
-    print(pmv_outdoor)
-
-    # calculate extra clo needed in winter to reach PMV >= -0.2 (category I in EN 16798-1)
-    clo_extra = 0
-    while pmv_outdoor["pmv"] < -0.2:
-        clo_extra += 0.05
-        clo = closest_clo_indoor + clo_extra
-        # assume radiant temperature is equal to air temperature. The influence of sunlight is not taken into account.
-        pmv_outdoor = pmv_ppd(tdb=tout_avg_today, tr=tout_avg_today, vr=0, rh=hout_avg_today, met=met,
-                              clo=clo, limit_inputs=False)
-
-    print("Extra clothing required for outdoor activities: ", clo_extra)
-    closest_garment_outdoor, closest_clo_outdoor = min(
-        clo_outdoor_typical.items(),
-        key=lambda x: abs(clo_extra - x[1]),
-    )
-    print("closest_garment_outdoor: ", closest_garment_outdoor)
-    print("closest_clo_outdoor: ", closest_clo_outdoor)
-
-    return [closest_ensembles_indoor, closest_garment_outdoor, tout_avg_today, hout_avg_today]
+from thermal_comfort import clo_prediction, models
+from get_weather import th_outdoor_avg_today
+import get_weather
+import numpy as np
+import logging
+import threading
+
+logger = logging.getLogger(__name__)
+
+"""
+Total clothing insulation of typical ensembles.
+Based on ASHRAE55:2017 - Table 5.2.2.2 A/B.
+All clothing ensembles, except where otherwise indicated in parentheses, include shoes, socks,
+and briefs or panties. All skirt/dress clothing ensembles include pantyhose and no additional socks.
+"""
+# Type A
+clo_indoor_typical_ensembles_typeA = {
+    "Walking shorts, short-sleeve shirt": 0.36,
+    "Trousers, short-sleeve shirt, socks, shoes, underwear": 0.57,
+    "Trousers, long-sleeve shirt": 0.61,
+    "Sweat pants, long-sleeve sweatshirt": 0.74,
+    "Sweat pants, long-sleeve sweatshirt, boots": 0.82,
+    "Trousers, long-sleeve shirt plus suit jacket": 0.96,
+    "Trousers, long-sleeve shirt plus long-sleeve sweater, t-shirt": 1.01,
+    "Trousers, long-sleeve shirt plus suit jacket, vest, t-shirt": 1.14,
+}
+
+# Type B
+clo_indoor_typical_ensembles_typeB = {
+    "Walking shorts, short-sleeve shirt": 0.36,
+    "Thin long-sleeve shirtdress": 0.41,
+    "Knee-length skirt, short-sleeve shirt, sandals": 0.54,
+    "Knee-length skirt, long-sleeve shirt, full slip": 0.67,
+    "Sweat pants, long-sleeve sweatshirt": 0.74,
+    "Sweat pants, long-sleeve sweatshirt, boots": 0.82,
+    "Knee-length skirt, long-sleeve shirt, half slip, suit jacket": 1.04,
+    "Knee-length skirt, long-sleeve shirt, half slip, long-sleeve sweater": 1.10,
+}
+
+"""
+Typical thermal insulation values for individual outdoor garments.
+Based on ISO 9920:2007 - Table B.1/B.2
+"""
+clo_outdoor_typical = {
+    "No additional jacket needed": 0,
+    "Vest": 0.17,
+    "Light jacket": 0.249,
+    "Jacket": 0.349,
+    "Heavy jacket": 0.399,
+    "Down jacket": 0.549,
+    "Parka": 0.699,
+    "Heavy Parka": 0.799,
+    "Heavy Parka, thick socks and gloves": 1.0,
+}
+
+
+# met for slow walking (2 km/h)
+met_walking = 1.9
+# PMV outdoors reached with extra clothing (category I in EN 16798-1)
+pmv_outdoor_min = -0.2
+
+# last clothing plan of each weather dataset and the weather data and settings it was computed for, see clothing_plan()
+_plans = {}
+_plan_lock = threading.Lock()
+
+
+def clo_extra_required(tdb, rh, clo_indoor, met=met_walking, pmv_target=pmv_outdoor_min, clo_max=3.0, tol=0.005,
+                       max_iter=30) -> np.ndarray:
+    """
+    Extra clothing insulation needed outdoors to reach PMV >= pmv_target, for one or many scenarios at once
+    (e.g. every hour of a forecast). Solved by bisection on the extra clo, the PMV model is evaluated once per
+    iteration for all scenarios not solved yet, about log2(clo_max / tol) iterations.
+
+    Parameters
+    ----------
+    tdb: float, int or array-like
+        outdoor air temperature in [°C], radiant temperature is assumed to be equal (no sunlight)
+    rh: float, int or array-like
+        outdoor relative humidity in [%]
+    clo_indoor: float, int or array-like
+        clothing insulation worn indoors in [clo]
+    met: float, int or array-like, optional
+        metabolic rate in [met]. Defaults to slow walking (1.9 met)
+    pmv_target: float, optional
+        PMV to reach outdoors. Defaults to -0.2 (category I in EN 16798-1)
+    clo_max: float, optional
+        upper limit of extra clothing in [clo], returned if the target can't be reached
+    tol: float, optional
+        tolerance of the extra clothing in [clo]
+    max_iter: int, optional
+        maximum number of bisection iterations
+
+    Returns
+    -------
+    clo_extra: np.ndarray
+        extra clothing insulation in [clo] for each scenario (0 if no extra clothing is needed),
+        within tol above the minimum. NaN for missing weather data.
+
+    Examples
+    --------
+    >>> from clothing_suggestion import clo_extra_required
+    >>> clo_extra_required(tdb=[-5, 5, 15], rh=[80, 70, 60], clo_indoor=0.61)
+    """
+    tdb, rh, clo_indoor, met = np.broadcast_arrays(
+        *(np.asarray(x, dtype=np.float64) for x in (tdb, rh, clo_indoor, met))
+    )
+    shape = tdb.shape
+    tdb, rh, clo_indoor, met = (x.ravel() for x in (tdb, rh, clo_indoor, met))
+
+    def pmv(index, clo_extra):
+        # assume radiant temperature is equal to air temperature. The influence of sunlight is not taken into account.
+        return models.pmv_ppd(tdb=tdb[index], tr=tdb[index], vr=0, rh=rh[index], met=met[index],
+                              clo=clo_indoor[index] + clo_extra, limit_inputs=False)["pmv"]
+
+    all_index = np.arange(tdb.size)
+    pmv_indoor_clothing = pmv(all_index, 0.0)
+    missing = np.isnan(pmv_indoor_clothing)
+    cold = all_index[~missing & (pmv_indoor_clothing < pmv_target)]
+
+    # bracket [lo, hi]: PMV < target with lo, PMV >= target with hi
+    lo = np.zeros(cold.size)
+    hi = np.full(cold.size, float(clo_max))
+    unreachable = pmv(cold, hi) < pmv_target
+    if unreachable.any():
+        logger.info(f"PMV {pmv_target} not reached with {clo_max} clo extra in {unreachable.sum()} scenarios")
+    active = ~unreachable
+    for _ in range(max_iter):
+        active &= hi - lo > tol
+        if not active.any():
+            break
+        mid = (lo[active] + hi[active]) / 2
+        warm_enough = pmv(cold[active], mid) >= pmv_target
+        hi[active] = np.where(warm_enough, mid, hi[active])
+        lo[active] = np.where(warm_enough, lo[active], mid)
+
+    clo_extra = np.where(missing, np.nan, 0.0)
+    clo_extra[cold] = hi
+    return clo_extra.reshape(shape)
+
+
+def clothing_suggestion(type="A", clo=None, weather=None) -> list:
+    # predict clothing indoors based on outdoor temperature at 6 a.m.
+    # clo / weather: clothing indoors and get_weather.WeatherDataset of another location (see locations.py)
+    clo_indoor_predicted = clo_prediction() if clo is None else clo
+    print("clo_indoor_predicted: ", clo_indoor_predicted)
+    # find the closest insulation value of typical ensembles
+    if type == "A":
+        closest_ensembles_indoor, closest_clo_indoor = min(
+            clo_indoor_typical_ensembles_typeA.items(),
+            key=lambda x: abs(clo_indoor_predicted - x[1]),
+        )
+    else:
+        closest_ensembles_indoor, closest_clo_indoor = min(
+            clo_indoor_typical_ensembles_typeB.items(),
+            key=lambda x: abs(clo_indoor_predicted - x[1]),
+        )
+    print("closest_ensembles_indoor: ", closest_ensembles_indoor)
+    print("closest_clo_indoor: ", closest_clo_indoor)
+
+    # For reference only, may not be accurate since Fanger's PMV/PPD model is primarily designed for indoor thermal environments.
+    # Get today's average air temperature outdoors
+    tout_avg_today, hout_avg_today = th_outdoor_avg_today() if weather is None else weather.th_outdoor_avg_today()
+    print(f"tout_avg_today: {tout_avg_today} °C")
+    print(f"hout_avg_today: {hout_avg_today} %")
+    # calculate extra clo needed in winter to reach PMV >= -0.2 (category I in EN 16798-1)
+    clo_extra = float(clo_extra_required(tdb=tout_avg_today, rh=hout_avg_today, clo_indoor=closest_clo_indoor))
+
+    print("Extra clothing required for outdoor activities: ", clo_extra)
+    closest_garment_outdoor, closest_clo_outdoor = min(
+        clo_outdoor_typical.items(),
+        key=lambda x: abs(clo_extra - x[1]),
+    )
+    print("closest_garment_outdoor: ", closest_garment_outdoor)
+    print("closest_clo_outdoor: ", closest_clo_outdoor)
+
+    return [closest_ensembles_indoor, closest_garment_outdoor, tout_avg_today, hout_avg_today]
+
+
+def clothing_plan(type="A", days: int = None, resolution: int = 60, weather=None) -> dict:
+    """
+    Clothing plan for today and the forecast days, e.g. different outfits for the morning and evening commute.
+    All time steps are evaluated at once: one PMV solve (clo_extra_required()) and one lookup in the ensemble tables.
+    The plan is cached until the weather data is fetched again, so it's computed once per forecast.
+
+    Parameters
+    ----------
+    type: str, optional
+        clothing ensembles indoors, "A" or "B" (see ASHRAE 55)
+    days: int, optional
+        number of days including today, all forecast days if None
+    resolution: int, optional
+        time step in minutes, values between the hours of the forecast are interpolated
+    weather: get_weather.WeatherDataset, optional
+        weather data, the shared dataset get_weather.weather if None
+
+    Returns
+    -------
+    plan: dict
+        numpy arrays with one value per time step:
+        time (local, datetime64[m]), tout [°C], hout [%], clo_indoor (predicted per day from 6 a.m.) [clo],
+        ensemble_indoor, clo_extra (extra clothing outdoors, slow walking) [clo], garment_outdoor
+
+    Examples
+    --------
+    >>> from clothing_suggestion import clothing_plan
+    >>> plan = clothing_plan(days=2)
+    >>> plan["garment_outdoor"][plan["time"] == np.datetime64("2025-01-15T08:00")]
+    """
+    weather = get_weather.weather if weather is None else weather
+    forecast = weather.hourly_forecast()
+    key = (weather.fetched_at, type, days, resolution)
+    with _plan_lock:
+        plan_key, plan = _plans.get(id(weather), (None, None))
+        if key == plan_key:
+            return plan
+
+    hours = forecast["time"]
+    if days is not None:
+        hours = hours[: days * 24]
+    n_days = len(hours) // 24
+    temperature = forecast["temperature"][: n_days * 24]
+    humidity = forecast["humidity"][: n_days * 24]
+
+    # time steps, forecast interpolated between the hours
+    steps = np.arange(0, n_days * 24 * 60, resolution)
+    hour_offsets = steps / 60
+    tout = np.interp(hour_offsets, np.arange(n_days * 24), temperature)
+    hout = np.interp(hour_offsets, np.arange(n_days * 24), humidity)
+
+    # clothing indoors predicted per day based on the outdoor temperature at 6 a.m., like clo_prediction()
+    tout_6am = temperature[6::24]
+    clo_days = np.where(np.isnan(tout_6am), np.nan, models.clo_tout(tout_6am))
+    day_index = (steps // (24 * 60)).astype(np.int64)
+    ensembles = clo_indoor_typical_ensembles_typeA if type == "A" else clo_indoor_typical_ensembles_typeB
+    ensemble_days, clo_ensemble_days = _closest(ensembles, clo_days)
+
+    # extra clothing outdoors for every time step at once
+    clo_extra = clo_extra_required(tdb=tout, rh=hout, clo_indoor=clo_ensemble_days[day_index])
+    garment_outdoor, _ = _closest(clo_outdoor_typical, clo_extra)
+
+    plan = {
+        "time": hours[0].astype("datetime64[m]") + steps.astype("timedelta64[m]"),
+        "tout": tout,
+        "hout": hout,
+        "clo_indoor": clo_days[day_index],
+        "ensemble_indoor": ensemble_days[day_index],
+        "clo_extra": clo_extra,
+        "garment_outdoor": garment_outdoor,
+    }
+    with _plan_lock:
+        _plans[id(weather)] = (key, plan)
+    return plan
+
+
+def clothing_plan_text(plan: dict, hours: list = (8, 18), days: int = 1) -> str:
+    """
+    Outdoor clothing of the plan at the given hours (e.g. commute times), one line per day, for the glasses.
+    """
+    first_day = plan["time"][0].astype("datetime64[D]")
+    lines = []
+    for day in range(days):
+        labels = []
+        for hour in hours:
+            index = np.flatnonzero(plan["time"] == first_day + np.timedelta64(day * 24 + hour, "h"))
+            if index.size:
+                i = index[0]
+                labels.append(f"{hour:02d}:00 {plan['tout'][i]:.0f} °C {plan['garment_outdoor'][i]}")
+        if labels:
+            name = ("Today", "Tomorrow")[day] if day < 2 else str((first_day + day).item().strftime("%A"))
+            lines.append(f"{name}: " + " | ".join(labels))
+    return "\n".join(lines)
+
+
+def _closest(typical: dict, clo) -> tuple:
+    """
+    Closest typical clothing to each clo value, returns names and their clo values as numpy arrays.
+    Missing clo values (NaN, e.g. gaps in the forecast) give "unknown" and NaN.
+    """
+    names = np.array(list(typical))
+    values = np.array(list(typical.values()))
+    clo = np.asarray(clo, dtype=np.float64)
+    missing = np.isnan(clo)
+    index = np.abs(np.where(missing, 0.0, clo)[..., np.newaxis] - values).argmin(axis=-1)
+    return np.where(missing, "unknown", names[index]), np.where(missing, np.nan, values[index])
@@ -0,0 +1,165 @@
+"""
+Worker pool for the CPU-heavy comfort models, so evaluating a reading never blocks the event loop
+that reads the sensors and talks to the glasses.
+- "thread": models run in worker threads of this process, cheap to start and sharing the weather cache,
+  enough for a few readings per second
+- "process": models run in worker processes, one per core, for many devices or batch re-scoring of recorded data.
+  Each worker imports the models and loads them from numba's disk cache once (see comfort_warmup.py).
+  Functions and arguments are pickled, so only module-level functions like thermal_comfort_pmvppd() can be submitted.
+Batch jobs (e.g. re-scoring a year of sensor logs) are split into chunks and spread over all workers.
+
+Example:
+    executor = ComfortExecutor(kind="process")
+    results = await executor.run(thermal_comfort_pmvppd, tdb=22.0, rh=50.0)
+    results = executor.pmvppd_batch(tdb=log["BME280_Temperature"], rh=log["BME280_Humidity"], time=log["time"])
+    executor.shutdown()
+"""
+
+import asyncio
+import functools
+import logging
+import multiprocessing
+import os
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+import numpy as np
+
+import comfort_warmup
+from thermal_comfort import clo_prediction, clo_prediction_days, thermal_comfort_pmvppd_batch
+
+logger = logging.getLogger(__name__)
+
+executor_kinds = ("thread", "process")
+
+
+def _init_worker():
+    # imported and compiled once per worker process, not with its first job
+    logging.basicConfig(level=logging.INFO)
+    comfort_warmup.warm_up()
+
+
+class ComfortExecutor:
+    def __init__(self, kind: str = "thread", max_workers: int = None, warm_up: bool = True):
+        """
+        Example:
+        executor = ComfortExecutor(kind="process", max_workers=4)
+
+        kind: "thread" or "process" pool, see executor_kinds.
+        max_workers: number of workers, number of cores if None.
+        warm_up: compile the comfort models in each worker process when it starts (only for "process").
+        """
+        if kind not in executor_kinds:
+            raise ValueError(f"Executor kind unknown: {kind}, expected one of {executor_kinds}")
+        self.kind = kind
+        self.max_workers = max_workers or os.cpu_count() or 1
+
+        if kind == "process":
+            # spawn: workers don't inherit the event loop, serial ports or BLE connections of this process
+            self.pool = ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_init_worker if warm_up else None,
+            )
+        else:
+            self.pool = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="comfort")
+
+        # counters
+        self.submitted = 0
+        self.completed = 0
+        self.failed = 0
+        self.busy_time = 0.0
+        self._lock = threading.Lock()
+
+    async def run(self, func, *args, **kwargs):
+        """
+        Run func(*args, **kwargs) in a worker and wait for the result without blocking the event loop.
+        """
+        loop = asyncio.get_running_loop()
+        start = time.perf_counter()
+        self._count("submitted")
+        try:
+            result = await loop.run_in_executor(self.pool, functools.partial(func, *args, **kwargs))
+        except Exception:
+            self._count("failed")
+            raise
+        self._count("completed", time.perf_counter() - start)
+        return result
+
+    def map(self, func, *iterables) -> list:
+        """
+        Run func on each item of the iterables (like map()) spread over all workers, results in order.
+        """
+        start = time.perf_counter()
+        futures = [self.pool.submit(func, *args) for args in zip(*iterables)]
+        self._count("submitted", count=len(futures))
+        results = []
+        for future in futures:
+            try:
+                results.append(future.result())
+            except Exception:
+                self._count("failed")
+                raise
+            self._count("completed", time.perf_counter() - start)
+        return results
+
+    def pmvppd_batch(self, tdb, rh, tr=None, v=0, met=1.2, time=None, clo=None, chunk_rows: int = 50_000) -> dict:
+        """
+        thermal_comfort_pmvppd_batch() split into chunks of chunk_rows readings, evaluated by all workers.
+        The clothing is predicted once here (one weather request per day), not in every worker.
+
+        Returns
+        -------
+        Returns PMV (-3 ~ +3), PPD (%) and predicted clothing (clo) as numpy arrays in a dict
+        """
+        tdb = np.asarray(tdb, dtype=np.float64)
+        if clo is None:
+            clo = clo_prediction() if time is None else clo_prediction_days(time)
+        tr = tdb if tr is None else tr
+        # same length for all inputs, so each chunk gets its part
+        rh, tr, v, met, clo = (
+            np.broadcast_to(np.asarray(x, dtype=np.float64), tdb.shape) for x in (rh, tr, v, met, clo)
+        )
+
+        columns = (tdb, rh, tr, v, met, clo)
+        starts = range(0, len(tdb), max(chunk_rows, 1))
+        chunks = self.map(_pmvppd_chunk, *([x[start:start + chunk_rows] for start in starts] for x in columns))
+        if not chunks:
+            return {"pmv": np.empty(0), "ppd": np.empty(0), "clo": np.empty(0)}
+        return {key: np.concatenate([chunk[key] for chunk in chunks]) for key in chunks[0]}
+
+    def stats(self) -> dict:
+        """
+        Number of jobs submitted / completed / failed and the mean time per job in ms (waiting and running).
+        """
+        return {
+            "kind": self.kind,
+            "workers": self.max_workers,
+            "submitted": self.submitted,
+            "completed": self.completed,
+            "failed": self.failed,
+            "job_mean_ms": self.busy_time / max(self.completed, 1) * 1000,
+        }
+
+    def shutdown(self, wait: bool = True):
+        """
+        Stop the workers, waiting for running jobs if wait.
+        """
+        self.pool.shutdown(wait=wait, cancel_futures=True)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.shutdown()
+
+    def _count(self, counter: str, busy: float = 0.0, count: int = 1):
+        with self._lock:
+            setattr(self, counter, getattr(self, counter) + count)
+            self.busy_time += busy
+
+
+def _pmvppd_chunk(tdb, rh, tr, v, met, clo) -> dict:
+    # module-level, so it can be pickled for worker processes
+    return thermal_comfort_pmvppd_batch(tdb=tdb, rh=rh, tr=tr, v=v, met=met, clo=clo)
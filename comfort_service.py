@@ -0,0 +1,377 @@
+"""
+Local comfort service: one long-running process serving PMV/PPD, adaptive comfort, IAQ and clothing suggestions
+over HTTP/JSON to other tools (dashboards, room booking, the glasses bridge), so the models are imported and compiled
+and the weather data is fetched once for all of them.
+Concurrent requests are collected for a few milliseconds (batch_window) and evaluated with one vectorized
+model call (MicroBatcher). All requests share the weather data and the running mean outdoor temperature
+of this process (get_weather.weather, thermal_comfort).
+
+Endpoints, GET with query parameters or POST with a JSON object (or a list of objects, answered with a list):
+    /pmv?tdb=22.5&rh=45                 optional: tr, v, met, clo (predicted if not given)
+    /adaptive?tdb=22.5                  optional: tr, v
+    /iaq?co2=850                        optional: co2_outdoor, standard (see air_quality.iaq_co2())
+    /clothing                           optional: type ("A" or "B")
+    /clothing/plan                      optional: type, days, resolution (see clothing_suggestion.clothing_plan())
+    /stats                              batches and shared weather data
+Invalid requests are answered with status 400 and {"error": true, "reason": "..."}, like the Open-Meteo API.
+
+Example:
+    with ComfortService(port=8765) as service:
+        urllib.request.urlopen(f"{service.url}/pmv?tdb=22.5&rh=45")
+    # or run it on its own: python comfort_service.py 8765
+    # without internet access, e.g. tests: EVENCOMFORT_WEATHER_REPLAY=./weather python comfort_service.py
+"""
+
+import json
+import logging
+import math
+import queue
+import sys
+import threading
+import time
+from concurrent.futures import Future
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+import numpy as np
+
+import comfort_warmup
+import get_weather
+import thermal_comfort
+from air_quality import iaq_co2
+from clothing_suggestion import clothing_suggestion, clothing_plan
+from thermal_comfort import clo_prediction, thermal_comfort_pmvppd_batch, thermal_comfort_adaptive_batch
+
+logger = logging.getLogger(__name__)
+
+service_host = "127.0.0.1"
+service_port = 8765
+
+# request parameters: name: default (None: required, NaN: calculated if not given)
+pmv_params = {"tdb": None, "rh": None, "tr": math.nan, "v": 0.0, "met": 1.2, "clo": math.nan}
+adaptive_params = {"tdb": None, "tr": math.nan, "v": 0.0}
+iaq_params = {"co2": None, "co2_outdoor": 400.0}
+
+
+class MicroBatcher:
+    def __init__(self, func, window: float = 0.005, max_batch: int = 1024, name: str = "batch"):
+        """
+        Example:
+        batcher = MicroBatcher(lambda requests: [r * 2 for r in requests], window=0.005)
+        future = batcher.submit(21)
+        future.result()
+
+        Collects requests submitted by several threads and evaluates them together in one worker thread.
+        func: function(list of requests) -> list of results in the same order.
+        window: time in seconds to wait for more requests after the first one of a batch.
+        max_batch: maximum number of requests of a batch.
+        """
+        self.func = func
+        self.window = window
+        self.max_batch = max_batch
+
+        # counters
+        self.requests = 0
+        self.batches = 0
+        self.largest_batch = 0
+        self.busy_time = 0.0
+
+        self._queue = queue.SimpleQueue()
+        self._thread = threading.Thread(target=self._run, name=name, daemon=True)
+        self._thread.start()
+
+    def submit(self, request) -> Future:
+        """
+        Add a request to the next batch, returns a future of its result.
+        """
+        future = Future()
+        self._queue.put((request, future))
+        return future
+
+    def close(self):
+        """
+        Evaluate the requests already submitted and stop the worker thread.
+        """
+        self._queue.put(None)
+        self._thread.join()
+
+    def stats(self) -> dict:
+        """
+        Number of requests / batches, largest and mean batch size and mean time per batch in ms.
+        """
+        batches = max(self.batches, 1)
+        return {
+            "requests": self.requests,
+            "batches": self.batches,
+            "largest_batch": self.largest_batch,
+            "mean_batch": self.requests / batches,
+            "batch_mean_ms": self.busy_time / batches * 1000,
+        }
+
+    def _run(self):
+        while True:
+            item = self._queue.get()
+            if item is None:
+                return
+            batch = [item]
+            deadline = time.monotonic() + self.window
+            closed = False
+            while len(batch) < self.max_batch:
+                try:
+                    item = self._queue.get(timeout=max(deadline - time.monotonic(), 0))
+                except queue.Empty:
+                    break
+                if item is None:
+                    closed = True
+                    break
+                batch.append(item)
+            self._evaluate(batch)
+            if closed:
+                return
+
+    def _evaluate(self, batch: list):
+        start = time.perf_counter()
+        try:
+            results = self.func([request for request, _ in batch])
+        except Exception as e:
+            logger.error(f"Batch of {len(batch)} requests failed: {e}")
+            for _, future in batch:
+                future.set_exception(e)
+            return
+        finally:
+            self.requests += len(batch)
+            self.batches += 1
+            self.largest_batch = max(self.largest_batch, len(batch))
+            self.busy_time += time.perf_counter() - start
+        for (_, future), result in zip(batch, results):
+            future.set_result(result)
+
+
+class ComfortService:
+    def __init__(self, host: str = service_host, port: int = service_port, batch_window: float = 0.005,
+                 max_batch: int = 1024, warm_up: bool = True):
+        """
+        Example:
+        service = ComfortService(port=0)  # any free port
+        print(service.url)
+        service.close()
+
+        batch_window: time in seconds concurrent requests are collected for one model call.
+        max_batch: maximum number of requests of one model call.
+        warm_up: compile the comfort models in the background when the service starts.
+        """
+        # the weather data and running mean are shared by all requests, updated by one model call at a time
+        self._model_lock = threading.Lock()
+        self.batchers = {
+            "pmv": MicroBatcher(self._pmv_batch, batch_window, max_batch, name="pmv-batch"),
+            "adaptive": MicroBatcher(self._adaptive_batch, batch_window, max_batch, name="adaptive-batch"),
+            "iaq": MicroBatcher(self._iaq_batch, batch_window, max_batch, name="iaq-batch"),
+        }
+        if warm_up:
+            comfort_warmup.start_warm_up()
+
+        service = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                request = urlsplit(self.path)
+                params = {name: values[-1] for name, values in parse_qs(request.query).items()}
+                self._answer(request.path, params)
+
+            def do_POST(self):
+                request = urlsplit(self.path)
+                try:
+                    body = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+                    params = json.loads(body or b"{}")
+                except ValueError as e:
+                    self._send(400, {"error": True, "reason": f"Invalid JSON: {e}"})
+                    return
+                self._answer(request.path, params)
+
+            def _answer(self, path: str, params):
+                try:
+                    result = service.handle(path, params)
+                except (ValueError, KeyError, TypeError) as e:
+                    self._send(400, {"error": True, "reason": str(e)})
+                    return
+                except Exception as e:
+                    logger.error(f"{path} failed: {e}")
+                    self._send(500, {"error": True, "reason": str(e)})
+                    return
+                self._send(200, result)
+
+            def _send(self, status: int, result):
+                body = json.dumps(_json_value(result)).encode()
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                logger.debug(format % args)
+
+        self.server = ThreadingHTTPServer((host, port), Handler)
+        self.url = f"http://{host}:{self.server.server_address[1]}"
+        self._thread = threading.Thread(target=self.server.serve_forever, name="comfort-service", daemon=True)
+        self._thread.start()
+        logger.info(f"Comfort service listening on {self.url}")
+
+    def handle(self, path: str, params):
+        """
+        Answer a request (path and parameters, or a list of parameters), raises ValueError for invalid requests.
+        """
+        batcher = self.batchers.get(path.strip("/"))
+        if isinstance(params, list):
+            if batcher is None:
+                raise ValueError(f"Lists of requests are only supported for {list(self.batchers)}")
+            futures = [batcher.submit(self._parse(path, p)) for p in params]
+            return [future.result() for future in futures]
+
+        if batcher is not None:
+            return batcher.submit(self._parse(path, params)).result()
+        if path == "/clothing":
+            self._refresh_weather()
+            with self._model_lock:
+                indoor, outdoor, tout_avg, hout_avg = clothing_suggestion(type=params.get("type", "A"))
+            return {"indoor": indoor, "outdoor": outdoor, "tout_avg_today": tout_avg, "hout_avg_today": hout_avg}
+        if path == "/clothing/plan":
+            days = params.get("days")
+            self._refresh_weather()
+            with self._model_lock:
+                return clothing_plan(
+                    type=params.get("type", "A"),
+                    days=None if days is None else int(days),
+                    resolution=int(params.get("resolution", 60)),
+                )
+        if path == "/stats":
+            return self.stats()
+        raise ValueError(f"Unknown endpoint: {path}")
+
+    def stats(self) -> dict:
+        """
+        Batches of each endpoint, age of the weather data in seconds and today's running mean outdoor temperature.
+        """
+        weather = get_weather.weather
+        return {
+            **{name: batcher.stats() for name, batcher in self.batchers.items()},
+            "weather_age": None if weather.fetched_at is None else time.monotonic() - weather.fetched_at,
+            "t_rm": thermal_comfort.t_runningmean,
+        }
+
+    def close(self):
+        self.server.shutdown()
+        self.server.server_close()
+        for batcher in self.batchers.values():
+            batcher.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def _refresh_weather(self):
+        # the clothing needs today's weather data: a weather request blocks for a while, so it's fetched
+        # before taking _model_lock, batches of /pmv and /adaptive don't wait for it
+        try:
+            get_weather.weather.refresh()
+        except Exception as e:
+            # the models retry (and report) it
+            logger.warning(f"Refreshing weather data failed: {e}")
+
+    def _parse(self, path: str, params: dict) -> dict:
+        if not isinstance(params, dict):
+            raise ValueError("Request parameters must be a JSON object")
+        if path == "/iaq":
+            request = _floats(params, iaq_params)
+            request["standard"] = params.get("standard", "EN")
+            # unknown standards are rejected before they fail a whole batch
+            iaq_co2(400, standard=request["standard"])
+            return request
+        return _floats(params, pmv_params if path == "/pmv" else adaptive_params)
+
+    def _pmv_batch(self, requests: list) -> list:
+        columns = {name: np.array([request[name] for request in requests]) for name in pmv_params}
+        with self._model_lock:
+            # predicted clothing of today if not given
+            clo = columns["clo"]
+            if np.isnan(clo).any():
+                clo = np.where(np.isnan(clo), clo_prediction(), clo)
+            results = thermal_comfort_pmvppd_batch(
+                tdb=columns["tdb"],
+                rh=columns["rh"],
+                tr=np.where(np.isnan(columns["tr"]), columns["tdb"], columns["tr"]),
+                v=columns["v"],
+                met=columns["met"],
+                clo=clo,
+            )
+        return _split(results, len(requests))
+
+    def _adaptive_batch(self, requests: list) -> list:
+        columns = {name: np.array([request[name] for request in requests]) for name in adaptive_params}
+        with self._model_lock:
+            results = thermal_comfort_adaptive_batch(
+                tdb=columns["tdb"],
+                tr=np.where(np.isnan(columns["tr"]), columns["tdb"], columns["tr"]),
+                v=columns["v"],
+            )
+        return _split(results, len(requests))
+
+    def _iaq_batch(self, requests: list) -> list:
+        results = [None] * len(requests)
+        # one vectorized evaluation per standard
+        for standard in {request["standard"] for request in requests}:
+            index = [i for i, request in enumerate(requests) if request["standard"] == standard]
+            report = iaq_co2(
+                np.array([requests[i]["co2"] for i in index]),
+                np.array([requests[i]["co2_outdoor"] for i in index]),
+                standard=standard,
+            )
+            for i, iaq_index in zip(index, report["indices"]):
+                results[i] = {"index": int(iaq_index), "standard": standard}
+        return results
+
+
+def _floats(params: dict, names: dict) -> dict:
+    request = {}
+    for name, default in names.items():
+        value = params.get(name, default)
+        if value is None:
+            raise ValueError(f"Missing parameter: {name}")
+        request[name] = float(value)
+    return request
+
+
+def _split(results: dict, n: int) -> list:
+    # dict of arrays (or values shared by all requests) -> one dict per request
+    columns = {name: np.broadcast_to(value, (n,)) for name, value in results.items()}
+    return [{name: column[i].item() for name, column in columns.items()} for i in range(n)]
+
+
+def _json_value(value):
+    # numpy values and NaN (null) for JSON
+    if isinstance(value, dict):
+        return {name: _json_value(v) for name, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_json_value(v) for v in value]
+    if isinstance(value, np.ndarray):
+        if np.issubdtype(value.dtype, np.datetime64):
+            return [str(v) for v in value]
+        return _json_value(value.tolist())
+    if isinstance(value, np.generic):
+        value = value.item()
+    if isinstance(value, float) and math.isnan(value):
+        return None
+    return value
+
+
+if __name__ == "__main__":
+    # e.g. python comfort_service.py 8765
+    logging.basicConfig(level=logging.INFO)
+    port = int(sys.argv[1]) if len(sys.argv) > 1 else service_port
+    with ComfortService(port=port) as service:
+        try:
+            threading.Event().wait()
+        except KeyboardInterrupt:
+            logger.info(f"Comfort service stopped: {service.stats()}")
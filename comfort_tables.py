@@ -0,0 +1,291 @@
+"""
+Precomputed comfort lookup tables, for hosts without numba / pythermalcomfort (e.g. a Raspberry Pi Zero,
+or eventually the ESP32 next to the sensors, see microcontroller/).
+The comfort models are evaluated once on a regular grid of their inputs and saved as a compact binary table,
+evaluating a reading is then a multilinear interpolation of the 2^n grid points around it (numpy only).
+
+- pmv_table(): PMV over tdb / rh / clo / met like thermal_comfort_pmvppd() (tr = tdb, v = 0,
+  relative air speed and dynamic clothing applied as in thermal_comfort_pmvppd()), PPD is calculated from the PMV
+- adaptive_table(): comfort temperature and category limits of the adaptive model (EN 16798-1) over t_rm
+
+Measured max error against the full models at 200,000 random points inside the default grids
+(max_error(), logged by python comfort_tables.py):
+- PMV: 0.04 within -3 ~ +3 (float16 and float32 alike), PPD: 1.5 %. The error comes mostly from the met axis,
+  halving the met step halves it, finer tdb / rh / clo steps hardly change it.
+- adaptive comfort temperature and limits: 0.1 °C, the resolution of the model's output
+The default PMV grid (tdb 10-36 °C, rh 0-100 %, dynamic clo 0.2-1.5, met 0.8-2.0) has 24,500 points: 48 KiB as float16.
+Inputs outside the grid evaluate to NaN.
+
+Binary table format (little-endian), simple to read in C:
+    magic "ECLT", version (u8), value size in bytes (u8, 2: float16, 4: float32), number of axes (u8),
+    number of outputs (u8),
+    per axis: name (32 bytes, NUL padded), start (f64), step (f64), size (u32),
+    per output: name (32 bytes, NUL padded),
+    values: axis sizes x outputs in C order (last axis and outputs change fastest)
+
+Example:
+    table = pmv_table()
+    table.save("pmv.eclt")
+    table = ComfortTable.load("pmv.eclt")
+    results = table_pmvppd(table, tdb=22.0, rh=50.0, clo=0.61)
+"""
+
+import logging
+import struct
+
+import numpy as np
+
+from comfort_warmup import numba_disk_cache
+from lazy_import import lazy_import
+
+logger = logging.getLogger(__name__)
+
+# only needed to generate tables
+models = lazy_import("pythermalcomfort.models", context=numba_disk_cache)
+utilities = lazy_import("pythermalcomfort.utilities", context=numba_disk_cache)
+
+TABLE_MAGIC = b"ECLT"
+TABLE_VERSION = 1
+_HEADER = struct.Struct("<4sBBBB")
+_AXIS = struct.Struct("<32sddI")
+_NAME = struct.Struct("<32s")
+_DTYPES = {2: np.dtype("<f2"), 4: np.dtype("<f4")}
+
+# default grids: (start, stop, step), stop included
+pmv_grid = {"tdb": (10.0, 36.0, 2.0), "rh": (0.0, 100.0, 25.0), "clo_d": (0.2, 1.5, 0.1), "met": (0.8, 2.0, 0.05)}
+adaptive_grid = {"t_rm": (10.0, 33.5, 0.5)}
+
+
+class ComfortTable:
+    def __init__(self, axes: dict, outputs: list, values: np.ndarray):
+        """
+        Example:
+        table = ComfortTable({"t_rm": (10.0, 0.5, 48)}, ["tmp_cmf"], values)
+
+        axes: input name: (start, step, size) of the regular grid, in the order of the value dimensions.
+        outputs: names of the tabulated outputs, the last dimension of values.
+        values: array of shape (axis sizes..., number of outputs), float16 or float32.
+        """
+        self.axes = {name: (float(start), float(step), int(size)) for name, (start, step, size) in axes.items()}
+        self.outputs = list(outputs)
+        self.values = np.ascontiguousarray(values)
+        if self.values.shape != tuple(size for _, _, size in self.axes.values()) + (len(self.outputs),):
+            raise ValueError(f"Table values of shape {self.values.shape} don't match the axes and outputs")
+        # rows of the flat table between neighbouring grid points of each axis
+        self._strides = [stride // (self.values.itemsize * len(self.outputs)) for stride in self.values.strides[:-1]]
+        # float64 in memory, float16 values would be converted on every lookup
+        self._flat = self.values.reshape(-1, len(self.outputs)).astype(np.float64)
+
+    def __call__(self, **inputs) -> dict:
+        """
+        Interpolated outputs at the inputs (one keyword per axis, floats or arrays), NaN outside the grid.
+        """
+        arrays = np.broadcast_arrays(*(np.asarray(inputs[name], dtype=np.float64) for name in self.axes))
+        shape = arrays[0].shape
+        outside = np.zeros(arrays[0].size, dtype=bool)
+        # (row, weight) of the corners of the grid cell around each point, doubled with each axis
+        corners = [(np.zeros(arrays[0].size, dtype=np.int64), 1.0)]
+        for x, (start, step, size), stride in zip(arrays, self.axes.values(), self._strides):
+            position = (x.ravel() - start) / step
+            # small tolerance, so the last grid point itself is inside
+            outside |= ~((position >= -1e-9) & (position <= size - 1 + 1e-9))
+            position = np.clip(np.nan_to_num(position), 0, size - 1)
+            index = np.minimum(position.astype(np.int64), max(size - 2, 0))
+            fraction = position - index
+            corners = [
+                (row + (index + upper) * stride, weight * (fraction if upper else 1 - fraction))
+                for row, weight in corners
+                for upper in (0, 1)
+            ]
+
+        result = sum(weight[:, np.newaxis] * self._flat[row] for row, weight in corners)
+        result[outside] = np.nan
+        return {name: result[:, i].reshape(shape) for i, name in enumerate(self.outputs)}
+
+    def nbytes(self) -> int:
+        return self.values.nbytes
+
+    def save(self, file_name: str):
+        """
+        Save the table in the binary table format (see module docstring).
+        """
+        with open(file_name, "wb") as f:
+            f.write(_HEADER.pack(TABLE_MAGIC, TABLE_VERSION, self.values.itemsize, len(self.axes), len(self.outputs)))
+            for name, (start, step, size) in self.axes.items():
+                f.write(_AXIS.pack(name.encode("ascii"), start, step, size))
+            for name in self.outputs:
+                f.write(_NAME.pack(name.encode("ascii")))
+            f.write(self.values.astype(_DTYPES[self.values.itemsize], copy=False).tobytes())
+
+    @classmethod
+    def load(cls, file_name: str) -> "ComfortTable":
+        """
+        Load a table saved with save().
+        """
+        with open(file_name, "rb") as f:
+            data = f.read()
+        magic, version, itemsize, n_axes, n_outputs = _HEADER.unpack_from(data, 0)
+        if magic != TABLE_MAGIC or version != TABLE_VERSION or itemsize not in _DTYPES:
+            raise ValueError(f"{file_name} is not a comfort table of version {TABLE_VERSION}")
+        offset = _HEADER.size
+        axes = {}
+        for _ in range(n_axes):
+            name, start, step, size = _AXIS.unpack_from(data, offset)
+            axes[name.rstrip(b"\0").decode("ascii")] = (start, step, size)
+            offset += _AXIS.size
+        outputs = []
+        for _ in range(n_outputs):
+            outputs.append(_NAME.unpack_from(data, offset)[0].rstrip(b"\0").decode("ascii"))
+            offset += _NAME.size
+        shape = tuple(size for _, _, size in axes.values()) + (n_outputs,)
+        values = np.frombuffer(data, dtype=_DTYPES[itemsize], count=int(np.prod(shape)), offset=offset)
+        return cls(axes, outputs, values.reshape(shape))
+
+
+def _grid(grid: dict) -> dict:
+    axes = {}
+    for name, (start, stop, step) in grid.items():
+        axes[name] = (start, step, int(round((stop - start) / step)) + 1)
+    return axes
+
+
+def _points(axes: dict) -> list:
+    # rounded, so that grid points like met 1.2 are exact
+    return np.meshgrid(
+        *(np.round(start + step * np.arange(size), 6) for start, step, size in axes.values()), indexing="ij"
+    )
+
+
+def _pmv_model(tdb, rh, clo_d, met) -> dict:
+    # same inputs as thermal_comfort_pmvppd(): tr = tdb, v = 0, dynamic clothing
+    v_r = utilities.v_relative(v=np.zeros_like(met), met=met)
+    return models.pmv_ppd(tdb=tdb, tr=tdb, vr=v_r, rh=rh, met=met, clo=clo_d, limit_inputs=False)
+
+
+def clo_dynamic(clo, met):
+    """
+    Dynamic clothing insulation [clo] like pythermalcomfort.utilities.clo_dynamic() (ASHRAE 55),
+    reduced by body movement above 1.2 met.
+    """
+    clo = np.asarray(clo, dtype=np.float64)
+    met = np.asarray(met, dtype=np.float64)
+    return np.where(met > 1.2, np.around(clo * (0.6 + 0.4 / met), 3), clo)
+
+
+def _adaptive_model(t_rm) -> dict:
+    results = models.adaptive_en(np.full_like(t_rm, 20.0), np.full_like(t_rm, 20.0), t_rm, 0, limit_inputs=False)
+    return {name: results[name] for name in adaptive_outputs}
+
+
+adaptive_outputs = ["tmp_cmf", "tmp_cmf_cat_i_low", "tmp_cmf_cat_i_up", "tmp_cmf_cat_ii_low", "tmp_cmf_cat_ii_up",
+                    "tmp_cmf_cat_iii_low", "tmp_cmf_cat_iii_up"]
+
+
+def pmv_table(grid: dict = None, dtype: str = "float16") -> ComfortTable:
+    """
+    Tabulate the PMV model over a grid of tdb [°C], rh [%], clo_d [clo] and met [met].
+    The clothing axis is the dynamic clothing (see clo_dynamic()): the PMV jumps at 1.2 met for a given clothing,
+    which can't be interpolated, but is smooth for a given dynamic clothing.
+
+    Parameters
+    ----------
+    grid: dict, optional
+        input name: (start, stop, step), see pmv_grid
+    dtype: str, optional
+        "float16" (half the size, same measured error for the default grid) or "float32"
+
+    Returns
+    -------
+    table: ComfortTable
+        table with the output "pmv"
+    """
+    axes = _grid(pmv_grid if grid is None else grid)
+    tdb, rh, clo_d, met = _points(axes)
+    pmv = _pmv_model(tdb.ravel(), rh.ravel(), clo_d.ravel(), met.ravel())["pmv"].reshape(tdb.shape)
+    return ComfortTable(axes, ["pmv"], pmv[..., np.newaxis].astype(dtype))
+
+
+def adaptive_table(grid: dict = None, dtype: str = "float32") -> ComfortTable:
+    """
+    Tabulate the comfort temperature and the limits of the categories I-III of the adaptive model
+    (EN 16798-1:2019) over the running mean outdoor temperature t_rm [°C], for air speeds below 0.6 m/s.
+
+    Parameters
+    ----------
+    grid: dict, optional
+        input name: (start, stop, step), see adaptive_grid
+    dtype: str, optional
+        "float16" or "float32"
+
+    Returns
+    -------
+    table: ComfortTable
+        table with the outputs of adaptive_outputs
+    """
+    axes = _grid(adaptive_grid if grid is None else grid)
+    (t_rm,) = _points(axes)
+    results = _adaptive_model(t_rm)
+    values = np.stack([results[name] for name in adaptive_outputs], axis=-1)
+    return ComfortTable(axes, adaptive_outputs, values.astype(dtype))
+
+
+def table_pmvppd(table: ComfortTable, tdb, rh, clo, met=1.2) -> dict:
+    """
+    PMV and PPD from a table of pmv_table(), like thermal_comfort_pmvppd() with a given (predicted) clothing.
+
+    Returns
+    -------
+    Returns PMV (-3 ~ +3) and PPD (%) in a dict, NaN outside the grid of the table
+    """
+    pmv = table(tdb=tdb, rh=rh, clo_d=clo_dynamic(clo, met), met=met)["pmv"]
+    ppd = 100.0 - 95.0 * np.exp(-0.03353 * pmv**4.0 - 0.2179 * pmv**2.0)
+    return {"pmv": np.around(pmv, 2), "ppd": np.around(ppd, 1)}
+
+
+def table_adaptive(table: ComfortTable, tdb, t_rm, tr=None) -> dict:
+    """
+    Results of the adaptive model from a table of adaptive_table(), like models.adaptive_en() with v = 0.
+
+    Returns
+    -------
+    Returns the comfort temperature, limits and acceptability of the categories I-III in a dict
+    """
+    tr = tdb if tr is None else tr
+    # operative temperature at low air speed
+    t_o = (np.asarray(tdb, dtype=np.float64) + np.asarray(tr, dtype=np.float64)) / 2
+    results = {name: np.around(value, 1) for name, value in table(t_rm=t_rm).items()}
+    for category in ("i", "ii", "iii"):
+        results[f"acceptability_cat_{category}"] = (
+            (results[f"tmp_cmf_cat_{category}_low"] <= t_o) & (t_o <= results[f"tmp_cmf_cat_{category}_up"])
+        )
+    return results
+
+
+def max_error(table: ComfortTable, samples: int = 200_000, seed: int = 0) -> dict:
+    """
+    Max absolute error of a table of pmv_table() or adaptive_table() against the full model
+    at random points inside its grid (PMV within -3 ~ +3).
+    """
+    rng = np.random.default_rng(seed)
+    inputs = {
+        name: rng.uniform(start, start + step * (size - 1), samples) for name, (start, step, size) in table.axes.items()
+    }
+    if "clo_d" in inputs:
+        # predicted clothing, points with a dynamic clothing outside the grid are skipped (NaN)
+        inputs["clo"] = inputs.pop("clo_d")
+        interpolated = table_pmvppd(table, **inputs)
+        exact = _pmv_model(inputs["tdb"], inputs["rh"], utilities.clo_dynamic(inputs["clo"], inputs["met"]), inputs["met"])
+        # PMV outside of the 7-point scale isn't meaningful
+        valid = np.abs(exact["pmv"]) <= 3
+        return {name: float(np.nanmax(np.abs(interpolated[name] - exact[name])[valid])) for name in exact}
+    interpolated = table_adaptive(table, tdb=20.0, **inputs)
+    exact = _adaptive_model(inputs["t_rm"])
+    return {name: float(np.nanmax(np.abs(interpolated[name] - exact[name]))) for name in exact}
+
+
+if __name__ == "__main__":
+    # generate the default tables and measure their error, e.g. python comfort_tables.py
+    logging.basicConfig(level=logging.INFO)
+    for table, file_name in ((pmv_table(), "pmv.eclt"), (adaptive_table(), "adaptive.eclt")):
+        table.save(file_name)
+        logger.info(f"{file_name}: {table.values.size} values, {table.nbytes() / 1024:.0f} KiB, max error {max_error(table)}")
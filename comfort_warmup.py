@@ -0,0 +1,107 @@
+"""
+Warm-up of the comfort models at startup.
+pythermalcomfort compiles its models with numba when imported, which delays the first reading by seconds.
+numba_disk_cache() enables numba's on-disk cache for these models, so only the first start ever compiles them.
+warm_up() imports the models and evaluates them once with the same inputs as thermal_comfort_pmvppd(),
+thermal_comfort_adaptive() and clothing_suggestion(), e.g. in a background thread with start_warm_up().
+"""
+
+import functools
+import logging
+import os
+import threading
+import time
+from contextlib import contextmanager
+
+logger = logging.getLogger(__name__)
+
+# folder for compiled models, relative to the working directory like the weather cache
+numba_cache_dir = ".numba_cache"
+
+
+@contextmanager
+def numba_disk_cache():
+    """
+    Context manager for importing numba-backed modules with cache=True as default for
+    numba.jit / numba.njit / numba.vectorize, so compiled functions are saved to numba_cache_dir.
+    An existing NUMBA_CACHE_DIR environment variable is respected.
+    """
+    os.environ.setdefault("NUMBA_CACHE_DIR", os.path.abspath(numba_cache_dir))
+    import numba
+
+    # numba reads the environment only on its first import
+    numba.config.CACHE_DIR = os.environ["NUMBA_CACHE_DIR"]
+
+    decorators = {name: getattr(numba, name) for name in ("jit", "njit", "vectorize")}
+    for name, decorator in decorators.items():
+        setattr(numba, name, _with_cache(decorator))
+    try:
+        yield
+    finally:
+        for name, decorator in decorators.items():
+            setattr(numba, name, decorator)
+
+
+def _with_cache(decorator):
+    @functools.wraps(decorator)
+    def decorator_with_cache(*args, **kwargs):
+        kwargs.setdefault("cache", True)
+        return decorator(*args, **kwargs)
+
+    return decorator_with_cache
+
+
+def warm_up() -> dict:
+    """
+    Import and compile the comfort models and evaluate each one once.
+
+    Returns
+    -------
+    timings: dict
+        time in seconds for each warm-up stage
+    """
+    import numpy as np
+    from lazy_import import preload
+    from thermal_comfort import models, utilities
+
+    timings = {}
+    start = time.perf_counter()
+    preload(models, utilities)
+    timings["import"] = time.perf_counter() - start
+
+    # thermal_comfort_pmvppd(): single reading, dynamic clothing for seated office work
+    start = time.perf_counter()
+    met = 1.2
+    vr = utilities.v_relative(v=0, met=met)
+    clo = utilities.clo_dynamic(clo=models.clo_tout(10.0), met=met)
+    models.pmv_ppd(tdb=22.0, tr=22.0, vr=vr, rh=50.0, met=met, clo=clo)
+    # thermal_comfort_pmvppd_batch(): arrays of readings
+    tdb = np.array([20.0, 22.0])
+    models.pmv_ppd(tdb=tdb, tr=tdb, vr=utilities.v_relative(v=np.zeros(2), met=np.full(2, met)),
+                   rh=np.array([40.0, 50.0]), met=np.full(2, met), clo=np.full(2, clo))
+    timings["pmv_ppd"] = time.perf_counter() - start
+
+    # thermal_comfort_adaptive()
+    start = time.perf_counter()
+    t_rm = utilities.running_mean_outdoor_temperature([10.0] * 7, alpha=0.8)
+    models.adaptive_en(22.0, 22.0, t_rm, 0, limit_inputs=False)
+    timings["adaptive_en"] = time.perf_counter() - start
+
+    # clothing_suggestion(): outdoors, slow walking
+    start = time.perf_counter()
+    models.pmv_ppd(tdb=5.0, tr=5.0, vr=0, rh=80.0, met=1.9, clo=0.6, limit_inputs=False)
+    timings["clothing"] = time.perf_counter() - start
+
+    logger.info(
+        "Comfort models warmed up: " + ", ".join(f"{stage} {seconds * 1000:.0f} ms" for stage, seconds in timings.items())
+    )
+    return timings
+
+
+def start_warm_up() -> threading.Thread:
+    """
+    Run warm_up() in a background thread, join the returned thread to wait for it.
+    """
+    thread = threading.Thread(target=warm_up, name="comfort-warm-up", daemon=True)
+    thread.start()
+    return thread
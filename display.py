@@ -0,0 +1,118 @@
+"""
+Change-driven updates of the text shown on the glasses, BLE writes are slow and drain the battery of the glasses.
+DisplayScheduler compares each rendered frame with the last frame sent and skips identical ones,
+sends at most one frame per min_interval (the latest frame of a burst wins),
+and sends immediately when the category of the frame changes, e.g. the IAQ class.
+
+Example:
+    display = DisplayScheduler(lambda text: commands.send_text(manager=manager, text_message=text), min_interval=15)
+    await display.show(text, category=iaq)
+    display.stats()  # frames sent / suppressed
+"""
+
+import asyncio
+import logging
+import time
+
+logger = logging.getLogger(__name__)
+
+
+class DisplayScheduler:
+    def __init__(self, send, min_interval: float = 15.0):
+        """
+        Example:
+        display = DisplayScheduler(send, min_interval=15)
+
+        send: coroutine function sending a text frame to the display, send(text).
+        min_interval: minimum time in seconds between two frames, except for category changes.
+        """
+        self.send = send
+        self.min_interval = min_interval
+
+        # counters
+        self.sent = 0
+        self.suppressed = 0  # identical to the frame on the display
+        self.coalesced = 0  # replaced by a newer frame before it was sent
+        self.failed = 0
+
+        self._last_text = None
+        self._last_category = None
+        self._last_sent = -float("inf")
+        self._pending = None
+        self._timer = None
+        self._lock = asyncio.Lock()
+
+    async def show(self, text: str, category=None):
+        """
+        Show a frame, sent now, later (rate limit) or not at all (unchanged).
+        category: e.g. the IAQ class, a change is sent immediately.
+        """
+        category_changed = self._last_text is not None and category != self._last_category
+        if text == self._last_text and not category_changed:
+            self.suppressed += 1
+            # the display already shows it, an older pending frame is outdated
+            self._drop_pending()
+            return
+
+        if category_changed or time.monotonic() - self._last_sent >= self.min_interval:
+            self._drop_pending()
+            await self._send(text, category)
+        else:
+            # the latest frame of a burst is sent when the interval is over
+            if self._pending is not None:
+                self.coalesced += 1
+            self._pending = (text, category)
+            if self._timer is None:
+                delay = self._last_sent + self.min_interval - time.monotonic()
+                self._timer = asyncio.create_task(self._send_later(delay))
+
+    async def flush(self):
+        """
+        Send a pending frame now.
+        """
+        frame = self._take_pending()
+        if frame is not None:
+            await self._send(*frame)
+
+    async def close(self):
+        """
+        Send a pending frame and stop the rate limit timer.
+        """
+        await self.flush()
+
+    def stats(self) -> dict:
+        """
+        Counters of frames sent / suppressed (unchanged) / coalesced (rate limit) / failed.
+        """
+        return {"sent": self.sent, "suppressed": self.suppressed, "coalesced": self.coalesced, "failed": self.failed}
+
+    async def _send(self, text: str, category):
+        async with self._lock:
+            if text == self._last_text and category == self._last_category:
+                self.suppressed += 1
+                return
+            try:
+                await self.send(text)
+            except Exception as e:
+                self.failed += 1
+                logger.error(f"Sending frame to display failed: {e}")
+                return
+            self.sent += 1
+            self._last_text = text
+            self._last_category = category
+            self._last_sent = time.monotonic()
+
+    async def _send_later(self, delay: float):
+        await asyncio.sleep(max(delay, 0))
+        await self.flush()
+
+    def _take_pending(self):
+        frame, self._pending = self._pending, None
+        if self._timer is not None and self._timer is not asyncio.current_task():
+            self._timer.cancel()
+        self._timer = None
+        return frame
+
+    def _drop_pending(self):
+        if self._take_pending() is not None:
+            self.coalesced += 1
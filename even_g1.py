@@ -1,169 +1,307 @@
-from serial_reader import microcontroller
-from thermal_comfort import thermal_comfort_pmvppd, thermal_comfort_adaptive
-from air_quality import iaq_co2
-from clothing_suggestion import clothing_suggestion
-import asyncio
-import logging
-from even_glasses.bluetooth_manager import GlassesManager
-from even_glasses.commands import send_text
-import time
-
-# Hardware configuration
-serial_port = "COM11"
-baud_rate = 115200
-sensors = ["BEM280", "SCD30"]
-
-
-logging.basicConfig(level=logging.INFO)
-logger = logging.getLogger(__name__)
-
-# some dummy data
-temperature = -1
-humidity = 99
-pressure = 99
-CO2 = 99
-
-
-async def send_sensordata(manager):
-    global temperature
-    global humidity
-    global pressure
-    global CO2
-    # init microcontroller
-    mc = microcontroller(
-        serial_port=serial_port,
-        baud_rate=baud_rate,
-        sensors=sensors,
-    )
-    while True:
-        sensor_data = mc.get_data()
-        if sensor_data:
-            for i, data in enumerate(sensor_data["Data"]):
-                # Bosch BME280
-                if data["Sensor"] == "BME280":
-                    temperature = sensor_data["Data"][i]["Value"]["Temperature"]
-                    print(f"Temperature: {temperature} degC")
-                    humidity = sensor_data["Data"][i]["Value"]["Humidity"]
-                    print(f"Humidity: {humidity} %")
-                    pressure = sensor_data["Data"][i]["Value"]["Pressure"]
-                    print(f"Air pressure: {pressure} hPa")
-
-                # Sensirion SCD30
-                if data["Sensor"] == "SCD30":
-                    CO2 = sensor_data["Data"][i]["Value"]["CO2"]
-                    print(f"CO2: {CO2} ppm")
-
-                else:
-                    logger.error("Expected sensor not found in unpacked data")
-
-            # 1) thermal comfort (Fanger's PMV/PPD model)
-            pmvppd = thermal_comfort_pmvppd(tdb=temperature, rh=humidity)
-            ## Predicted Mean Vote from –3 to +3 corresponding to the categories: cold, cool, slightly cool, neutral, slightly warm, warm, and hot.
-            pmv = pmvppd["pmv"]
-            print(f"PMV: {pmv} [-3 ~ +3]")
-            ## Predicted Percentage of Dissatisfied (PPD) occupants in %
-            ppd = pmvppd["ppd"]
-            print(f"PMV: {ppd} [%]")
-            ## Predicted clothing insulation value in clo
-            clo_predicted = pmvppd["clo"]
-            print(f"Predicted clothing: {clo_predicted} [clo]")
-
-            # 2) thermal comfort (adaptive model)
-            adaptive_results = thermal_comfort_adaptive(tdb=temperature)
-            print("Adaptive thermal comfort results: ", adaptive_results)
-            t_comfort_acceptable = adaptive_results[0]
-            t_comfort_cat_i_low = adaptive_results[1]
-            t_comfort = adaptive_results[2]
-            t_comfort_cat_i_up = adaptive_results[3]
-
-            # TODO: Translate the clo value into common and understandable clothing combinations.
-
-            # Indoor Air Quality
-            # change the standard if you prefer to use the standards or laws of another region
-            # By default it uses European standard EN 16798-1:2019
-            iaq_results = iaq_co2(CO2, standard="EN")
-            print("IAQ results: ", iaq_results)
-
-            if iaq_results["standard"] in ["LEHB", "SS", "DOSH"]:
-                iaq = "Acceptable" if iaq_results["indices"][0] == 1 else "Unacceptable"
-            elif iaq_results["standard"] == "HK":
-                if iaq_results["indices"][0] == 1:
-                    iaq = "Excellent"
-                elif iaq_results["indices"][0] == 2:
-                    iaq = "Good"
-                else:
-                    iaq = "Unacceptable"
-            elif iaq_results["standard"] == "UBA":
-                if iaq_results["indices"][0] == 1:
-                    iaq = "Safe"
-                elif iaq_results["indices"][0] == 2:
-                    iaq = "Conspicuous"
-                else:
-                    iaq = "Unacceptable"
-            else:
-                # default: EN standard
-                if iaq_results["indices"][0] == 1:
-                    iaq = "Excellent"
-                elif iaq_results["indices"][0] == 2:
-                    iaq = "Good"
-                elif iaq_results["indices"][0] == 3:
-                    iaq = "Moderate"
-                else:
-                    iaq = "Bad"
-
-            # TODO: Add support for other IEQ domains like noise, lighting, VOC etc.
-
-            await send_text(
-                manager=manager,
-                text_message=f"Temperature: {temperature:.1f} °C | Humidity: {humidity:.0f} %\n"
-                f"CO2: {CO2:.0f} ppm | Air Quality: {iaq}\n"
-                f"PMV: {pmv:.2f}     | PPD: {ppd:.1f} %\n"
-                f"Clothing Predicted: {clo_predicted:.2f} clo\n"
-                f"Adaptive Comfort Temperature: {t_comfort:.1f} °C",
-            )
-
-        else:
-            pass
-
-
-async def send_suggestion(manager):
-    # get suggested clothing ensembles indoors, extra clothing outdoors, today's average outdoor temperature and humidity
-    (
-        clothing_indoor,
-        clothing_outdoor,
-        tout_avg_today,
-        hout_avg_today,
-    ) = clothing_suggestion(type="A")
-
-    await send_text(
-        manager=manager,
-        text_message=f"Today's average outdoor temperature: {tout_avg_today:.1f} °C\n"
-        f"Today's average outdoor humidity: {hout_avg_today:.1f} %\n"
-        f"Suggested indoor outfits: {clothing_indoor}\n"
-        f"Suggested outdoor outfits: {clothing_outdoor}",
-    )
-
-
-async def main():
-    # init even g1 glasses
-    manager = GlassesManager(left_address=None, right_address=None)
-    glasses_connected = await manager.scan_and_connect()
-    await send_text(manager=manager, text_message="Hello, World!")
-
-    if glasses_connected:
-        try:
-            await send_suggestion(manager)  # send clothing suggestions once, no microcontroller required
-            # await send_sensordata(manager)  # send sensor data continuously when updated, comment this line if you don't have sensor data
-        except KeyboardInterrupt:
-            logger.info("Interrupted by user.")
-
-        finally:
-            await manager.disconnect_all()
-            logger.info("Glasses disconnected.")
-
-    else:
-        logger.error("Failed to connect to glasses.")
-
-
-if __name__ == "__main__":
-    asyncio.run(main())
+import time
+
+startup_time = time.perf_counter()
+
+from ingest import DeviceHub, SerialSource
+from display import DisplayScheduler
+from pipeline import Pipeline
+from sensor_log import SensorLogWriter
+import thermal_comfort
+from thermal_comfort import thermal_comfort_pmvppd, thermal_comfort_adaptive
+from air_quality import iaq_co2, RollingIAQ
+from clothing_suggestion import clothing_suggestion, clothing_plan, clothing_plan_text
+from comfort_executor import ComfortExecutor
+import comfort_warmup
+import lazy_import
+import asyncio
+import logging
+import sys
+
+# imported on first use, so that the startup isn't delayed by bleak
+bluetooth_manager = lazy_import.lazy_import("even_glasses.bluetooth_manager")
+commands = lazy_import.lazy_import("even_glasses.commands")
+
+# Hardware configuration
+serial_port = "COM11"
+baud_rate = 115200
+# all microcontrollers read on one event loop (e.g. a CO2 box in every meeting room): ["COM11", "COM12", ...]
+serial_ports = [serial_port]
+# device shown on the glasses (its serial port, e.g. "COM11"), None for the latest reading of any device
+display_device = None
+
+# Comfort models
+# worker pool evaluating the comfort models: "thread" (default) or "process" (one process per core, e.g. many devices)
+comfort_executor = "thread"
+# number of workers, None for the number of cores
+comfort_workers = None
+# memoize PMV/PPD of the readings, evaluated at the sensor resolution (0.05 K / 0.5 %RH), see thermal_comfort.PMVMemo
+pmv_memo = True
+
+# Indoor Air Quality
+# change the standard if you prefer to use the standards or laws of another region
+# By default it uses European standard EN 16798-1:2019
+iaq_standard = "EN"
+# averaging time of CO2 concentration, e.g. "8h" for HK or "1h" for EN. None for instantaneous evaluation
+iaq_window = None
+
+# Display
+# minimum time in seconds between two updates of the sensor data on the glasses (unchanged data is never sent again),
+# a change of the air quality category is shown immediately
+display_min_interval = 15
+
+# Clothing suggestion
+# hours of the commute, the outdoor clothing of the hourly clothing plan at these hours is shown on the glasses
+commute_hours = [8, 18]
+
+# csv log of all sensor readings, e.g. "office" for office_{date}.csv. None for no log
+log_file = None
+
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# last sensor values and rolling CO2 average of each device (source of its readings, e.g. "COM11"), see device_state()
+devices = {}
+# worker pool of the comfort models, created in main()
+executor = None
+
+
+def device_state(device: str) -> dict:
+    """
+    Last sensor values and rolling average of CO2 concentration (iaq_window) of a device,
+    so readings of different rooms don't overwrite each other.
+    """
+    state = devices.get(device)
+    if state is None:
+        state = devices[device] = {
+            # some dummy data
+            "temperature": -1,
+            "humidity": 99,
+            "pressure": 99,
+            "CO2": 99,
+            # rolling average of CO2 concentration, updated with each new measurement
+            "iaq_rolling": RollingIAQ(standard=iaq_standard, window=iaq_window) if iaq_window else None,
+        }
+    return state
+
+
+def daily_predictions() -> tuple:
+    """
+    Today's predicted clothing [clo] and running mean outdoor temperature [°C], cached in this process.
+    """
+    return thermal_comfort.clo_prediction(), thermal_comfort.running_mean_prediction()
+
+
+async def evaluate(reading) -> dict:
+    """
+    Evaluate thermal comfort and indoor air quality of a sensor reading (evaluate stage of the pipeline).
+    Sensors missing in the reading keep their last values (of the same device).
+    The comfort models run in the worker pool (comfort_executor), the event loop keeps reading the sensors.
+    """
+    state = device_state(reading.source)
+    # Bosch BME280
+    if "BME280" in reading.sensors:
+        state["temperature"] = reading.get("BME280", "Temperature")
+        print(f"Temperature: {state['temperature']} degC")
+        state["humidity"] = reading.get("BME280", "Humidity")
+        print(f"Humidity: {state['humidity']} %")
+        state["pressure"] = reading.get("BME280", "Pressure")
+        print(f"Air pressure: {state['pressure']} hPa")
+    # Sensirion SCD30 / SCD40
+    co2_sensor = next((name for name in ("SCD30", "SCD40") if name in reading.sensors), None)
+    if co2_sensor is not None:
+        state["CO2"] = reading.get(co2_sensor, "CO2")
+        print(f"CO2: {state['CO2']} ppm")
+    if "BME280" not in reading.sensors or co2_sensor is None:
+        logger.error("Expected sensor not found in unpacked data")
+    temperature = state["temperature"]
+    humidity = state["humidity"]
+    CO2 = state["CO2"]
+
+    # clothing and running mean outdoor temperature are predicted here (once a day, one weather request),
+    # not in each worker process of a "process" executor
+    clo, t_rm = await asyncio.to_thread(daily_predictions)
+    # 1) thermal comfort (Fanger's PMV/PPD model) and 2) thermal comfort (adaptive model), evaluated in parallel
+    pmvppd, adaptive_results = await asyncio.gather(
+        executor.run(thermal_comfort_pmvppd, tdb=temperature, rh=humidity, clo=clo, memo=pmv_memo),
+        executor.run(thermal_comfort_adaptive, tdb=temperature, t_rm=t_rm),
+    )
+    ## Predicted Mean Vote from –3 to +3 corresponding to the categories: cold, cool, slightly cool, neutral, slightly warm, warm, and hot.
+    pmv = pmvppd["pmv"]
+    print(f"PMV: {pmv} [-3 ~ +3]")
+    ## Predicted Percentage of Dissatisfied (PPD) occupants in %
+    ppd = pmvppd["ppd"]
+    print(f"PMV: {ppd} [%]")
+    ## Predicted clothing insulation value in clo
+    clo_predicted = pmvppd["clo"]
+    print(f"Predicted clothing: {clo_predicted} [clo]")
+
+    # 2) thermal comfort (adaptive model)
+    print("Adaptive thermal comfort results: ", adaptive_results)
+    t_comfort_acceptable = adaptive_results[0]
+    t_comfort_cat_i_low = adaptive_results[1]
+    t_comfort = adaptive_results[2]
+    t_comfort_cat_i_up = adaptive_results[3]
+
+    # TODO: Translate the clo value into common and understandable clothing combinations.
+
+    # Indoor Air Quality
+    if state["iaq_rolling"] is not None:
+        iaq_results = {"indices": [state["iaq_rolling"].update(co2_indoor=CO2, timestamp=reading.time)], "standard": iaq_standard}
+    else:
+        iaq_results = iaq_co2(CO2, standard=iaq_standard)
+    print("IAQ results: ", iaq_results)
+
+    if iaq_results["standard"] in ["LEHB", "SS", "DOSH"]:
+        iaq = "Acceptable" if iaq_results["indices"][0] == 1 else "Unacceptable"
+    elif iaq_results["standard"] == "HK":
+        if iaq_results["indices"][0] == 1:
+            iaq = "Excellent"
+        elif iaq_results["indices"][0] == 2:
+            iaq = "Good"
+        else:
+            iaq = "Unacceptable"
+    elif iaq_results["standard"] == "UBA":
+        if iaq_results["indices"][0] == 1:
+            iaq = "Safe"
+        elif iaq_results["indices"][0] == 2:
+            iaq = "Conspicuous"
+        else:
+            iaq = "Unacceptable"
+    else:
+        # default: EN standard
+        if iaq_results["indices"][0] == 1:
+            iaq = "Excellent"
+        elif iaq_results["indices"][0] == 2:
+            iaq = "Good"
+        elif iaq_results["indices"][0] == 3:
+            iaq = "Moderate"
+        else:
+            iaq = "Bad"
+
+    # TODO: Add support for other IEQ domains like noise, lighting, VOC etc.
+
+    return {
+        "temperature": temperature,
+        "humidity": humidity,
+        "CO2": CO2,
+        "iaq": iaq,
+        "pmv": pmv,
+        "ppd": ppd,
+        "clo": clo_predicted,
+        "t_comfort": t_comfort,
+    }
+
+
+def render(results: dict) -> tuple:
+    """
+    Text shown on the glasses and its category (air quality), a category change is shown immediately.
+    """
+    text = (
+        f"Temperature: {results['temperature']:.1f} °C | Humidity: {results['humidity']:.0f} %\n"
+        f"CO2: {results['CO2']:.0f} ppm | Air Quality: {results['iaq']}\n"
+        f"PMV: {results['pmv']:.2f}     | PPD: {results['ppd']:.1f} %\n"
+        f"Clothing Predicted: {results['clo']:.2f} clo\n"
+        f"Adaptive Comfort Temperature: {results['t_comfort']:.1f} °C"
+    )
+    return text, results["iaq"]
+
+
+async def send_sensordata(manager):
+    # init microcontrollers, read on the event loop without blocking BLE traffic to the glasses
+    hub = DeviceHub([SerialSource(port, baud_rate) for port in serial_ports])
+    await hub.start()
+    # send only changed text to the glasses, at most every display_min_interval seconds
+    display = DisplayScheduler(
+        lambda text: commands.send_text(manager=manager, text_message=text),
+        min_interval=display_min_interval,
+    )
+    # csv log of all readings (optional)
+    log = None
+    if log_file is not None:
+        log_writer = SensorLogWriter(filename=log_file, rotate_daily=True)
+        log = lambda reading: log_writer.write([reading.time] + reading.log_row())
+
+    # read sensors -> evaluate -> display (and log) in separate stages, see pipeline.py
+    pipeline = Pipeline(hub, evaluate=evaluate, render=render, display=display, log=log, device=display_device)
+    try:
+        await pipeline.run()
+    finally:
+        logger.info(f"Pipeline: {pipeline.stats()}")
+        logger.info(f"Display frames: {display.stats()}")
+        logger.info(f"PMV memo: {thermal_comfort.pmv_memo.stats()}")
+        await display.close()
+        await hub.close()
+        if log is not None:
+            log_writer.close()
+
+
+async def send_suggestion(manager):
+    # get suggested clothing ensembles indoors, extra clothing outdoors, today's average outdoor temperature and humidity
+    (
+        clothing_indoor,
+        clothing_outdoor,
+        tout_avg_today,
+        hout_avg_today,
+    ) = await executor.run(clothing_suggestion, type="A")
+    # outdoor clothing at the commute hours, from the hourly clothing plan (computed once per weather forecast)
+    plan = await executor.run(clothing_plan, type="A")
+    commute = clothing_plan_text(plan, hours=commute_hours, days=1)
+
+    await commands.send_text(
+        manager=manager,
+        text_message=f"Today's average outdoor temperature: {tout_avg_today:.1f} °C\n"
+        f"Today's average outdoor humidity: {hout_avg_today:.1f} %\n"
+        f"Suggested indoor outfits: {clothing_indoor}\n"
+        f"Suggested outdoor outfits: {clothing_outdoor}\n"
+        f"{commute}",
+    )
+
+
+def warm_up():
+    """
+    Import and compile the comfort models and data tools, run in background while connecting the glasses.
+    """
+    comfort_warmup.warm_up()
+    lazy_import.preload(thermal_comfort.pd)
+    logger.info(f"Comfort models ready after {time.perf_counter() - startup_time:.2f} s")
+    if lazy_import.profile:
+        logger.info("\n" + lazy_import.import_profile())
+
+
+async def main():
+    global executor
+    executor = ComfortExecutor(kind=comfort_executor, max_workers=comfort_workers)
+    # warm up comfort models in parallel to connecting the glasses
+    warm_up_task = asyncio.create_task(asyncio.to_thread(warm_up))
+
+    # init even g1 glasses
+    manager = bluetooth_manager.GlassesManager(left_address=None, right_address=None)
+    glasses_connected = await manager.scan_and_connect()
+    await commands.send_text(manager=manager, text_message="Hello, World!")
+    await warm_up_task
+
+    if glasses_connected:
+        try:
+            await send_suggestion(manager)  # send clothing suggestions once, no microcontroller required
+            # await send_sensordata(manager)  # send sensor data continuously when updated, comment this line if you don't have sensor data
+        except KeyboardInterrupt:
+            logger.info("Interrupted by user.")
+
+        finally:
+            await manager.disconnect_all()
+            logger.info("Glasses disconnected.")
+
+    else:
+        logger.error("Failed to connect to glasses.")
+
+    logger.info(f"Comfort executor: {executor.stats()}")
+    executor.shutdown()
+
+
+if __name__ == "__main__":
+    # log import times of heavy dependencies, e.g. python even_g1.py --import-profile
+    if "--import-profile" in sys.argv:
+        lazy_import.profile = True
+        logger.info(f"Modules imported after {time.perf_counter() - startup_time:.2f} s")
+    asyncio.run(main())
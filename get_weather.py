@@ -1,204 +1,321 @@
-"""
-Using the free weather API Open-Meteo (open-meteo.com) to get outdoor temperature for comfort evaluation.
-Change it to any weather API you like if preferred.
-Latitude & longitude have to be configured manually, just want to keep it simple!
-You could easily get them on Google Map for example. Open-Meteo also has a search function: https://open-meteo.com/en/docs
-"""
-
-import openmeteo_requests
-
-import requests_cache
-import pandas as pd
-from retry_requests import retry
-import logging
-from datetime import datetime, timedelta
-
-
-# Use the latitude & longitude of your city
-latitude = 50.7766
-longitude = 6.0834
-timezone = "Europe/Berlin"
-
-
-logging.basicConfig(level=logging.INFO)
-logger = logging.getLogger(__name__)
-
-# Setup the Open-Meteo API client with cache and retry on error
-cache_session = requests_cache.CachedSession(".cache", expire_after=3600)
-retry_session = retry(cache_session, retries=5, backoff_factor=0.2)
-openmeteo = openmeteo_requests.Client(session=retry_session)
-
-# Make sure all required weather variables are listed here
-# The order of variables in hourly or daily is important to assign them correctly below
-url = "https://api.open-meteo.com/v1/forecast"
-params_past1days = {
-    "latitude": latitude,
-    "longitude": longitude,
-    "hourly": "temperature_2m",
-    "timezone": timezone,
-    "past_days": 1,
-    "forecast_days": 1,
-}
-params_past7days = {
-    "latitude": latitude,
-    "longitude": longitude,
-    "hourly": "temperature_2m",
-    "timezone": timezone,
-    "past_days": 7,
-    "forecast_days": 1,
-}
-params_today = {
-    "latitude": latitude,
-    "longitude": longitude,
-    "hourly": ["temperature_2m", "relative_humidity_2m"],
-    "timezone": timezone,
-    "forecast_days": 1,
-}
-
-
-def t_outdoor_6am() -> float:
-    """
-    Get local outdoor air temperature [°C] at 6 a.m. from weather API (for daily clothing prediction)
-
-    Returns
-    -------
-    tout_6am: float
-        Local outdoor air temperature at 6 a.m. in [°C]
-    """
-    responses = openmeteo.weather_api(url, params=params_past1days)
-
-    # Process first location. Add a for-loop for multiple locations or weather models
-    response = responses[0]
-    logger.info(f"Coordinates {response.Latitude()}°N {response.Longitude()}°E")
-    logger.info(f"Timezone {response.Timezone()} {response.TimezoneAbbreviation()}")
-
-    # Process hourly data. The order of variables needs to be the same as requested.
-    hourly = response.Hourly()
-    hourly_temperature_2m = hourly.Variables(0).ValuesAsNumpy()
-
-    hourly_data = {
-        "date": pd.date_range(
-            start=pd.to_datetime(hourly.Time(), unit="s", utc=True),
-            end=pd.to_datetime(hourly.TimeEnd(), unit="s", utc=True),
-            freq=pd.Timedelta(seconds=hourly.Interval()),
-            inclusive="left",
-        )
-    }
-
-    hourly_data["temperature_2m"] = hourly_temperature_2m
-
-    hourly_dataframe = pd.DataFrame(data=hourly_data)
-
-    # get today's outdoor temperature at 6 a.m.
-    tout_6am = hourly_dataframe[
-        hourly_dataframe["date"] == "6:00:00"
-    ].temperature_2m.item()
-
-    return tout_6am
-
-
-def t_outdoor_avg_past7days() -> list:
-    """
-    Get average daily outdoor temperature in descending order.
-    Calculated using historical data (hourly values) obtained from the weather API.
-    Used to calculate the running mean temperature for adaptive thermal comfort model.
-
-    Returns
-    -------
-    tout_avg_past7days_ls: list
-        list of the average daily outdoor air temperature in descending order (i.e. from newest/yesterday to oldest):
-        t(day-1), t(day-2), ..., t(day-6), t(day-7)
-    """
-    responses = openmeteo.weather_api(url, params=params_past7days)
-
-    # Process first location. Add a for-loop for multiple locations or weather models
-    response = responses[0]
-    logger.info(f"Coordinates {response.Latitude()}°N {response.Longitude()}°E")
-    logger.info(f"Timezone {response.Timezone()} {response.TimezoneAbbreviation()}")
-
-    # Process hourly data. The order of variables needs to be the same as requested.
-    hourly = response.Hourly()
-    hourly_temperature_2m = hourly.Variables(0).ValuesAsNumpy()
-
-    hourly_data = {
-        "date": pd.date_range(
-            start=pd.to_datetime(hourly.Time(), unit="s", utc=True),
-            end=pd.to_datetime(hourly.TimeEnd(), unit="s", utc=True),
-            freq=pd.Timedelta(seconds=hourly.Interval()),
-            inclusive="left",
-        )
-    }
-
-    hourly_data["temperature_2m"] = hourly_temperature_2m
-
-    hourly_dataframe = pd.DataFrame(data=hourly_data)
-    # get daily average air temperature for past 7 days
-    date_now = datetime.now()
-    date_7daysago = datetime.now() - timedelta(days=7)
-    # create mask for past 7 days: t(day-7), t(day-6), ..., t(day-2), t(day-1)
-    mask = (
-        hourly_dataframe["date"] < f"{date_now.year}-{date_now.month}-{date_now.day}"
-    ) & (
-        hourly_dataframe["date"]
-        >= f"{date_7daysago.year}-{date_7daysago.month}-{date_7daysago.day}"
-    )
-    tout_past7days = hourly_dataframe.loc[mask]
-
-    # set index
-    tout_avg_past7days = tout_past7days.set_index("date")
-    # calculate daily average temperature and sort it in descending order: t(day-1), t(day-2), ..., t(day-6), t(day-7)
-    tout_avg_past7days = tout_avg_past7days.resample("D").mean().sort_index(ascending=False)
-    # convert to list
-    tout_avg_past7days_ls = tout_avg_past7days["temperature_2m"].tolist()
-
-    return tout_avg_past7days_ls
-
-def th_outdoor_avg_today() -> list:
-    """
-    Get today's local average outdoor air temperature [°C] from weather API (for daily clothing suggestions)
-
-    Returns
-    -------
-    tout_avg: float
-        Today's local average outdoor air temperature [°C]
-    hout_avg: float
-        Today's local average outdoor relative humidty [%]
-    """
-    responses = openmeteo.weather_api(url, params=params_today)
-
-    # Process first location. Add a for-loop for multiple locations or weather models
-    response = responses[0]
-    logger.info(f"Coordinates {response.Latitude()}°N {response.Longitude()}°E")
-    logger.info(f"Timezone {response.Timezone()} {response.TimezoneAbbreviation()}")
-
-    # Process hourly data. The order of variables needs to be the same as requested.
-    hourly = response.Hourly()
-    hourly_temperature_2m = hourly.Variables(0).ValuesAsNumpy()
-    hourly_relative_humidity_2m = hourly.Variables(1).ValuesAsNumpy()
-
-    hourly_data = {
-        "date": pd.date_range(
-            start=pd.to_datetime(hourly.Time(), unit="s", utc=True),
-            end=pd.to_datetime(hourly.TimeEnd(), unit="s", utc=True),
-            freq=pd.Timedelta(seconds=hourly.Interval()),
-            inclusive="left",
-        )
-    }
-
-    hourly_data["temperature_2m"] = hourly_temperature_2m
-    hourly_data["relative_humidity_2m"] = hourly_relative_humidity_2m
-
-    hourly_dataframe = pd.DataFrame(data=hourly_data)
-
-    # create mask for today
-    date_now = datetime.now()
-    mask = (hourly_dataframe["date"] >= f"{date_now.year}-{date_now.month}-{date_now.day}")
-    thout_today = hourly_dataframe.loc[mask]
-
-    # set index
-    thout_avg_today = thout_today.set_index("date")
-    # calculate today's average temperature & humidity
-    tout_avg_today = thout_avg_today.resample("D").mean().temperature_2m.item()
-    hout_avg_today = thout_avg_today.resample("D").mean().relative_humidity_2m.item()
-
-    return [tout_avg_today, hout_avg_today]
+"""
+Using the free weather API Open-Meteo (open-meteo.com) to get outdoor temperature for comfort evaluation.
+Change it to any weather API you like if preferred.
+Latitude & longitude have to be configured manually, just want to keep it simple!
+You could easily get them on Google Map for example. Open-Meteo also has a search function: https://open-meteo.com/en/docs
+"""
+
+import numpy as np
+import logging
+import os
+import time
+import weakref
+from datetime import datetime, timedelta
+from weather_providers import WeatherProvider, OpenMeteoProvider, ReplayProvider
+
+
+# Use the latitude & longitude of your city
+latitude = 50.7766
+longitude = 6.0834
+timezone = "Europe/Berlin"
+
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# Weather provider, created on first use: Open-Meteo API with cache and retry on error by default,
+# or recorded responses from disk if the environment variable EVENCOMFORT_WEATHER_REPLAY is set (see weather_providers)
+provider = None
+
+url = "https://api.open-meteo.com/v1/forecast"
+# historical weather data (reanalysis) is available with a delay of a few days
+url_archive = "https://archive-api.open-meteo.com/v1/archive"
+archive_delay_days = 5
+# refresh cached weather data after this time in seconds
+weather_ttl = 3600
+# days of hourly forecast including today, e.g. for the hourly clothing plan of today and the next 2 days
+forecast_days = 3
+# all weather datasets, so that set_provider() can discard their cached data
+_datasets = weakref.WeakSet()
+
+
+class WeatherDataset:
+    def __init__(self, past_days: int = 7, forecast_days: int = 1, ttl: float = weather_ttl,
+                 latitude: float = None, longitude: float = None, timezone: str = None):
+        """
+        Hourly outdoor air temperature and humidity of the past days and today, fetched with one request.
+        Kept in memory as numpy arrays starting at local midnight past_days ago, so that queries like
+        today's value at 6 a.m. or daily averages are just slices. Refreshed after ttl seconds or on a new day.
+
+        Example:
+        weather = WeatherDataset(past_days=7, forecast_days=1, ttl=3600)
+        tout_6am = weather.t_outdoor_6am()
+
+        latitude / longitude / timezone: location of the weather data, the module settings if None.
+        """
+        self.past_days = past_days
+        self.forecast_days = forecast_days
+        self.ttl = ttl
+        self.latitude = latitude
+        self.longitude = longitude
+        self.timezone = timezone
+        # hourly values, index 0 is local midnight past_days ago
+        self.temperature = None
+        self.humidity = None
+        # local date of today in the dataset and the UTC offset of its timezone
+        self.today = None
+        self.utc_offset = None
+        self.fetched_at = None
+        self.fetched_on = None
+        _datasets.add(self)
+
+    def params(self) -> dict:
+        """
+        Request parameters for the weather API.
+        """
+        return {
+            "latitude": latitude if self.latitude is None else self.latitude,
+            "longitude": longitude if self.longitude is None else self.longitude,
+            "hourly": ["temperature_2m", "relative_humidity_2m"],
+            "timezone": timezone if self.timezone is None else self.timezone,
+            "past_days": self.past_days,
+            "forecast_days": self.forecast_days,
+        }
+
+    def is_stale(self) -> bool:
+        """
+        True if not fetched yet, older than ttl or fetched on another day (local date of the dataset's timezone).
+        """
+        return (
+            self.fetched_at is None
+            or time.monotonic() - self.fetched_at > self.ttl
+            or self.local_date() != self.fetched_on
+        )
+
+    def local_date(self):
+        """
+        Current date in the timezone of the weather data (e.g. of another location), the host date if not fetched yet.
+        """
+        if self.utc_offset is None:
+            return datetime.now().date()
+        return (datetime(1970, 1, 1) + timedelta(seconds=time.time()) + self.utc_offset).date()
+
+    def refresh(self, force: bool = False) -> bool:
+        """
+        Fetch weather data if stale (or forced), returns True if fetched.
+        """
+        if not force and not self.is_stale():
+            return False
+
+        responses = get_provider().fetch(url, params=self.params())
+        self.load(responses[0])
+
+        return True
+
+    def load(self, response):
+        """
+        Use fetched weather data (weather_providers.HourlyWeather of this location), e.g. from refresh_all().
+        """
+        self.temperature = np.ascontiguousarray(response.variables["temperature_2m"], dtype=np.float64)
+        self.humidity = np.ascontiguousarray(response.variables["relative_humidity_2m"], dtype=np.float64)
+        # hourly data starts at local midnight past_days ago
+        self.today = response.local_start().date() + timedelta(days=self.past_days)
+        self.utc_offset = timedelta(seconds=response.utc_offset_seconds)
+        self.fetched_at = time.monotonic()
+        # local date of the fetch, usually today (recorded data can be of another day)
+        self.fetched_on = self.local_date()
+
+    def day(self, days: int = 0) -> slice:
+        """
+        Hourly index range of a day relative to today, e.g. -1 for yesterday.
+        """
+        start = (self.past_days + days) * 24
+        return slice(start, start + 24)
+
+    def hourly_forecast(self) -> dict:
+        """
+        Hourly outdoor air temperature in [°C] and relative humidity in [%] from today 00:00 to the end of the forecast,
+        with the local time of each hour (numpy datetime64[h]). The arrays are views of the dataset, don't modify them.
+        """
+        self.refresh()
+        start = self.day(0).start
+        hours = np.datetime64(self.today, "h") + np.arange(len(self.temperature) - start)
+        return {"time": hours, "temperature": self.temperature[start:], "humidity": self.humidity[start:]}
+
+    def t_outdoor_6am(self) -> float:
+        """
+        Today's outdoor air temperature at 6 a.m. in [°C], see t_outdoor_6am().
+        """
+        self.refresh()
+        return float(self.temperature[self.day(0).start + 6])
+
+    def t_outdoor_avg_past_days(self) -> list:
+        """
+        Daily average outdoor air temperature of the past days in [°C], see t_outdoor_avg_past7days().
+        """
+        self.refresh()
+        # daily averages of the past days, reversed to descending order: t(day-1), t(day-2), ...
+        t_avg_days = self.temperature[: self.past_days * 24].reshape(self.past_days, 24).mean(axis=1)
+        return t_avg_days[::-1].tolist()
+
+    def th_outdoor_avg_today(self) -> list:
+        """
+        Today's average outdoor air temperature in [°C] and relative humidity in [%], see th_outdoor_avg_today().
+        """
+        self.refresh()
+        today = self.day(0)
+        return [float(self.temperature[today].mean()), float(self.humidity[today].mean())]
+
+
+def refresh_all(datasets: list, force: bool = False) -> int:
+    """
+    Refresh several weather datasets (e.g. one per office location) with one request per combination
+    of past_days / forecast_days: Open-Meteo answers comma-separated coordinates with one response per location.
+
+    Parameters
+    ----------
+    datasets: list of WeatherDataset
+    force: bool, optional
+        fetch all datasets, not only stale ones
+
+    Returns
+    -------
+    fetched: int
+        number of datasets fetched
+    """
+    groups = {}
+    for dataset in datasets:
+        if force or dataset.is_stale():
+            groups.setdefault((dataset.past_days, dataset.forecast_days), []).append(dataset)
+
+    for group in groups.values():
+        params = group[0].params()
+        locations = [dataset.params() for dataset in group]
+        for name in ("latitude", "longitude", "timezone"):
+            params[name] = ",".join(str(location[name]) for location in locations)
+        responses = get_provider().fetch(url, params=params)
+        if len(responses) != len(group):
+            raise ValueError(f"Expected weather data of {len(group)} locations, got {len(responses)}")
+        for dataset, response in zip(group, responses):
+            dataset.load(response)
+
+    return sum(len(group) for group in groups.values())
+
+
+def get_provider() -> WeatherProvider:
+    """
+    Get the weather provider, created on first use.
+    """
+    global provider
+
+    if provider is None:
+        replay_path = os.environ.get("EVENCOMFORT_WEATHER_REPLAY")
+        provider = ReplayProvider(replay_path) if replay_path else OpenMeteoProvider(cache=".cache", expire_after=3600)
+
+    return provider
+
+
+def set_provider(weather_provider: WeatherProvider):
+    """
+    Use another weather provider, e.g. ReplayProvider for tests, benchmarks and air-gapped sites.
+    Cached weather data of all datasets (e.g. of locations.Location) is discarded.
+    """
+    global provider
+
+    provider = weather_provider
+    for dataset in list(_datasets):
+        dataset.fetched_at = None
+
+
+# shared weather dataset of the past 7 days, today and the forecast
+weather = WeatherDataset(past_days=7, forecast_days=forecast_days)
+
+
+def t_outdoor_6am() -> float:
+    """
+    Get local outdoor air temperature [°C] at 6 a.m. from weather API (for daily clothing prediction)
+
+    Returns
+    -------
+    tout_6am: float
+        Local outdoor air temperature at 6 a.m. in [°C]
+    """
+    return weather.t_outdoor_6am()
+
+
+def t_outdoor_avg_past7days() -> list:
+    """
+    Get average daily outdoor temperature in descending order.
+    Calculated using historical data (hourly values) obtained from the weather API.
+    Used to calculate the running mean temperature for adaptive thermal comfort model.
+
+    Returns
+    -------
+    tout_avg_past7days_ls: list
+        list of the average daily outdoor air temperature in descending order (i.e. from newest/yesterday to oldest):
+        t(day-1), t(day-2), ..., t(day-6), t(day-7)
+    """
+    return weather.t_outdoor_avg_past_days()
+
+
+def th_outdoor_avg_today() -> list:
+    """
+    Get today's local average outdoor air temperature [°C] from weather API (for daily clothing suggestions)
+
+    Returns
+    -------
+    tout_avg: float
+        Today's local average outdoor air temperature [°C]
+    hout_avg: float
+        Today's local average outdoor relative humidty [%]
+    """
+    return weather.th_outdoor_avg_today()
+
+
+def t_outdoor_6am_days(days) -> np.ndarray:
+    """
+    Get local outdoor air temperature [°C] at 6 a.m. for several days from weather API
+    (for daily clothing prediction of recorded sensor data).
+    Requests all days at once, recent days from the forecast API, older days from the historical weather API.
+
+    Parameters
+    ----------
+    days: array-like of dates, e.g. numpy datetime64[D] array
+        local dates to get the outdoor air temperature at 6 a.m. for
+
+    Returns
+    -------
+    tout_6am: np.ndarray
+        Local outdoor air temperature at 6 a.m. in [°C] for each day, NaN if not available
+    """
+    days = np.asarray(days, dtype="datetime64[D]")
+    tout_6am = np.full(days.shape, np.nan)
+    today = np.datetime64(datetime.now().date(), "D")
+    recent = days > today - archive_delay_days
+
+    for mask, url_days in ((~recent, url_archive), (recent, url)):
+        if not mask.any():
+            continue
+        start_date = days[mask].min()
+        end_date = days[mask].max()
+        params_days = {
+            "latitude": latitude,
+            "longitude": longitude,
+            "hourly": "temperature_2m",
+            "timezone": timezone,
+            "start_date": str(start_date),
+            "end_date": str(end_date),
+        }
+        responses = get_provider().fetch(url_days, params=params_days)
+        response = responses[0]
+
+        # hourly data starts at local midnight of start_date (as requested)
+        hourly_temperature_2m = response.variables["temperature_2m"]
+        response_start = np.datetime64(response.local_start().date(), "D")
+        hours_6am = (days[mask] - response_start).astype(np.int64) * 24 + 6
+        available = (hours_6am >= 0) & (hours_6am < len(hourly_temperature_2m))
+        tout_6am_days = np.full(hours_6am.shape, np.nan)
+        tout_6am_days[available] = hourly_temperature_2m[hours_6am[available]]
+        tout_6am[mask] = tout_6am_days
+
+    return tout_6am
@@ -0,0 +1,236 @@
+"""
+Ingestion of readings from several microcontrollers (e.g. a CO2 box in every meeting room) on one asyncio event loop.
+Each source (serial port or TCP stream) is read without blocking the loop and without a thread per port,
+its readings (JSON or binary frames, see serial_reader.FrameDecoder) are decoded into sensors.Reading records,
+tagged with their source, device and location, and kept in a bounded queue per source.
+Readings are kept apart by source (port or stream), not by "Device": the name is hard-coded in each sketch,
+so identical boxes on different ports have the same one.
+DeviceHub merges the queues into one stream ordered by time of arrival.
+
+Example:
+    hub = DeviceHub([SerialSource("COM11"), SerialSource("COM12", location="meeting room 1")])
+    await hub.start()
+    async for reading in hub:
+        print(reading.source, reading.location, reading.get("SCD30", "CO2"))
+"""
+
+import asyncio
+import logging
+import os
+from collections import deque
+from datetime import datetime
+
+import serial
+
+from sensors import Reading, decode_reading
+from serial_reader import FrameDecoder
+
+logger = logging.getLogger(__name__)
+
+
+class SerialSource:
+    def __init__(self, port: str, baud_rate: int = 115200, location: str = None, poll_interval: float = 0.05):
+        """
+        Example:
+        SerialSource("COM11", 115200, location="office")
+
+        location: location of the readings, replaces "Location" sent by the microcontroller (the default of the sketch),
+        None to keep it.
+        poll_interval: time in seconds between checks of the port on systems without readiness notification
+        for serial ports (Windows), on Linux / macOS the event loop is notified when data arrives.
+        """
+        self.name = port
+        self.port = port
+        self.baud_rate = baud_rate
+        self.location = location
+        self.poll_interval = poll_interval
+        self.serial = None
+
+    async def run(self, feed):
+        """
+        Read the port until it fails, received bytes are passed to feed().
+        """
+        # timeout=0: reads never block the event loop
+        self.serial = serial.Serial(self.port, self.baud_rate, timeout=0)
+        try:
+            if os.name == "posix":
+                await self._read_when_ready(feed)
+            else:
+                await self._poll(feed)
+        finally:
+            self.serial.close()
+
+    async def _read_when_ready(self, feed):
+        loop = asyncio.get_running_loop()
+        ready = asyncio.Event()
+        fd = self.serial.fileno()
+        loop.add_reader(fd, ready.set)
+        try:
+            while True:
+                await ready.wait()
+                ready.clear()
+                data = self.serial.read(self.serial.in_waiting or 1)
+                if data:
+                    feed(data)
+        finally:
+            loop.remove_reader(fd)
+
+    async def _poll(self, feed):
+        while True:
+            waiting = self.serial.in_waiting
+            if waiting:
+                feed(self.serial.read(waiting))
+            else:
+                await asyncio.sleep(self.poll_interval)
+
+
+class TcpSource:
+    def __init__(self, host: str, port: int, location: str = None):
+        """
+        Example:
+        TcpSource("192.168.0.42", 3333, location="meeting room 2")
+
+        Readings streamed over TCP in the same format as over the serial port, e.g. from a networked box or ser2net.
+        location: location of the readings, replaces "Location" sent by the microcontroller, None to keep it.
+        """
+        self.name = f"{host}:{port}"
+        self.host = host
+        self.port = port
+        self.location = location
+
+    async def run(self, feed):
+        """
+        Read the stream until it's closed, received bytes are passed to feed().
+        """
+        reader, writer = await asyncio.open_connection(self.host, self.port)
+        try:
+            while True:
+                data = await reader.read(4096)
+                if not data:
+                    raise ConnectionError(f"{self.name} closed the connection")
+                feed(data)
+        finally:
+            writer.close()
+
+
+class DeviceHub:
+    def __init__(self, sources: list, queue_size: int = 256, reconnect_delay: float = 5.0):
+        """
+        Example:
+        hub = DeviceHub([SerialSource("COM11"), SerialSource("COM12")])
+        await hub.start()
+        reading = await hub.get()
+
+        sources: SerialSource / TcpSource or other objects with (unique) name, location and async run(feed).
+        queue_size: readings kept per source, the oldest are dropped (and counted) if nobody takes them.
+        reconnect_delay: time in seconds before a failed source is opened again.
+        """
+        self.sources = sources
+        self.queue_size = queue_size
+        self.reconnect_delay = reconnect_delay
+        # source name: deque of readings
+        self.queues = {}
+
+        self._device_stats = {}
+        self._source_stats = {source.name: {"bytes": 0, "readings": 0, "errors": 0, "connected": False} for source in sources}
+        self._decoders = {source.name: FrameDecoder() for source in sources}
+        self._tasks = []
+        self._ready = None
+
+    async def start(self):
+        """
+        Start reading all sources, has to be called from the event loop using get().
+        """
+        self._ready = asyncio.Event()
+        self._tasks = [asyncio.create_task(self._run_source(source), name=f"ingest {source.name}") for source in self.sources]
+
+    async def close(self):
+        """
+        Stop reading and close all sources.
+        """
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+
+    async def get(self, source: str = None) -> Reading:
+        """
+        Wait for the oldest reading of all sources (or of one source, e.g. "COM11").
+        """
+        while True:
+            if source is not None:
+                queue = self.queues.get(source)
+                if queue:
+                    return queue.popleft()
+            else:
+                heads = [(queue[0].time, name) for name, queue in self.queues.items() if queue]
+                if heads:
+                    return self.queues[min(heads)[1]].popleft()
+            self._ready.clear()
+            await self._ready.wait()
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self) -> Reading:
+        return await self.get()
+
+    def stats(self) -> dict:
+        """
+        Counters per device (device name, readings, dropped, queued, last seen) by source
+        and per source (bytes, readings, errors, decoding errors of FrameDecoder, connected).
+        """
+        devices = {
+            source: dict(stats, queued=len(self.queues[source])) for source, stats in self._device_stats.items()
+        }
+        sources = {
+            name: dict(stats, **self._decoders[name].stats()) for name, stats in self._source_stats.items()
+        }
+        return {"devices": devices, "sources": sources}
+
+    async def _run_source(self, source):
+        stats = self._source_stats[source.name]
+        while True:
+            try:
+                stats["connected"] = True
+                await source.run(lambda data: self._feed(source, data))
+            except (serial.SerialException, OSError) as e:
+                stats["errors"] += 1
+                logger.error(f"{source.name}: {e}, reconnecting in {self.reconnect_delay} s")
+            finally:
+                stats["connected"] = False
+            await asyncio.sleep(self.reconnect_delay)
+
+    def _feed(self, source, data: bytes):
+        stats = self._source_stats[source.name]
+        stats["bytes"] += len(data)
+        decoder = self._decoders[source.name]
+        decoder.feed(data)
+        now = datetime.now()
+        while decoder.pending():
+            try:
+                reading = decode_reading(decoder.pop(), time=now)
+            except (ValueError, KeyError, TypeError) as e:
+                stats["errors"] += 1
+                logger.warning(f"{source.name}: reading skipped, {e}")
+                continue
+            reading.source = source.name
+            if source.location is not None:
+                reading.location = source.location
+            stats["readings"] += 1
+            self._put(reading)
+
+    def _put(self, reading: Reading):
+        queue = self.queues.get(reading.source)
+        if queue is None:
+            queue = self.queues[reading.source] = deque()
+            self._device_stats[reading.source] = {"device": reading.device, "readings": 0, "dropped": 0, "last_seen": None}
+        stats = self._device_stats[reading.source]
+        stats["device"] = reading.device
+        if len(queue) >= self.queue_size:
+            queue.popleft()
+            stats["dropped"] += 1
+        queue.append(reading)
+        stats["readings"] += 1
+        stats["last_seen"] = reading.time
+        self._ready.set()
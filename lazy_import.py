@@ -0,0 +1,85 @@
+"""
+Lazy imports of heavy dependencies (pandas, pythermalcomfort with numba, bleak...), so that scripts start fast.
+The module is only imported on first attribute access, the import time is recorded for profiling.
+
+Example:
+    from lazy_import import lazy_import
+    pd = lazy_import("pandas")
+    pd.DataFrame()  # pandas is imported here
+"""
+
+import importlib
+import logging
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+# module name: import time in seconds, for lazy modules imported so far
+import_times = {}
+# log each lazy import when it happens
+profile = False
+
+_lock = threading.RLock()
+
+
+class LazyModule:
+    def __init__(self, name: str, context=None):
+        """
+        Placeholder for a module, imported on first attribute access. Use lazy_import() to create it.
+        context: optional function returning a context manager the import runs in.
+        """
+        self._name = name
+        self._context = context
+        self._module = None
+
+    def load(self):
+        """
+        Import the module now (if not imported yet) and return it.
+        """
+        if self._module is None:
+            with _lock:
+                if self._module is None:
+                    start = time.perf_counter()
+                    if self._context is not None:
+                        with self._context():
+                            module = importlib.import_module(self._name)
+                    else:
+                        module = importlib.import_module(self._name)
+                    import_times[self._name] = time.perf_counter() - start
+                    if profile:
+                        logger.info(f"lazy import {self._name}: {import_times[self._name] * 1000:.0f} ms")
+                    self._module = module
+        return self._module
+
+    def __getattr__(self, attr: str):
+        return getattr(self.load(), attr)
+
+    def __repr__(self):
+        state = "imported" if self._module is not None else "not imported yet"
+        return f"<lazy module '{self._name}' ({state})>"
+
+
+def lazy_import(name: str, context=None) -> LazyModule:
+    """
+    Get a placeholder for module name, imported on first attribute access (optionally within context()).
+    """
+    return LazyModule(name, context)
+
+
+def preload(*modules: LazyModule):
+    """
+    Import lazy modules now, e.g. in a background thread during startup.
+    """
+    for module in modules:
+        module.load()
+
+
+def import_profile() -> str:
+    """
+    Import times of lazy modules as text table, slowest first (similar to python -X importtime).
+    """
+    lines = ["import time [ms] | module"]
+    for name, seconds in sorted(import_times.items(), key=lambda x: x[1], reverse=True):
+        lines.append(f"{seconds * 1000:16.0f} | {name}")
+    return "\n".join(lines)
@@ -0,0 +1,250 @@
+"""
+Comfort evaluation for several locations in one process, e.g. offices in different cities.
+Each Location carries its own weather data, daily clothing prediction and running mean outdoor temperature
+(saved in its own file), the module-level functions of thermal_comfort.py / get_weather.py stay the default location.
+A LocationGroup fetches the weather of all its locations with one Open-Meteo request (comma-separated coordinates)
+and evaluates the readings of all locations concurrently.
+
+Example:
+    group = LocationGroup([
+        Location("aachen", latitude=50.7766, longitude=6.0834, timezone="Europe/Berlin"),
+        Location("oslo", latitude=59.9139, longitude=10.7522, timezone="Europe/Oslo"),
+    ])
+    results = await group.evaluate({"aachen": {"tdb": 22.0, "rh": 50.0}, "oslo": {"tdb": 20.5, "rh": 35.0}})
+    group["oslo"].clothing_plan(days=1)
+"""
+
+import asyncio
+import logging
+import threading
+
+import numpy as np
+
+import thermal_comfort
+from clothing_suggestion import clothing_suggestion, clothing_plan
+from get_weather import WeatherDataset, refresh_all, forecast_days, weather_ttl
+from thermal_comfort import (
+    PMVMemo,
+    models,
+    thermal_comfort_pmvppd,
+    thermal_comfort_pmvppd_batch,
+    thermal_comfort_adaptive,
+    thermal_comfort_adaptive_batch,
+    _update_running_mean,
+    _load_running_mean,
+    _save_running_mean,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class Location:
+    def __init__(self, name: str, latitude: float, longitude: float, timezone: str, past_days: int = 7,
+                 forecast_days: int = forecast_days, ttl: float = weather_ttl, running_mean_file: str = None):
+        """
+        Example:
+        office = Location("aachen", latitude=50.7766, longitude=6.0834, timezone="Europe/Berlin")
+        office.pmvppd(tdb=22.0, rh=50.0)
+
+        name: name of the location, e.g. the location of the sensors (see ingest.DeviceHub).
+        past_days / forecast_days / ttl: weather data of this location, see get_weather.WeatherDataset.
+        running_mean_file: file the running mean outdoor temperature is saved in, .running_mean_<name>.json if None.
+        """
+        self.name = name
+        self.weather = WeatherDataset(
+            past_days=past_days, forecast_days=forecast_days, ttl=ttl,
+            latitude=latitude, longitude=longitude, timezone=timezone,
+        )
+        self.running_mean_file = running_mean_file or f".running_mean_{name}.json"
+        # sensor resolution: BME280 air temperature and humidity, like thermal_comfort.pmv_memo
+        self.pmv_memo = PMVMemo(t_resolution=0.05, rh_resolution=0.5)
+
+        # clothing indoors, predicted once a day from the outdoor temperature at 6 a.m.
+        self.tout_6am = None
+        self.clo = None
+        self.clo_date = None
+        # running mean outdoor temperature, updated once a day
+        self.t_runningmean = None
+        self.t_runningmean_date = None
+        self._lock = threading.Lock()
+
+    def __repr__(self):
+        return (f"Location({self.name!r}, latitude={self.weather.latitude}, longitude={self.weather.longitude}, "
+                f"timezone={self.weather.timezone!r})")
+
+    def clo_prediction(self) -> float:
+        """
+        Clothing indoors today at this location [clo], see thermal_comfort.clo_prediction().
+        """
+        with self._lock:
+            self.weather.refresh()
+            # local date of the location, from its weather data
+            if self.clo_date != self.weather.today:
+                self.tout_6am = self.weather.t_outdoor_6am()
+                self.clo = models.clo_tout(self.tout_6am)
+                self.clo_date = self.weather.today
+            return self.clo
+
+    def running_mean_prediction(self) -> float:
+        """
+        Running mean outdoor temperature today at this location [°C], see thermal_comfort.running_mean_prediction().
+        """
+        with self._lock:
+            self.weather.refresh()
+            today = self.weather.today
+            if self.t_runningmean_date == today:
+                return self.t_runningmean
+
+            if self.t_runningmean_date is None:
+                self.t_runningmean, self.t_runningmean_date = _load_running_mean(self.running_mean_file)
+
+            days_since_update = (today - self.t_runningmean_date).days if self.t_runningmean_date is not None else None
+            if days_since_update != 0:
+                t_rm = _update_running_mean(
+                    self.t_runningmean, days_since_update, self.weather.t_outdoor_avg_past_days()
+                )
+                if not np.isfinite(t_rm):
+                    # incomplete weather data: keep the last value and retry on the next call
+                    logger.warning(f"Running mean outdoor temperature of {self.name} not available, weather data incomplete")
+                    return t_rm
+                self.t_runningmean, self.t_runningmean_date = t_rm, today
+                _save_running_mean(self.t_runningmean, self.t_runningmean_date, self.running_mean_file)
+
+            return self.t_runningmean
+
+    def pmvppd(self, tdb, rh, tr=None, v=0, met=1.2) -> dict:
+        """
+        PMV / PPD of a reading at this location, see thermal_comfort.thermal_comfort_pmvppd().
+        """
+        memo = self.pmv_memo if thermal_comfort.pmv_memo_enabled else False
+        return thermal_comfort_pmvppd(tdb=tdb, rh=rh, tr=tr, v=v, met=met, clo=self.clo_prediction(), memo=memo)
+
+    def pmvppd_batch(self, tdb, rh, tr=None, v=0, met=1.2) -> dict:
+        """
+        PMV / PPD of many readings at this location today, see thermal_comfort.thermal_comfort_pmvppd_batch().
+        """
+        return thermal_comfort_pmvppd_batch(tdb=tdb, rh=rh, tr=tr, v=v, met=met, clo=self.clo_prediction())
+
+    def adaptive(self, tdb, tr=None, v=0) -> list:
+        """
+        Adaptive thermal comfort of a reading at this location, see thermal_comfort.thermal_comfort_adaptive().
+        """
+        return thermal_comfort_adaptive(tdb=tdb, tr=tr, v=v, t_rm=self.running_mean_prediction())
+
+    def adaptive_batch(self, tdb, tr=None, v=0) -> dict:
+        """
+        Adaptive thermal comfort of many readings at this location, see thermal_comfort.thermal_comfort_adaptive_batch().
+        """
+        return thermal_comfort_adaptive_batch(tdb=tdb, tr=tr, v=v, t_rm=self.running_mean_prediction())
+
+    def clothing(self, type="A") -> list:
+        """
+        Clothing suggestion for today at this location, see clothing_suggestion.clothing_suggestion().
+        """
+        return clothing_suggestion(type=type, clo=self.clo_prediction(), weather=self.weather)
+
+    def clothing_plan(self, type="A", days: int = None, resolution: int = 60) -> dict:
+        """
+        Clothing plan over the forecast at this location, see clothing_suggestion.clothing_plan().
+        """
+        return clothing_plan(type=type, days=days, resolution=resolution, weather=self.weather)
+
+    def evaluate(self, tdb, rh, tr=None, v=0, met=1.2) -> dict:
+        """
+        PMV / PPD and adaptive thermal comfort of a reading at this location.
+
+        Returns
+        -------
+        results: dict
+            location name, "pmvppd" (see pmvppd()) and "adaptive" (see adaptive())
+        """
+        return {
+            "location": self.name,
+            "pmvppd": self.pmvppd(tdb=tdb, rh=rh, tr=tr, v=v, met=met),
+            "adaptive": self.adaptive(tdb=tdb, tr=tr, v=v),
+        }
+
+    def stats(self) -> dict:
+        """
+        Today's clothing / running mean and the PMV memo counters of this location.
+        """
+        return {
+            "name": self.name,
+            "weather_today": None if self.weather.today is None else self.weather.today.isoformat(),
+            "tout_6am": self.tout_6am,
+            "clo": None if self.clo is None else float(self.clo),
+            "t_runningmean": self.t_runningmean,
+            "pmv_memo": self.pmv_memo.stats(),
+        }
+
+
+class LocationGroup:
+    def __init__(self, locations: list):
+        """
+        Example:
+        group = LocationGroup([Location("aachen", 50.7766, 6.0834, "Europe/Berlin"), Location("oslo", 59.9139, 10.7522, "Europe/Oslo")])
+        group.refresh()  # one weather request for all locations
+
+        locations: list of Location, with unique names.
+        """
+        self.locations = {}
+        for location in locations:
+            if location.name in self.locations:
+                raise ValueError(f"Location name not unique: {location.name}")
+            self.locations[location.name] = location
+
+    def __getitem__(self, name: str) -> Location:
+        return self.locations[name]
+
+    def __iter__(self):
+        return iter(self.locations.values())
+
+    def __len__(self) -> int:
+        return len(self.locations)
+
+    def refresh(self, force: bool = False) -> int:
+        """
+        Fetch the weather data of all stale locations with one request, returns the number of locations fetched.
+        """
+        fetched = refresh_all([location.weather for location in self], force=force)
+        if fetched:
+            logger.info(f"Weather data of {fetched} locations fetched")
+        return fetched
+
+    async def evaluate(self, readings: dict, executor=None) -> dict:
+        """
+        Evaluate readings of several locations concurrently, see Location.evaluate().
+        The weather of all locations is fetched first with one request, so the evaluations don't each fetch their own.
+
+        Parameters
+        ----------
+        readings: dict
+            location name -> keyword arguments of Location.evaluate(), e.g. {"aachen": {"tdb": 22.0, "rh": 50.0}}
+        executor: comfort_executor.ComfortExecutor, optional
+            thread executor the models run in, worker threads of asyncio if None.
+            Locations keep their state in this process, so process executors are not supported.
+
+        Returns
+        -------
+        results: dict
+            location name -> results of Location.evaluate()
+        """
+        if executor is not None and executor.kind != "thread":
+            raise ValueError(f"Locations are evaluated in threads of this process, got a {executor.kind} executor")
+        locations = [self[name] for name in readings]
+
+        await asyncio.to_thread(self.refresh)
+        jobs = []
+        for location in locations:
+            if executor is None:
+                jobs.append(asyncio.to_thread(location.evaluate, **readings[location.name]))
+            else:
+                jobs.append(executor.run(location.evaluate, **readings[location.name]))
+        results = await asyncio.gather(*jobs)
+        return dict(zip(readings, results))
+
+    def stats(self) -> dict:
+        """
+        Stats of each location, see Location.stats().
+        """
+        return {location.name: location.stats() for location in self}
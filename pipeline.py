@@ -0,0 +1,232 @@
+"""
+Staged processing of sensor readings: ingest -> evaluate -> display, and ingest -> log.
+Each stage runs as its own task, connected by bounded queues, so a slow BLE write doesn't stall reading
+the sensors and a slow evaluation (e.g. a weather request) doesn't stall the display.
+- evaluate: latest value per device wins, an unprocessed older reading is replaced by a newer one of the same device
+- display: latest value wins
+- log: lossless, every reading in order (the ingest stage waits if the log queue is full)
+Readings never pile up in front of a slow stage, the display always shows the latest evaluated reading:
+the end-to-end latency is bounded by the processing times plus at most one cycle of the slowest stage,
+and the sensors are read at their own rate regardless of the BLE writes.
+Each stage records its latency (waiting in the queue and processing), see Pipeline.stats().
+
+Example:
+    pipeline = Pipeline(hub, evaluate=evaluate, render=render, display=display, log=log)
+    await pipeline.run()
+"""
+
+import asyncio
+import logging
+import time
+from collections import OrderedDict
+
+logger = logging.getLogger(__name__)
+
+
+class LatestValue:
+    def __init__(self):
+        """
+        Queue holding one item, a new item replaces an item that wasn't taken yet (latest value wins).
+        """
+        self.replaced = 0
+        self._item = None
+        self._full = False
+        self._event = asyncio.Event()
+
+    def put(self, item):
+        if self._full:
+            self.replaced += 1
+        self._item = item
+        self._full = True
+        self._event.set()
+
+    async def get(self):
+        while not self._full:
+            self._event.clear()
+            await self._event.wait()
+        item, self._item, self._full = self._item, None, False
+        return item
+
+    def qsize(self) -> int:
+        return int(self._full)
+
+
+class LatestPerKey:
+    def __init__(self):
+        """
+        Queue holding one item per key (e.g. per device), a new item replaces an item of the same key that wasn't taken
+        yet (latest value wins), so readings of one device never replace readings of another device.
+        Keys are served in the order their first waiting item arrived.
+        """
+        self.replaced = 0
+        self._items = OrderedDict()
+        self._event = asyncio.Event()
+
+    def put(self, key, item):
+        if key in self._items:
+            self.replaced += 1
+        # a replaced item keeps its place in the queue
+        self._items[key] = item
+        self._event.set()
+
+    async def get(self):
+        while not self._items:
+            self._event.clear()
+            await self._event.wait()
+        _, item = self._items.popitem(last=False)
+        return item
+
+    def qsize(self) -> int:
+        return len(self._items)
+
+
+class StageMetrics:
+    def __init__(self, name: str):
+        """
+        Latency of a pipeline stage: time waiting in the input queue and time processing, in seconds.
+        """
+        self.name = name
+        self.count = 0
+        self.errors = 0
+        self.wait_total = 0.0
+        self.wait_max = 0.0
+        self.process_total = 0.0
+        self.process_max = 0.0
+        self.process_last = 0.0
+
+    def record(self, wait: float, process: float):
+        self.count += 1
+        self.wait_total += wait
+        self.wait_max = max(self.wait_max, wait)
+        self.process_total += process
+        self.process_max = max(self.process_max, process)
+        self.process_last = process
+
+    def stats(self) -> dict:
+        """
+        Number of processed items / errors and latency in ms (mean / max of waiting and processing).
+        """
+        count = max(self.count, 1)
+        return {
+            "count": self.count,
+            "errors": self.errors,
+            "wait_mean_ms": self.wait_total / count * 1000,
+            "wait_max_ms": self.wait_max * 1000,
+            "process_mean_ms": self.process_total / count * 1000,
+            "process_max_ms": self.process_max * 1000,
+            "process_last_ms": self.process_last * 1000,
+        }
+
+
+class Pipeline:
+    def __init__(self, source, evaluate, render, display, log=None, device: str = None, log_queue_size: int = 1024):
+        """
+        Example:
+        pipeline = Pipeline(hub, evaluate=evaluate, render=render, display=display)
+        await pipeline.run()
+
+        source: ingest.DeviceHub (or another object with async get(device) returning sensors.Reading).
+        evaluate: function(reading) -> results, e.g. PMV / adaptive model / IAQ, run in a worker thread.
+        Or a coroutine function awaited on the event loop, e.g. submitting the models to a comfort_executor.ComfortExecutor.
+        render: function(results) -> (text, category) shown on the display.
+        display: display.DisplayScheduler.
+        log: function(reading) for every reading, e.g. writing the csv log, run in a worker thread. Optional.
+        device: only evaluate and display readings of this device (all readings are logged), None for all devices.
+        Devices are told apart by the source of their readings, e.g. "COM11" (see ingest.DeviceHub).
+        log_queue_size: readings waiting to be logged, ingest waits if the log stage falls behind.
+        """
+        self.source = source
+        self.evaluate = evaluate
+        self._evaluate_async = asyncio.iscoroutinefunction(evaluate)
+        self.render = render
+        self.display = display
+        self.log = log
+        self.device = device
+
+        self.metrics = {name: StageMetrics(name) for name in ("ingest", "evaluate", "display", "log")}
+        self.end_to_end = StageMetrics("end_to_end")
+        self._evaluate_queue = LatestPerKey()
+        self._display_queue = LatestValue()
+        self._log_queue = asyncio.Queue(maxsize=log_queue_size)
+
+    async def run(self):
+        """
+        Run all stages until cancelled or a stage fails.
+        """
+        stages = [self._ingest(), self._evaluate(), self._display()]
+        if self.log is not None:
+            stages.append(self._log())
+        tasks = [asyncio.create_task(stage) for stage in stages]
+        try:
+            await asyncio.gather(*tasks)
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    def stats(self) -> dict:
+        """
+        Latency per stage and end to end (sensor reading received -> display), readings replaced by newer ones.
+        """
+        stats = {name: metrics.stats() for name, metrics in self.metrics.items()}
+        stats["end_to_end"] = self.end_to_end.stats()
+        stats["replaced"] = {"evaluate": self._evaluate_queue.replaced, "display": self._display_queue.replaced}
+        stats["log_queued"] = self._log_queue.qsize()
+        return stats
+
+    async def _ingest(self):
+        metrics = self.metrics["ingest"]
+        while True:
+            start = time.perf_counter()
+            reading = await self.source.get()
+            received = time.perf_counter()
+            if self.log is not None:
+                await self._log_queue.put((reading, received))
+            if self.device is None or reading.source == self.device:
+                self._evaluate_queue.put(reading.source, (reading, received, time.perf_counter()))
+            metrics.record(received - start, time.perf_counter() - received)
+
+    async def _evaluate(self):
+        metrics = self.metrics["evaluate"]
+        while True:
+            reading, received, queued = await self._evaluate_queue.get()
+            start = time.perf_counter()
+            try:
+                if self._evaluate_async:
+                    results = await self.evaluate(reading)
+                else:
+                    results = await asyncio.to_thread(self.evaluate, reading)
+            except Exception as e:
+                metrics.errors += 1
+                logger.error(f"Evaluating reading of {reading.source or reading.device} failed: {e}")
+                continue
+            self._display_queue.put((results, received, time.perf_counter()))
+            metrics.record(start - queued, time.perf_counter() - start)
+
+    async def _display(self):
+        metrics = self.metrics["display"]
+        while True:
+            results, received, queued = await self._display_queue.get()
+            start = time.perf_counter()
+            try:
+                text, category = self.render(results)
+                await self.display.show(text, category=category)
+            except Exception as e:
+                metrics.errors += 1
+                logger.error(f"Displaying results failed: {e}")
+                continue
+            end = time.perf_counter()
+            metrics.record(start - queued, end - start)
+            self.end_to_end.record(0.0, end - received)
+
+    async def _log(self):
+        metrics = self.metrics["log"]
+        while True:
+            reading, queued = await self._log_queue.get()
+            start = time.perf_counter()
+            try:
+                await asyncio.to_thread(self.log, reading)
+            except Exception as e:
+                metrics.errors += 1
+                logger.error(f"Logging reading of {reading.source or reading.device} failed: {e}")
+            metrics.record(start - queued, time.perf_counter() - start)
@@ -0,0 +1,181 @@
+"""
+Buffered csv log for sensor data, replaces opening the csv file for every row.
+Rows are kept in memory and written in batches, when enough rows are buffered, after a time interval or when closed.
+Each batch is first saved in a write-ahead file, so a crash while writing doesn't leave a partial batch
+in the csv file: it's completed when the log is opened again. At most the rows of one flush interval are lost.
+"""
+
+import io
+import json
+import logging
+import os
+import threading
+import time
+from csv import writer
+from datetime import datetime
+
+logger = logging.getLogger(__name__)
+
+# last line of a complete write-ahead file
+_WAL_END = "#END\n"
+
+
+class SensorLogWriter:
+    def __init__(
+        self,
+        filename: str = "test",
+        max_rows: int = 60,
+        max_interval: float = 60.0,
+        max_buffer: int = 3600,
+        rotate_daily: bool = False,
+    ):
+        """
+        Example:
+        log = SensorLogWriter(filename="office", max_rows=60, max_interval=60)
+        log.write([datetime.now(), "BME280", 22.1, 41.2, 1002.5])
+        log.close()
+
+        filename: csv file name without extension, "{filename}.csv"
+        or "{filename}_{date}.csv" if rotate_daily (date of the row).
+        max_rows / max_interval: write buffered rows when this number of rows or this time in seconds is reached.
+        max_buffer: maximum number of rows kept while writing fails, the oldest rows are dropped beyond that.
+        """
+        self.filename = filename
+        self.max_rows = max_rows
+        self.max_interval = max_interval
+        self.max_buffer = max_buffer
+        self.rotate_daily = rotate_daily
+        self.wal_file = f"{filename}.wal"
+
+        # counters
+        self.rows_written = 0
+        self.rows_dropped = 0
+        self.flushes = 0
+        self.flush_failures = 0
+
+        self._rows = []
+        self._last_flush = time.monotonic()
+        self._lock = threading.Lock()
+        self._closed = threading.Event()
+
+        self.recover()
+        # write buffered rows after max_interval even if no new rows arrive
+        self._flusher = threading.Thread(target=self._flush_periodically, name="sensor-log-flush", daemon=True)
+        self._flusher.start()
+
+    def write(self, row: list):
+        """
+        Add a row, written with the next flush.
+        """
+        with self._lock:
+            self._rows.append(row)
+            if len(self._rows) > self.max_buffer:
+                del self._rows[0]
+                self.rows_dropped += 1
+            due = len(self._rows) >= self.max_rows or time.monotonic() - self._last_flush >= self.max_interval
+        if due:
+            self.flush()
+
+    def flush(self) -> bool:
+        """
+        Write all buffered rows, returns False if writing failed (rows are kept for the next try).
+        """
+        with self._lock:
+            self._last_flush = time.monotonic()
+            if not self._rows:
+                return True
+            # rows per csv file, split at day change if rotating daily (rows are in chronological order)
+            batches = {}
+            for row in self._rows:
+                batches.setdefault(self._file_name(row), []).append(row)
+            written = 0
+            try:
+                for file_name, rows in batches.items():
+                    self._write_batch(file_name, rows)
+                    written += len(rows)
+            except OSError as e:
+                self.flush_failures += 1
+                logger.error(f"Saving data failed, try next time again... ({e})")
+                return False
+            finally:
+                self.rows_written += written
+                self._rows = self._rows[written:]
+            self.flushes += 1
+            return True
+
+    def close(self):
+        """
+        Write buffered rows and stop the periodic flush.
+        """
+        self._closed.set()
+        self.flush()
+
+    def stats(self) -> dict:
+        """
+        Counters of buffered / written / dropped rows and flushes.
+        """
+        return {
+            "rows_buffered": len(self._rows),
+            "rows_written": self.rows_written,
+            "rows_dropped": self.rows_dropped,
+            "flushes": self.flushes,
+            "flush_failures": self.flush_failures,
+        }
+
+    def recover(self):
+        """
+        Complete a batch interrupted by a crash, using the write-ahead file.
+        """
+        try:
+            with open(self.wal_file, "r", newline="") as f:
+                header = f.readline()
+                content = f.read()
+        except FileNotFoundError:
+            return
+        except OSError as e:
+            logger.error(f"Reading write-ahead file {self.wal_file} failed: {e}")
+            return
+
+        if content.endswith(_WAL_END):
+            wal = json.loads(header)
+            # remove a partially written batch, then write it again completely
+            with open(wal["file"], "a+", newline="") as f:
+                f.truncate(wal["size"])
+                f.write(content[: -len(_WAL_END)])
+                f.flush()
+                os.fsync(f.fileno())
+            logger.info(f"Recovered {wal['rows']} rows in {wal['file']}")
+        # an incomplete write-ahead file means the csv file wasn't touched yet
+        os.remove(self.wal_file)
+
+    def _file_name(self, row: list) -> str:
+        if not self.rotate_daily:
+            return f"{self.filename}.csv"
+        day = row[0] if isinstance(row[0], datetime) else datetime.now()
+        return f"{self.filename}_{day:%Y-%m-%d}.csv"
+
+    def _write_batch(self, file_name: str, rows: list):
+        text = io.StringIO(newline="")
+        writer(text).writerows(rows)
+        text = text.getvalue()
+        size = os.path.getsize(file_name) if os.path.exists(file_name) else 0
+
+        # 1) write-ahead file
+        with open(self.wal_file, "w", newline="") as f:
+            f.write(json.dumps({"file": file_name, "size": size, "rows": len(rows)}) + "\n")
+            f.write(text)
+            f.write(_WAL_END)
+            f.flush()
+            os.fsync(f.fileno())
+        # 2) csv file
+        with open(file_name, "a", newline="") as f:
+            f.write(text)
+            f.flush()
+            os.fsync(f.fileno())
+        # 3) batch complete
+        os.remove(self.wal_file)
+
+    def _flush_periodically(self):
+        while not self._closed.wait(self.max_interval):
+            if time.monotonic() - self._last_flush >= self.max_interval:
+                self.flush()
@@ -0,0 +1,447 @@
+"""
+Columnar store for the sensor history, so dashboards and reports don't need to parse csv logs.
+Readings are appended per device and day to one fixed-width binary file per column, read back with
+memory mapping. Rollups (mean / min / max / count per column) for 1 min, 15 min and 1 hour are updated with each write.
+
+Layout:
+    {root}/schema.json                                  columns of the store
+    {root}/raw/{device}/{YYYY-MM-DD}/time.bin           int64, ms since 1970-01-01 (local time like the csv log)
+    {root}/raw/{device}/{YYYY-MM-DD}/{column}.bin       float32, NaN if not measured
+    {root}/{tier}/{device}/{YYYY-MM-DD}.npy             rollup of the day, tier: 1min, 15min, 1h
+
+Example:
+    from sensor_store import SensorStore
+    store = SensorStore("sensor_store")
+    store.append(datetime.now(), {"BME280_Temperature": 22.1, "SCD30_CO2": 812.0}, device="ieq_epaper_v")
+    store.flush()
+    data = store.query("2025-01-01", "2025-02-01", ["SCD30_CO2"], device="ieq_epaper_v", tier="15min")
+    data["time"], data["SCD30_CO2_mean"]
+
+Recorded data is evaluated without loading it into memory at once with SensorStore.scan(),
+csv logs are converted with import_csv().
+"""
+
+import glob
+import json
+import logging
+import os
+import threading
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# columns of a new store, named like the DataFrame columns of serial_reader.read_sensor_log()
+default_columns = [
+    "BME280_Temperature",
+    "BME280_Humidity",
+    "BME280_Pressure",
+    "SCD30_Temperature",
+    "SCD30_Humidity",
+    "SCD30_CO2",
+]
+# rollup tiers: bucket width in ms
+rollup_tiers = {"1min": 60_000, "15min": 900_000, "1h": 3_600_000}
+# rollup statistics per column
+rollup_stats = ("mean", "min", "max", "count")
+
+_TIME_DTYPE = np.dtype("<i8")
+_VALUE_DTYPE = np.dtype("<f4")
+_DAY_MS = 86_400_000
+_SCHEMA_VERSION = 1
+
+
+class SensorStore:
+    def __init__(self, root: str = "sensor_store", columns: list = None, max_rows: int = 60):
+        """
+        Example:
+        store = SensorStore("sensor_store")
+        store.append(datetime.now(), {"BME280_Temperature": 22.1}, device="office")
+
+        root: folder of the store, created if it doesn't exist.
+        columns: value columns of a new store (default_columns), an existing store keeps its columns.
+        max_rows: buffered readings are written when this number is reached (or with flush() / close()).
+        """
+        self.root = root
+        self.max_rows = max_rows
+        self.columns = self._load_schema(columns)
+        self.rollup_dtype = np.dtype(
+            [("time", "<M8[ms]")]
+            + [(f"{column}_{stat}", "<i4" if stat == "count" else "<f4") for column in self.columns for stat in rollup_stats]
+        )
+
+        # counters
+        self.rows_written = 0
+        self.rows_out_of_order = 0
+
+        self._buffer = []  # (device, time in ms, values)
+        self._lock = threading.RLock()
+
+    def append(self, time, values: dict, device: str = "default"):
+        """
+        Add a reading, written with the next flush. Values of unknown columns are ignored, missing ones are NaN.
+        """
+        row = [values.get(column, np.nan) for column in self.columns]
+        with self._lock:
+            self._buffer.append((device, _as_ms(time), row))
+            if len(self._buffer) >= self.max_rows:
+                self.flush()
+
+    def append_many(self, time, values: dict, device: str = "default"):
+        """
+        Write arrays of readings of one device directly, e.g. when importing recorded data.
+
+        Parameters
+        ----------
+        time: array-like
+            timestamps (datetime64, datetime or str)
+        values: dict
+            column name: array-like of the same length as time
+        """
+        time = np.asarray(time, dtype="datetime64[ms]").astype(_TIME_DTYPE)
+        block = np.full((len(time), len(self.columns)), np.nan, dtype=_VALUE_DTYPE)
+        for i, column in enumerate(self.columns):
+            if column in values:
+                block[:, i] = np.asarray(values[column], dtype=_VALUE_DTYPE)
+        with self._lock:
+            self._write(device, time, block)
+
+    def flush(self):
+        """
+        Write buffered readings.
+        """
+        with self._lock:
+            buffer, self._buffer = self._buffer, []
+            for device in dict.fromkeys(row[0] for row in buffer):
+                rows = [row for row in buffer if row[0] == device]
+                time = np.array([row[1] for row in rows], dtype=_TIME_DTYPE)
+                block = np.array([row[2] for row in rows], dtype=_VALUE_DTYPE)
+                self._write(device, time, block)
+
+    def close(self):
+        """
+        Write buffered readings.
+        """
+        self.flush()
+
+    def devices(self) -> list:
+        """
+        Devices with recorded data.
+        """
+        raw = os.path.join(self.root, "raw")
+        return sorted(os.listdir(raw)) if os.path.isdir(raw) else []
+
+    def days(self, device: str = "default", start=None, end=None) -> list:
+        """
+        Days (YYYY-MM-DD) with recorded data of a device, optionally only days overlapping [start, end).
+        """
+        folder = os.path.join(self.root, "raw", device)
+        days = sorted(os.listdir(folder)) if os.path.isdir(folder) else []
+        if start is not None:
+            first = str(np.datetime64(_as_ms(start), "ms").astype("datetime64[D]"))
+            days = [day for day in days if day >= first]
+        if end is not None:
+            end_ms = _as_ms(end)
+            days = [day for day in days if _as_ms(np.datetime64(day)) < end_ms]
+        return days
+
+    def segment(self, device: str, day: str, columns: list = None) -> dict:
+        """
+        Raw readings of a device on a day as read-only memory-mapped arrays (no copy).
+
+        Returns
+        -------
+        segment: dict
+            "time": datetime64[ms] array, column name: float32 array (all columns if columns is None)
+        """
+        columns = self.columns if columns is None else columns
+        folder = self._segment_folder(device, day)
+        rows = self._segment_rows(folder)
+        segment = {"time": _memmap(os.path.join(folder, "time.bin"), _TIME_DTYPE, rows).view("datetime64[ms]")}
+        for column in columns:
+            segment[column] = _memmap(os.path.join(folder, f"{column}.bin"), _VALUE_DTYPE, rows)
+        return segment
+
+    def scan(self, start, end, columns: list = None, devices: list = None, chunk_rows: int = None):
+        """
+        Raw readings in the time range [start, end) as zero-copy views of the memory-mapped segments,
+        chunk by chunk, so memory use is bounded by the chunk and not by the size of the store.
+        The views can be passed directly to the batch functions, e.g. air_quality.iaq_co2() or
+        thermal_comfort.thermal_comfort_pmvppd_batch().
+
+        Parameters
+        ----------
+        start, end: datetime, datetime64 or str
+            time range
+        columns: list
+            value columns, all columns if None
+        devices: list
+            devices to read, all devices if None
+        chunk_rows: int
+            maximum number of readings per chunk, one chunk per device and day if None
+
+        Yields
+        ------
+        chunk: dict
+            "device": device name, "time": datetime64[ms] array, column name: float32 array (read-only)
+
+        Examples
+        --------
+        >>> from air_quality import iaq_co2
+        >>> for chunk in store.scan("2025-01-01", "2025-04-01", ["SCD30_CO2"], devices=["office"]):
+        ...     indices = iaq_co2(chunk["SCD30_CO2"], standard="EN")["indices"]
+        """
+        columns = self.columns if columns is None else list(columns)
+        unknown = set(columns) - set(self.columns)
+        if unknown:
+            raise ValueError(f"Unknown columns: {sorted(unknown)}")
+        devices = self.devices() if devices is None else devices
+
+        start_ms, end_ms = _as_ms(start), _as_ms(end)
+        for device in devices:
+            for day in self.days(device, start, end):
+                segment = self.segment(device, day, columns)
+                first, last = np.searchsorted(segment["time"].view(_TIME_DTYPE), [start_ms, end_ms], side="left")
+                step = last - first if chunk_rows is None else chunk_rows
+                for i in range(first, last, max(step, 1)):
+                    chunk = {"device": device}
+                    for field in ["time"] + columns:
+                        chunk[field] = segment[field][i : min(i + step, last)]
+                    yield chunk
+
+    def query(self, start, end, columns: list = None, device: str = "default", tier: str = "raw") -> dict:
+        """
+        Readings of a device in the time range [start, end) as arrays.
+
+        Parameters
+        ----------
+        start, end: datetime, datetime64 or str
+            time range
+        columns: list
+            value columns, all columns if None
+        tier: str
+            "raw" for the recorded readings, or a rollup tier of rollup_tiers ("1min", "15min", "1h")
+
+        Returns
+        -------
+        data: dict
+            "time": datetime64[ms] array (start of the bucket for rollups),
+            raw: column name: float32 array,
+            rollups: f"{column}_{stat}" for stat in rollup_stats ("mean", "min", "max": float32, "count": int32)
+        """
+        columns = self.columns if columns is None else columns
+        unknown = set(columns) - set(self.columns)
+        if unknown:
+            raise ValueError(f"Unknown columns: {sorted(unknown)}")
+        if tier == "raw":
+            fields = ["time"] + list(columns)
+        elif tier in rollup_tiers:
+            fields = ["time"] + [f"{column}_{stat}" for column in columns for stat in rollup_stats]
+        else:
+            raise ValueError(f"Unknown tier {tier}, use 'raw' or one of {list(rollup_tiers)}")
+
+        start_ms, end_ms = _as_ms(start), _as_ms(end)
+        parts = {field: [] for field in fields}
+        for day in self.days(device, start, end):
+            data = self.segment(device, day, columns) if tier == "raw" else self._rollup_file(tier, device, day)
+            time = data["time"].view(_TIME_DTYPE)
+            first, last = np.searchsorted(time, [start_ms, end_ms], side="left")
+            for field in fields:
+                parts[field].append(data[field][first:last])
+
+        result = {}
+        for field in fields:
+            if parts[field]:
+                result[field] = np.concatenate(parts[field])
+            else:
+                result[field] = np.empty(0, dtype="<M8[ms]" if field == "time" else self._field_dtype(field, tier))
+        return result
+
+    def _write(self, device: str, time: np.ndarray, block: np.ndarray):
+        if len(time) == 0:
+            return
+        order = np.argsort(time, kind="stable")
+        time, block = time[order], block[order]
+
+        for day_number in np.unique(time // _DAY_MS):
+            in_day = (time // _DAY_MS) == day_number
+            day = str(np.datetime64(int(day_number), "D"))
+            day_time, day_block = time[in_day], block[in_day]
+
+            # read without memory mapping: mapped files can't be truncated / appended on Windows
+            folder = self._segment_folder(device, day)
+            rows = self._segment_rows(folder)
+            last_ms = _read_row(os.path.join(folder, "time.bin"), _TIME_DTYPE, rows - 1) if rows else None
+            # segments are sorted by time, older readings than the last one written can't be appended
+            if last_ms is not None and day_time[0] < last_ms:
+                keep = day_time >= last_ms
+                self.rows_out_of_order += int(np.count_nonzero(~keep))
+                logger.warning(f"{device} {day}: {np.count_nonzero(~keep)} readings older than stored data dropped")
+                day_time, day_block = day_time[keep], day_block[keep]
+                if len(day_time) == 0:
+                    continue
+
+            os.makedirs(folder, exist_ok=True)
+            self._truncate_segment(folder, rows)
+            with open(os.path.join(folder, "time.bin"), "ab") as f:
+                day_time.astype(_TIME_DTYPE).tofile(f)
+            for i, column in enumerate(self.columns):
+                with open(os.path.join(folder, f"{column}.bin"), "ab") as f:
+                    np.ascontiguousarray(day_block[:, i], dtype=_VALUE_DTYPE).tofile(f)
+            self.rows_written += len(day_time)
+
+            # mapped once for all tiers, released before the segment is written again
+            raw = self.segment(device, day)
+            for tier in rollup_tiers:
+                self._update_rollup(tier, device, day, int(day_time[0]), raw)
+            del raw
+
+    def _segment_rows(self, folder: str) -> int:
+        """
+        Number of complete rows of a segment.
+        """
+        sizes = [_file_rows(os.path.join(folder, "time.bin"), _TIME_DTYPE)]
+        for column in self.columns:
+            sizes.append(_file_rows(os.path.join(folder, f"{column}.bin"), _VALUE_DTYPE))
+        # a write interrupted by a crash can leave columns of different length, use complete rows only
+        return min(sizes)
+
+    def _truncate_segment(self, folder: str, rows: int):
+        """
+        Remove incomplete rows of an interrupted write, so the columns stay aligned.
+        """
+        for name, dtype in [("time", _TIME_DTYPE)] + [(column, _VALUE_DTYPE) for column in self.columns]:
+            file_name = os.path.join(folder, f"{name}.bin")
+            if os.path.exists(file_name) and os.path.getsize(file_name) > rows * dtype.itemsize:
+                os.truncate(file_name, rows * dtype.itemsize)
+
+    def _update_rollup(self, tier: str, device: str, day: str, first_new_ms: int, raw: dict):
+        """
+        Recompute the rollup of a day from the bucket of the first new reading on, raw: segment of the day.
+        """
+        width = rollup_tiers[tier]
+        # read into memory, not memory-mapped: a mapped file can't be replaced on Windows (rollups are small)
+        old = self._rollup_file(tier, device, day, mmap_mode=None)
+        # the last bucket stored can be incomplete, new readings are never older than it
+        since = int(old["time"][-1].astype(_TIME_DTYPE)) if len(old) else first_new_ms // width * width
+        keep = old[old["time"].astype(_TIME_DTYPE) < since]
+
+        time = raw["time"].view(_TIME_DTYPE)
+        first = np.searchsorted(time, since, side="left")
+        new = _rollup(time[first:], {column: raw[column][first:] for column in self.columns}, width, self.rollup_dtype)
+
+        file_name = self._rollup_path(tier, device, day)
+        os.makedirs(os.path.dirname(file_name), exist_ok=True)
+        with open(file_name + ".tmp", "wb") as f:
+            np.save(f, np.concatenate([keep, new]))
+        os.replace(file_name + ".tmp", file_name)
+
+    def _rollup_file(self, tier: str, device: str, day: str, mmap_mode: str = "r") -> np.ndarray:
+        file_name = self._rollup_path(tier, device, day)
+        if not os.path.exists(file_name):
+            return np.empty(0, dtype=self.rollup_dtype)
+        return np.load(file_name, mmap_mode=mmap_mode)
+
+    def _rollup_path(self, tier: str, device: str, day: str) -> str:
+        return os.path.join(self.root, tier, device, f"{day}.npy")
+
+    def _segment_folder(self, device: str, day: str) -> str:
+        return os.path.join(self.root, "raw", device, day)
+
+    def _field_dtype(self, field: str, tier: str) -> np.dtype:
+        return _VALUE_DTYPE if tier == "raw" else self.rollup_dtype[field]
+
+    def _load_schema(self, columns: list) -> list:
+        file_name = os.path.join(self.root, "schema.json")
+        if os.path.exists(file_name):
+            with open(file_name, "r") as f:
+                schema = json.load(f)
+            if columns is not None and list(columns) != schema["columns"]:
+                raise ValueError(f"Store {self.root} has the columns {schema['columns']}, not {list(columns)}")
+            return schema["columns"]
+
+        columns = list(default_columns if columns is None else columns)
+        os.makedirs(self.root, exist_ok=True)
+        with open(file_name, "w") as f:
+            json.dump({"version": _SCHEMA_VERSION, "columns": columns}, f, indent=2)
+        return columns
+
+
+def import_csv(store: SensorStore, file_name: str, device: str = "default") -> int:
+    """
+    Import csv logs saved by serial_reader.microcontroller.get_data() (save=True) into a store, one file at a time.
+
+    Parameters
+    ----------
+    store: SensorStore
+        store to write to
+    file_name: str
+        csv file or pattern for the daily files, e.g. "test_*.csv"
+    device: str
+        device name of the readings in the store
+
+    Returns
+    -------
+    rows: int
+        number of imported readings
+    """
+    from serial_reader import read_sensor_log
+
+    rows = 0
+    for file in sorted(glob.glob(file_name)) or [file_name]:
+        log = read_sensor_log(file)
+        store.append_many(
+            log["time"].to_numpy(dtype="datetime64[ms]"),
+            {column: log[column].to_numpy() for column in log.columns if column != "time"},
+            device=device,
+        )
+        rows += len(log)
+        logger.info(f"Imported {len(log)} readings from {file}")
+    return rows
+
+
+def _rollup(time: np.ndarray, values: dict, width: int, dtype: np.dtype) -> np.ndarray:
+    """
+    Mean / min / max / count of values per time bucket of width ms, NaN values are not counted.
+    """
+    if len(time) == 0:
+        return np.empty(0, dtype=dtype)
+    bucket = time // width * width
+    starts = np.flatnonzero(np.concatenate([[True], bucket[1:] != bucket[:-1]]))
+
+    rollup = np.empty(len(starts), dtype=dtype)
+    rollup["time"] = bucket[starts].view("datetime64[ms]")
+    for column, x in values.items():
+        x = np.asarray(x, dtype=np.float64)
+        valid = ~np.isnan(x)
+        count = np.add.reduceat(valid.astype(np.int32), starts)
+        total = np.add.reduceat(np.where(valid, x, 0.0), starts)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            rollup[f"{column}_mean"] = total / count
+        rollup[f"{column}_min"] = np.fmin.reduceat(x, starts)
+        rollup[f"{column}_max"] = np.fmax.reduceat(x, starts)
+        rollup[f"{column}_count"] = count
+    return rollup
+
+
+def _as_ms(time) -> int:
+    """
+    Timestamp (datetime, datetime64, pandas Timestamp or str) as ms since 1970-01-01.
+    """
+    return int(np.datetime64(time, "ms").astype(_TIME_DTYPE))
+
+
+def _file_rows(file_name: str, dtype: np.dtype) -> int:
+    return os.path.getsize(file_name) // dtype.itemsize if os.path.exists(file_name) else 0
+
+
+def _read_row(file_name: str, dtype: np.dtype, row: int):
+    # single value of a column file, without mapping the file
+    return np.fromfile(file_name, dtype=dtype, count=1, offset=row * dtype.itemsize)[0]
+
+
+def _memmap(file_name: str, dtype: np.dtype, rows: int) -> np.ndarray:
+    # numpy can't map empty files
+    if rows == 0:
+        return np.empty(0, dtype=dtype)
+    return np.memmap(file_name, dtype=dtype, mode="r", shape=(rows,))
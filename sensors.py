@@ -0,0 +1,151 @@
+"""
+Registry of supported sensors, used to decode the readings of the microcontroller (JSON or binary frame),
+for the csv log and for the display. A new sensor only needs register(Sensor(...)) here.
+
+Each sensor field gets a fixed slot in the reading record, named "{sensor}_{field}" like the csv / store columns.
+The registry is compiled into a dispatch table keyed by sensor name, so decoding a reading is one
+dict lookup per sensor plus copying its values into the preallocated record.
+
+Example:
+    from sensors import decode_reading
+    reading = decode_reading(value_read_dict)  # data structure of serial_reader.microcontroller.get_data()
+    reading.get("SCD30", "CO2")
+"""
+
+import math
+
+# sensor name: Sensor
+sensors = {}
+# slot names of the reading record, "{sensor}_{field}"
+slots = []
+# slot name: position in the reading record
+slot_index = {}
+# binary frames: bit of the sensor mask: Sensor
+frame_bits = {}
+
+# sensor name: ((payload field, slot position), ...), compiled by register()
+_dispatch = {}
+# reading record without values, copied for each reading
+_empty_record = []
+
+
+class Sensor:
+    def __init__(self, name: str, fields: list, log_fields: list = None, frame_bit: int = None):
+        """
+        Example:
+        Sensor("SCD30", ["Temperature", "Humidity", "CO2"], frame_bit=1)
+
+        name: sensor name in the readings ("Sensor").
+        fields: measured values in the readings ("Value"), also the float32 values of binary frames in this order.
+        log_fields: values saved in the csv log, all fields if None.
+        frame_bit: bit of the sensor mask in binary frames (see serial_reader.FrameDecoder), None if not supported.
+        """
+        self.name = name
+        self.fields = list(fields)
+        self.log_fields = self.fields if log_fields is None else list(log_fields)
+        self.frame_bit = frame_bit
+
+
+class Reading:
+    __slots__ = ("device", "location", "time", "sensors", "values", "source")
+
+    def __init__(self, device: str, location: str, time, sensors: list, values: list, source: str = None):
+        """
+        Decoded reading of a device, see decode_reading().
+        sensors: sensor names in the reading, in the order of the data.
+        values: reading record, one value per slot (NaN if not measured).
+        source: name of the port / stream the reading was received from (see ingest.DeviceHub), None if unknown.
+        "Device" is hard-coded in each sketch, so identical boxes are only told apart by their source.
+        """
+        self.device = device
+        self.location = location
+        self.time = time
+        self.sensors = sensors
+        self.values = values
+        self.source = source
+
+    def get(self, sensor: str, field: str, default: float = math.nan) -> float:
+        """
+        Value of a sensor field, default if it's not in the reading.
+        """
+        value = self.values[slot_index[f"{sensor}_{field}"]]
+        return default if value != value else value
+
+    def slot_values(self) -> dict:
+        """
+        Measured values by slot name, e.g. {"SCD30_CO2": 1568.18} (for sensor_store.SensorStore.append()).
+        """
+        return {slot: value for slot, value in zip(slots, self.values) if value == value}
+
+    def log_row(self) -> list:
+        """
+        Sensor names and values as saved in the csv log, e.g. ["BME280", 22.1, 41.2, 1002.5, "SCD30", ...]
+        """
+        row = []
+        for name in self.sensors:
+            row.append(name)
+            row += [self.values[slot_index[f"{name}_{field}"]] for field in sensors[name].log_fields]
+        return row
+
+
+def register(sensor: Sensor):
+    """
+    Add a sensor to the registry (or replace one with the same name) and compile the dispatch table.
+    """
+    if sensor.frame_bit is not None and frame_bits.get(sensor.frame_bit, sensor).name != sensor.name:
+        raise ValueError(f"Frame bit {sensor.frame_bit} already used by {frame_bits[sensor.frame_bit].name}")
+    sensors[sensor.name] = sensor
+    for field in sensor.fields:
+        slot = f"{sensor.name}_{field}"
+        if slot not in slot_index:
+            slot_index[slot] = len(slots)
+            slots.append(slot)
+            _empty_record.append(math.nan)
+    if sensor.frame_bit is not None:
+        frame_bits[sensor.frame_bit] = sensor
+    _dispatch[sensor.name] = tuple((field, slot_index[f"{sensor.name}_{field}"]) for field in sensor.fields)
+
+
+def decode_reading(value_read_dict: dict, time=None) -> Reading:
+    """
+    Decode a reading of the microcontroller into a reading record.
+
+    Parameters
+    ----------
+    value_read_dict: dict
+        reading in the data structure of serial_reader.microcontroller.get_data()
+    time: optional
+        time of the reading on the host, e.g. datetime.now()
+
+    Returns
+    -------
+    reading: Reading
+        values of all sensors in their fixed slots, raises ValueError for unknown sensors
+    """
+    values = _empty_record.copy()
+    names = []
+    for data in value_read_dict["Data"]:
+        name = data["Sensor"]
+        fields = _dispatch.get(name)
+        if fields is None:
+            raise ValueError(f"Sensor type unknown: {name}")
+        payload = data["Value"]
+        for field, slot in fields:
+            value = payload.get(field)
+            if value is not None:
+                values[slot] = value
+        names.append(name)
+    return Reading(value_read_dict.get("Device", "default"), value_read_dict.get("Location"), time, names, values)
+
+
+# Bosch BME280: air temperature [°C], relative humidity [%], air pressure [hPa], approx. altitude [m]
+register(Sensor("BME280", ["Temperature", "Humidity", "Pressure", "Approx. Altitude"],
+                log_fields=["Temperature", "Humidity", "Pressure"], frame_bit=0))
+# Sensirion SCD30: CO2 concentration [ppm], air temperature [°C], relative humidity [%]
+register(Sensor("SCD30", ["Temperature", "Humidity", "CO2"], frame_bit=1))
+# Sensirion SCD40: CO2 concentration [ppm], air temperature [°C], relative humidity [%]
+register(Sensor("SCD40", ["Temperature", "Humidity", "CO2"], frame_bit=2))
+# Vishay VEML7700: illuminance [lx]
+register(Sensor("VEML7700", ["Illuminance"], frame_bit=3))
+# Sensirion SGP40: VOC index [1 - 500] and raw signal [ticks]
+register(Sensor("SGP40", ["VOC Index", "Raw"], frame_bit=4))
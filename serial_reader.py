@@ -1,114 +1,474 @@
-import serial
-import serial.tools.list_ports
-import json
-from csv import writer
-from datetime import datetime
-import asyncio
-import logging
-
-logging.basicConfig(level=logging.INFO)
-logger = logging.getLogger(__name__)
-
-
-class microcontroller():
-    def __init__(self, serial_port: str, baud_rate: int, sensors: list, filename: str = "test", save: bool = False):
-        """
-        Example:
-        mc = microcontroller(
-            serial_port=serial_port,
-            baud_rate=baud_rate,
-            sensors=["BME280", "SCD30"],
-        )
-        """
-        self.mc = serial.Serial(serial_port, baud_rate, timeout=1)
-        self.sensors = sensors
-        self.filename = filename
-        self.save = save
-
-    def get_data(self):
-        """
-        Read data from serial port in JSON format, return dict.
-        Save data as csv (optional, if save is True)
-        -------------------------
-        data structure example:
-            {
-              "Device": "ieq_epaper_v",
-              "Time": 11847,
-              "Location": "office",
-              "Data": [
-                {
-                  "Sensor": "BME280",
-                  "Value": {
-                    "Temperature": 0,
-                    "Humidity": 0,
-                    "Pressure": 0,
-                    "Approx. Altitude": 0
-                  }
-                },
-                {
-                  "Sensor": "SCD30",
-                  "Value": {
-                    "Temperature": 22.54,
-                    "Humidity": 42.45,
-                    "CO2": 1568.18
-                  }
-                }
-              ]
-            }
-        """
-
-        # read serial data
-        value_read = self.mc.readline()  # type bytes
-
-        logger.debug("---check----")
-        logger.debug(value_read)
-        logger.debug(len(value_read))
-        logger.debug("-------")
-
-        value_read_dict = {}
-
-        if len(value_read) < 80:
-            pass
-        else:
-            value_read_deco = value_read.decode("utf-8").strip()
-            value_read_dict = json.loads(value_read_deco)
-
-            # update time
-            now = datetime.now()
-            new_row = [now]
-
-            for i in range(0, len(self.sensors)):
-                if value_read_dict["Data"][i]["Sensor"] == "BME280":
-                    new_row.append(value_read_dict["Data"][i]["Sensor"])
-                    new_row.append(value_read_dict["Data"][i]["Value"]["Temperature"])
-                    new_row.append(value_read_dict["Data"][i]["Value"]["Humidity"])
-                    new_row.append(value_read_dict["Data"][i]["Value"]["Pressure"])
-                elif value_read_dict["Data"][i]["Sensor"] == "SCD30":
-                    new_row.append(value_read_dict["Data"][i]["Sensor"])
-                    new_row.append(value_read_dict["Data"][i]["Value"]["Temperature"])
-                    new_row.append(value_read_dict["Data"][i]["Value"]["Humidity"])
-                    new_row.append(value_read_dict["Data"][i]["Value"]["CO2"])
-                # TODO: supports other sensors like SCD40, VEML7700, SGP40...
-                else:
-                    raise Exception("Sensor type unknow!")
-
-            logger.info(new_row)
-
-            if self.save is True:
-                try:
-                    append_list_as_row(f"{self.filename}.csv", new_row)
-                    logger.debug(f"{self.filename}: data saved!")
-                except:
-                    logger.error("Saving data failed, try next time again...")
-
-        return value_read_dict
-
-
-def append_list_as_row(file_name: str, list_of_elem: list):
-    # Open file in append mode
-    with open(file_name, "a+", newline="") as write_obj:
-        # Create a writer object from csv module
-        csv_writer = writer(write_obj)
-        # Add contents of list as last row in the csv file
-        csv_writer.writerow(list_of_elem)
-
+import serial
+import serial.tools.list_ports
+import json
+import struct
+import binascii
+import glob
+from datetime import datetime
+import asyncio
+import concurrent.futures
+import logging
+import threading
+import warnings
+from collections import deque
+from lazy_import import lazy_import
+from sensor_log import SensorLogWriter
+from sensor_store import SensorStore
+from sensors import decode_reading, frame_bits
+from sensors import sensors as sensor_types
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# only needed to read saved data, imported on first use
+pd = lazy_import("pandas")
+
+# supported sensors, fields saved in csv and binary frame layout: see sensors.py
+
+# binary frames: device number: device name, same as device_number / device_id in the Arduino sketches
+frame_devices = {
+    1: "co2_box",
+    2: "co2_box_epaper_v",
+}
+FRAME_SYNC = b"\xa5\x5a"
+FRAME_VERSION = 1
+_FRAME_HEADER = struct.Struct("<2sBHIB")
+_FRAME_CRC = struct.Struct("<H")
+
+
+class microcontroller():
+    def __init__(
+        self,
+        serial_port: str,
+        baud_rate: int,
+        sensors: list = None,
+        filename: str = "test",
+        save: bool = False,
+        store: SensorStore = None,
+    ):
+        """
+        Example:
+        mc = microcontroller(
+            serial_port=serial_port,
+            baud_rate=baud_rate,
+        )
+
+        sensors: deprecated and ignored, the sensors are recognized from the data (see sensors.py).
+        """
+        _warn_sensors(sensors)
+        self.mc = serial.Serial(serial_port, baud_rate, timeout=1)
+        self.filename = filename
+        self.save = save
+        # buffered csv log, written in batches
+        self.log_writer = SensorLogWriter(filename=filename) if save is True else None
+        # optional columnar history, see sensor_store.py
+        self.store = store
+        # parses the JSON or binary output of the microcontroller
+        self.decoder = FrameDecoder()
+
+    def get_data(self):
+        """
+        Read data from serial port in JSON format or as binary frame (see FrameDecoder), return dict.
+        Save data as csv (optional, if save is True), written in batches by SensorLogWriter
+        -------------------------
+        data structure example:
+            {
+              "Device": "ieq_epaper_v",
+              "Time": 11847,
+              "Location": "office",
+              "Data": [
+                {
+                  "Sensor": "BME280",
+                  "Value": {
+                    "Temperature": 0,
+                    "Humidity": 0,
+                    "Pressure": 0,
+                    "Approx. Altitude": 0
+                  }
+                },
+                {
+                  "Sensor": "SCD30",
+                  "Value": {
+                    "Temperature": 22.54,
+                    "Humidity": 42.45,
+                    "CO2": 1568.18
+                  }
+                }
+              ]
+            }
+        """
+
+        # read serial data (JSON lines or binary frames, detected by FrameDecoder) until a reading is complete
+        while not self.decoder.pending():
+            value_read = self.mc.read(self.mc.in_waiting or 1)  # type bytes
+            if not value_read:
+                break
+            self.decoder.feed(value_read)
+
+        value_read_dict = self.decoder.pop()
+
+        if not value_read_dict:
+            pass
+        else:
+            # update time
+            now = datetime.now()
+            # values of all sensors in fixed slots, raises ValueError for unknown sensors
+            reading = decode_reading(value_read_dict, time=now)
+            new_row = [now] + reading.log_row()
+
+            logger.info(new_row)
+
+            if self.log_writer is not None:
+                self.log_writer.write(new_row)
+            if self.store is not None:
+                self.store.append(now, reading.slot_values(), device=reading.device)
+
+        return value_read_dict
+
+    def close(self):
+        """
+        Write buffered data (csv log / store) and close the serial port.
+        """
+        if self.log_writer is not None:
+            self.log_writer.close()
+        if self.store is not None:
+            self.store.flush()
+        self.mc.close()
+
+
+class FrameDecoder:
+    def __init__(self, devices: dict = None, max_line: int = 1024):
+        """
+        Incremental decoder for the serial output of the microcontroller, detects the format of each reading:
+        - JSON: one object per line, starting with "{", see microcontroller.get_data()
+        - binary frame (OUTPUT_BINARY in the Arduino sketches), little-endian:
+            sync word 0xA5 0x5A | version (uint8) | device number (uint16) | running time in ms (uint32) |
+            sensor mask (uint8, bit: sensors.frame_bits) | float32 values of the sensors in the mask (Sensor.fields) |
+            CRC16-CCITT (uint16) of version ... values
+        Other output (e.g. setup messages) is skipped, corrupt readings are counted instead of raising errors.
+        Example:
+        decoder = FrameDecoder()
+        decoder.feed(serial_bytes)
+        while decoder.pending():
+            reading = decoder.pop()  # same structure as the JSON output
+
+        devices: device number: device name, frame_devices if None.
+        max_line: maximum length of a JSON line in bytes.
+        """
+        self.devices = frame_devices if devices is None else devices
+        self.max_line = max_line
+        self._buffer = bytearray()
+        self._readings = deque()
+        # the buffer starts at the beginning of a line (or of the stream)
+        self._line_start = True
+
+        # counters
+        self.json_readings = 0
+        self.frame_readings = 0
+        self.corrupt = 0
+        self.skipped_bytes = 0
+
+    def feed(self, data: bytes):
+        """
+        Add received bytes, complete readings are available with pop().
+        """
+        self._buffer += data
+        buffer = self._buffer
+        pos = 0
+        # end of the last reading, a JSON line can start there or after a newline
+        boundary = 0 if self._line_start else -1
+        # next "{" at the start of a line (JSON) and sync word (binary frame), len(buffer) if there is none
+        json_start = frame_start = -1
+        while pos < len(buffer):
+            # skip everything before the next reading, "{" inside binary data isn't the start of a JSON line
+            if json_start < pos:
+                json_start = _find(buffer, b"{", pos)
+                while json_start < len(buffer) and not _line_start(buffer, json_start, boundary):
+                    json_start = _find(buffer, b"{", json_start + 1)
+            if frame_start < pos:
+                frame_start = _find(buffer, FRAME_SYNC, pos)
+            start = min(json_start, frame_start)
+            if start == len(buffer):
+                # the last byte can be the beginning of a sync word
+                start = len(buffer) - 1 if buffer[-1] == FRAME_SYNC[0] else len(buffer)
+            self.skipped_bytes += start - pos
+            pos = start
+            if pos == len(buffer) or (pos == len(buffer) - 1 and pos != json_start):
+                break
+
+            if pos == json_start:
+                end = buffer.find(b"\n", pos)
+                if frame_start < (len(buffer) if end < 0 else end):
+                    # a sync word before the end of the line: binary data, try the frame first
+                    self.skipped_bytes += 1
+                    pos += 1
+                    continue
+                if end < 0:
+                    if len(buffer) - pos > self.max_line:
+                        pos = self._corrupt(pos, 1, "JSON line too long")
+                        continue
+                    break
+                self._decode_json(bytes(buffer[pos:end]))
+                pos = boundary = end + 1
+            else:
+                if len(buffer) - pos < _FRAME_HEADER.size:
+                    break
+                _, version, _, _, mask = _FRAME_HEADER.unpack_from(buffer, pos)
+                if version != FRAME_VERSION or mask & ~_frame_mask():
+                    pos = self._corrupt(pos, 1, f"unknown frame version {version} or sensor mask {mask:#x}")
+                    continue
+                size = _frame_size(mask)
+                if len(buffer) - pos < size:
+                    break
+                if self._decode_frame(bytes(buffer[pos : pos + size])):
+                    pos = boundary = pos + size
+                    # a JSON line can start right after the frame
+                    json_start = -1
+                else:
+                    # the sync word may have been part of other data, search again after it
+                    pos = self._corrupt(pos, 1, "CRC error")
+        self._line_start = _line_start(buffer, pos, boundary)
+        del buffer[:pos]
+
+    def pending(self) -> int:
+        """
+        Number of decoded readings not taken with pop() yet.
+        """
+        return len(self._readings)
+
+    def pop(self) -> dict:
+        """
+        Oldest decoded reading, empty dict if there is none.
+        """
+        return self._readings.popleft() if self._readings else {}
+
+    def stats(self) -> dict:
+        """
+        Counters of decoded / corrupt readings and skipped bytes.
+        """
+        return {
+            "json_readings": self.json_readings,
+            "frame_readings": self.frame_readings,
+            "corrupt": self.corrupt,
+            "skipped_bytes": self.skipped_bytes,
+        }
+
+    def _decode_json(self, line: bytes):
+        try:
+            reading = json.loads(line.decode("utf-8"))
+            if not isinstance(reading, dict) or not isinstance(reading.get("Data"), list):
+                raise ValueError("no sensor data")
+        except ValueError as e:
+            self.corrupt += 1
+            logger.warning(f"Corrupt JSON reading skipped: {e}")
+            return
+        self.json_readings += 1
+        self._readings.append(reading)
+
+    def _decode_frame(self, frame: bytes) -> bool:
+        (crc,) = _FRAME_CRC.unpack_from(frame, len(frame) - _FRAME_CRC.size)
+        if crc != crc16_ccitt(frame[len(FRAME_SYNC) : -_FRAME_CRC.size]):
+            return False
+        _, _, device, running_time, mask = _FRAME_HEADER.unpack_from(frame)
+        values = struct.unpack_from(f"<{(len(frame) - _FRAME_HEADER.size - _FRAME_CRC.size) // 4}f", frame, _FRAME_HEADER.size)
+
+        data = []
+        i = 0
+        for bit, sensor in sorted(frame_bits.items()):
+            if mask & (1 << bit):
+                # float32 -> shortest decimal representation
+                value = {field: float(f"{v:.7g}") for field, v in zip(sensor.fields, values[i : i + len(sensor.fields)])}
+                data.append({"Sensor": sensor.name, "Value": value})
+                i += len(sensor.fields)
+        self.frame_readings += 1
+        self._readings.append({"Device": self.devices.get(device, f"device_{device}"), "Time": running_time, "Data": data})
+        return True
+
+    def _corrupt(self, pos: int, size: int, reason: str) -> int:
+        self.corrupt += 1
+        logger.warning(f"Corrupt reading skipped: {reason}")
+        return pos + size
+
+
+def encode_frame(device: int, running_time: int, data: list) -> bytes:
+    """
+    Binary frame of a reading, same format as the Arduino sketches with OUTPUT_BINARY (see FrameDecoder).
+    data: [{"Sensor": "BME280", "Value": {"Temperature": 22.1, ...}}, ...], sensors with a frame bit only.
+    """
+    values = {entry["Sensor"]: entry["Value"] for entry in data}
+    mask = 0
+    floats = []
+    for bit, sensor in sorted(frame_bits.items()):
+        if sensor.name in values:
+            mask |= 1 << bit
+            floats += [values[sensor.name][field] for field in sensor.fields]
+    body = _FRAME_HEADER.pack(FRAME_SYNC, FRAME_VERSION, device, running_time, mask) + struct.pack(f"<{len(floats)}f", *floats)
+    return body + _FRAME_CRC.pack(crc16_ccitt(body[len(FRAME_SYNC) :]))
+
+
+def crc16_ccitt(data: bytes, crc: int = 0xFFFF) -> int:
+    """
+    CRC16-CCITT (polynomial 0x1021, initial value 0xFFFF), same as crc16_ccitt() in the Arduino sketches.
+    """
+    return binascii.crc_hqx(data, crc)
+
+
+def _find(buffer: bytearray, sub: bytes, pos: int) -> int:
+    found = buffer.find(sub, pos)
+    return found if found >= 0 else len(buffer)
+
+
+def _line_start(buffer: bytearray, pos: int, boundary: int) -> bool:
+    # beginning of a line: after a newline or at the end of the last reading
+    return pos == boundary or (pos > 0 and buffer[pos - 1] == ord("\n"))
+
+
+def _frame_size(mask: int) -> int:
+    fields = sum(len(sensor.fields) for bit, sensor in frame_bits.items() if mask & (1 << bit))
+    return _FRAME_HEADER.size + 4 * fields + _FRAME_CRC.size
+
+
+def _frame_mask() -> int:
+    # bits of all sensors supported in binary frames
+    mask = 0
+    for bit in frame_bits:
+        mask |= 1 << bit
+    return mask
+
+
+class AsyncMicrocontroller:
+    def __init__(
+        self,
+        serial_port: str,
+        baud_rate: int,
+        sensors: list = None,
+        filename: str = "test",
+        save: bool = False,
+        queue_size: int = 16,
+        store: SensorStore = None,
+    ):
+        """
+        Non-blocking microcontroller for asyncio: a reader thread reads and parses the serial data
+        (microcontroller.get_data()) and feeds a bounded asyncio.Queue, so the event loop never waits for the serial port.
+        If the queue is full the reader thread waits (backpressure), unread lines stay in the serial buffer.
+        Example:
+        mc = AsyncMicrocontroller(
+            serial_port=serial_port,
+            baud_rate=baud_rate,
+        )
+        await mc.start()
+        sensor_data = await mc.get_data()
+
+        sensors: deprecated and ignored, see microcontroller.
+        """
+        _warn_sensors(sensors)
+        self.mc = microcontroller(serial_port, baud_rate, filename=filename, save=save, store=store)
+        self.queue_size = queue_size
+        self.queue = None
+        self._loop = None
+        self._thread = None
+        self._stop = threading.Event()
+
+    async def start(self):
+        """
+        Start the reader thread, has to be called from the event loop using get_data().
+        """
+        self._loop = asyncio.get_running_loop()
+        self.queue = asyncio.Queue(maxsize=self.queue_size)
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._read, name="serial-reader", daemon=True)
+        self._thread.start()
+
+    async def get_data(self) -> dict:
+        """
+        Wait for the next data from serial port, see microcontroller.get_data().
+        Raises the serial error if the reader thread stopped because of it.
+        """
+        value_read_dict = await self.queue.get()
+        if isinstance(value_read_dict, Exception):
+            raise value_read_dict
+        return value_read_dict
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self) -> dict:
+        return await self.get_data()
+
+    def close(self):
+        """
+        Stop the reader thread and close the serial port.
+        """
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=2)
+        self.mc.close()
+
+    def _read(self):
+        while not self._stop.is_set():
+            try:
+                value_read_dict = self.mc.get_data()
+            except serial.SerialException as e:
+                logger.error(f"Reading serial port failed: {e}")
+                self._put(e)
+                return
+            except ValueError as e:
+                logger.error(f"Invalid data from serial port: {e}")
+                continue
+            if value_read_dict:
+                self._put(value_read_dict)
+
+    def _put(self, item):
+        future = asyncio.run_coroutine_threadsafe(self.queue.put(item), self._loop)
+        # wait while the queue is full, but stop waiting when closed
+        while not self._stop.is_set():
+            try:
+                future.result(timeout=0.5)
+                return
+            except concurrent.futures.TimeoutError:
+                # not the builtin TimeoutError before Python 3.11
+                continue
+        future.cancel()
+
+
+def _warn_sensors(sensors: list):
+    if sensors is not None:
+        warnings.warn(
+            "The sensors argument is ignored, the sensors are recognized from the data (see sensors.py)",
+            DeprecationWarning,
+            stacklevel=3,
+        )
+
+
+def read_sensor_log(file_name: str) -> "pd.DataFrame":
+    """
+    Read sensor data saved as csv by microcontroller.get_data() (save=True) into a DataFrame,
+    e.g. for batch evaluation with thermal_comfort.thermal_comfort_pmvppd_batch().
+    -------------------------
+    csv row example:
+        2025-01-11 10:32:01.123456,BME280,22.1,41.2,1002.5,SCD30,22.5,42.4,1568.2
+    DataFrame columns:
+        time, BME280_Temperature, BME280_Humidity, BME280_Pressure, SCD30_Temperature, SCD30_Humidity, SCD30_CO2
+    file_name can be a pattern for daily files (SensorLogWriter rotate_daily), e.g. "test_*.csv" or "test_2025-01-*.csv"
+    """
+    files = sorted(glob.glob(file_name)) or [file_name]
+    log = pd.concat([pd.read_csv(f, header=None) for f in files], ignore_index=True)
+
+    # get column names from the sensor names in the first row
+    columns = ["time"]
+    positions = [0]
+    i = 1
+    while i < log.shape[1]:
+        sensor = log.iloc[0, i]
+        if sensor not in sensor_types:
+            raise ValueError(f"Sensor type unknown: {sensor}")
+        fields = sensor_types[sensor].log_fields
+        columns += [f"{sensor}_{field}" for field in fields]
+        positions += list(range(i + 1, i + 1 + len(fields)))
+        i += 1 + len(fields)
+
+    log = log.iloc[:, positions]
+    log.columns = columns
+    log["time"] = pd.to_datetime(log["time"])
+
+    return log
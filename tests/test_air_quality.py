@@ -0,0 +1,20 @@
+import numpy as np
+
+from air_quality import RollingIAQ, _iaq_co2_lookup, _IAQ_CO2_THRESHOLDS
+
+
+def test_rolling_iaq_update_scalar_reading():
+    iaq_rolling = RollingIAQ(standard="HK", window=3600)
+    index = iaq_rolling.update(co2_indoor=600, timestamp=0)
+    assert isinstance(index, int)
+    assert index >= 1
+    # rising CO2 concentration, the rolling average and its index don't improve
+    assert iaq_rolling.update(co2_indoor=2500, timestamp=600) >= index
+
+
+def test_iaq_co2_lookup_scalar_and_nan():
+    _, thresholds = _IAQ_CO2_THRESHOLDS["HK"]
+    assert _iaq_co2_lookup(np.nan, thresholds) == 0
+    indices = _iaq_co2_lookup(np.array([600.0, np.nan]), thresholds)
+    assert indices.dtype == np.int8
+    assert indices[1] == 0 and indices[0] == _iaq_co2_lookup(600.0, thresholds)
@@ -0,0 +1,67 @@
+from datetime import datetime, timedelta
+
+import numpy as np
+
+from clothing_suggestion import clo_extra_required, clothing_plan, met_walking, pmv_outdoor_min
+from get_weather import WeatherDataset
+from thermal_comfort import models
+from weather_providers import HourlyWeather
+
+
+def _weather(temperature: np.ndarray, past_days: int = 0) -> WeatherDataset:
+    # hourly data from local midnight past_days ago, as fetched
+    start = datetime.combine(datetime.utcnow().date() - timedelta(days=past_days), datetime.min.time())
+    response = HourlyWeather(
+        latitude=50.78, longitude=6.08, utc_offset_seconds=0, timezone="UTC", timezone_abbreviation="UTC",
+        time=int((start - datetime(1970, 1, 1)).total_seconds()), interval=3600,
+        variables={"temperature_2m": temperature, "relative_humidity_2m": np.full(temperature.shape, 60.0)},
+    )
+    weather = WeatherDataset(past_days=past_days, forecast_days=1, ttl=3600)
+    weather.load(response)
+    return weather
+
+
+def test_plan_gap_in_forecast_is_unknown():
+    temperature = np.full(24, 2.0)
+    # missing hours of the forecast
+    temperature[12:15] = np.nan
+    plan = clothing_plan(days=1, weather=_weather(temperature))
+
+    assert len(plan["time"]) == 24
+    assert np.all(plan["garment_outdoor"][12:15] == "unknown")
+    assert np.all(np.isnan(plan["clo_extra"][12:15]))
+    assert not np.any(plan["garment_outdoor"][:12] == "unknown")
+
+
+def _clo_extra_stepwise(tdb, rh, clo_indoor, step=0.05):
+    # former solver: add clothing in steps until PMV >= pmv_outdoor_min
+    clo_extra = 0.0
+    while models.pmv_ppd(tdb=tdb, tr=tdb, vr=0, rh=rh, met=met_walking, clo=clo_indoor + clo_extra,
+                         limit_inputs=False)["pmv"] < pmv_outdoor_min:
+        clo_extra += step
+    return clo_extra
+
+
+def test_clo_extra_warm_needs_nothing():
+    assert clo_extra_required(tdb=25.0, rh=50.0, clo_indoor=0.61) == 0.0
+
+
+def test_clo_extra_cold_limited_to_clo_max():
+    assert clo_extra_required(tdb=-40.0, rh=80.0, clo_indoor=0.61, clo_max=1.0) == 1.0
+
+
+def test_clo_extra_missing_weather_is_nan():
+    clo_extra = clo_extra_required(tdb=[np.nan, 25.0], rh=[60.0, np.nan], clo_indoor=0.61)
+    assert np.all(np.isnan(clo_extra))
+
+
+def test_clo_extra_agrees_with_stepwise_solver():
+    # a few forecast hours of a cold day
+    tdb = np.array([-6.0, -2.5, 1.0, 4.5, 8.0, 12.0])
+    rh = np.array([85.0, 80.0, 75.0, 70.0, 65.0, 60.0])
+    tol = 0.005
+    clo_extra = clo_extra_required(tdb=tdb, rh=rh, clo_indoor=0.61, tol=tol)
+    for t, h, solved in zip(tdb, rh, clo_extra):
+        stepwise = _clo_extra_stepwise(t, h, 0.61)
+        # the stepwise solver overshoots the minimum by up to one step, bisection by up to tol
+        assert stepwise - 0.05 - 1e-9 <= solved <= stepwise + tol
@@ -0,0 +1,56 @@
+import json
+import threading
+import time
+from datetime import datetime, timedelta
+
+import pytest
+
+import get_weather
+from comfort_service import ComfortService
+from weather_providers import ReplayProvider
+
+
+class SlowReplay(ReplayProvider):
+    def fetch(self, url, params):
+        time.sleep(1.0)
+        return super().fetch(url, params)
+
+
+@pytest.fixture
+def slow_weather(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    start = datetime.combine(datetime.utcnow().date() - timedelta(days=7), datetime.min.time())
+    hours = 10 * 24
+    recording = {
+        "latitude": 50.78,
+        "longitude": 6.08,
+        "utc_offset_seconds": 0,
+        "hourly": {
+            "time": [(start + timedelta(hours=hour)).isoformat(timespec="minutes") for hour in range(hours)],
+            "temperature_2m": [5.0] * hours,
+            "relative_humidity_2m": [70.0] * hours,
+        },
+    }
+    (tmp_path / "forecast.json").write_text(json.dumps(recording))
+    provider = get_weather.provider
+    get_weather.set_provider(SlowReplay(str(tmp_path)))
+    yield
+    get_weather.set_provider(provider)
+
+
+def test_weather_fetch_of_clothing_doesnt_block_pmv(slow_weather):
+    with ComfortService(port=0, warm_up=False) as service:
+        # compile the model first
+        service.handle("/pmv", {"tdb": 22.0, "rh": 50.0, "clo": 0.6})
+        clothing = threading.Thread(target=service.handle, args=("/clothing", {}))
+        clothing.start()
+        time.sleep(0.2)
+
+        start = time.perf_counter()
+        result = service.handle("/pmv", {"tdb": 22.0, "rh": 50.0, "clo": 0.6})
+        elapsed = time.perf_counter() - start
+        clothing.join()
+
+    assert "pmv" in result
+    # answered while the clothing request waits for the weather data
+    assert elapsed < 0.5
@@ -0,0 +1,61 @@
+import json
+
+import pytest
+
+from serial_reader import FrameDecoder, encode_frame
+
+DATA = [
+    {"Sensor": "BME280", "Value": {"Temperature": 22.5, "Humidity": 41.25, "Pressure": 1002.5, "Approx. Altitude": 90.0}},
+    {"Sensor": "SCD30", "Value": {"Temperature": 22.75, "Humidity": 42.5, "CO2": 812.0}},
+]
+
+
+def _json_line(device: str = "co2_box") -> bytes:
+    return (json.dumps({"Device": device, "Time": 1000, "Location": "office", "Data": DATA}) + "\r\n").encode()
+
+
+def _readings(decoder: FrameDecoder) -> list:
+    readings = []
+    while decoder.pending():
+        readings.append(decoder.pop())
+    return readings
+
+
+def test_frame_round_trip():
+    decoder = FrameDecoder()
+    decoder.feed(encode_frame(device=1, running_time=5000, data=DATA))
+    (reading,) = _readings(decoder)
+    assert reading["Device"] == "co2_box"
+    assert reading["Time"] == 5000
+    assert reading["Data"] == DATA
+
+
+@pytest.mark.parametrize("chunk", [1, 7, 4096])
+def test_mixed_json_and_frames(chunk):
+    stream = b"setup done\r\n" + _json_line() + encode_frame(1, 1, DATA) + _json_line("box_2") + encode_frame(2, 2, DATA)
+    decoder = FrameDecoder()
+    for i in range(0, len(stream), chunk):
+        decoder.feed(stream[i : i + chunk])
+    readings = _readings(decoder)
+    assert [reading["Device"] for reading in readings] == ["co2_box", "co2_box", "box_2", "co2_box_epaper_v"]
+    assert decoder.json_readings == 2 and decoder.frame_readings == 2 and decoder.corrupt == 0
+
+
+def test_crc_error_skips_frame():
+    frame = bytearray(encode_frame(1, 1, DATA))
+    frame[-1] ^= 0xFF
+    decoder = FrameDecoder()
+    decoder.feed(bytes(frame) + encode_frame(1, 2, DATA))
+    readings = _readings(decoder)
+    assert [reading["Time"] for reading in readings] == [2]
+    assert decoder.corrupt >= 1
+
+
+def test_mid_stream_start():
+    # partial frame with a "{" byte (e.g. after a reconnect), then frames with newline bytes in their values
+    frames = [encode_frame(1, t, DATA) for t in range(10)] + [encode_frame(1, 0x0A0A, DATA)]
+    decoder = FrameDecoder()
+    for data in [b"\x01\x7b\x33"] + frames:
+        decoder.feed(data)
+    readings = _readings(decoder)
+    assert [reading["Time"] for reading in readings] == list(range(10)) + [0x0A0A]
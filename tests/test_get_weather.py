@@ -0,0 +1,28 @@
+import time
+from datetime import datetime, timedelta
+
+import numpy as np
+import pytest
+
+from get_weather import WeatherDataset
+from weather_providers import HourlyWeather
+
+
+@pytest.mark.parametrize("utc_offset_seconds", [-10 * 3600, 0, 14 * 3600])
+def test_day_change_in_timezone_of_the_dataset(utc_offset_seconds):
+    # local midnight of today in the timezone of the location, not of the host
+    local_today = (datetime(1970, 1, 1) + timedelta(seconds=time.time() + utc_offset_seconds)).date()
+    start = datetime.combine(local_today, datetime.min.time())
+    response = HourlyWeather(
+        latitude=0.0, longitude=0.0, utc_offset_seconds=utc_offset_seconds, timezone="", timezone_abbreviation="",
+        time=int((start - datetime(1970, 1, 1)).total_seconds()) - utc_offset_seconds, interval=3600,
+        variables={"temperature_2m": np.zeros(24), "relative_humidity_2m": np.zeros(24)},
+    )
+    weather = WeatherDataset(past_days=0, forecast_days=1, ttl=3600)
+    weather.load(response)
+    assert weather.today == local_today
+    assert not weather.is_stale()
+
+    # fetched before the local midnight
+    weather.fetched_on -= timedelta(days=1)
+    assert weather.is_stale()
@@ -0,0 +1,37 @@
+import asyncio
+import json
+
+from ingest import DeviceHub
+
+
+class FakeSource:
+    def __init__(self, name, co2, location=None):
+        self.name = name
+        self.location = location
+        self.co2 = co2
+
+    async def run(self, feed):
+        # same "Device" / "Location" in every box, as hard-coded in the sketches
+        message = {"Device": "co2_box", "Location": "office", "Data": [{"Sensor": "SCD30", "Value": {"CO2": self.co2}}]}
+        feed((json.dumps(message) + "\n").encode())
+        await asyncio.sleep(3600)
+
+
+async def _readings(hub, count):
+    await hub.start()
+    try:
+        return [await hub.get() for _ in range(count)]
+    finally:
+        await hub.close()
+
+
+def test_identical_devices_kept_apart_by_source():
+    hub = DeviceHub([FakeSource("COM11", 800.0, location="meeting room 1"), FakeSource("COM12", 1500.0)])
+    readings = {reading.source: reading for reading in asyncio.run(_readings(hub, 2))}
+
+    assert readings["COM11"].get("SCD30", "CO2") == 800.0
+    assert readings["COM12"].get("SCD30", "CO2") == 1500.0
+    # configured location replaces the default of the sketch
+    assert readings["COM11"].location == "meeting room 1"
+    assert readings["COM12"].location == "office"
+    assert set(hub.stats()["devices"]) == {"COM11", "COM12"}
@@ -0,0 +1,78 @@
+import asyncio
+import json
+from datetime import datetime, timedelta
+
+import pytest
+
+import get_weather
+from locations import Location, LocationGroup
+from weather_providers import ReplayProvider
+
+
+@pytest.fixture
+def replay(tmp_path, monkeypatch):
+    # recording of one location: past 7 days, today and 2 forecast days from local midnight
+    monkeypatch.chdir(tmp_path)
+    start = datetime.combine(datetime.utcnow().date() - timedelta(days=7), datetime.min.time())
+    hours = 10 * 24
+    recording = {
+        "latitude": 50.78,
+        "longitude": 6.08,
+        "utc_offset_seconds": 0,
+        "hourly": {
+            "time": [(start + timedelta(hours=hour)).isoformat(timespec="minutes") for hour in range(hours)],
+            "temperature_2m": [10.0] * hours,
+            "relative_humidity_2m": [60.0] * hours,
+        },
+    }
+    (tmp_path / "forecast.json").write_text(json.dumps(recording))
+    provider = get_weather.provider
+    get_weather.set_provider(ReplayProvider(str(tmp_path)))
+    yield tmp_path
+    get_weather.set_provider(provider)
+
+
+def _group():
+    return LocationGroup([
+        Location("aachen", latitude=50.7766, longitude=6.0834, timezone="Europe/Berlin"),
+        Location("oslo", latitude=59.9139, longitude=10.7522, timezone="Europe/Oslo"),
+    ])
+
+
+def test_locations_replayed_offline(replay):
+    group = _group()
+    # one response per requested location, from the recording of one location
+    assert group.refresh() == 2
+    assert group.refresh() == 0
+
+    results = asyncio.run(group.evaluate({"aachen": {"tdb": 22.0, "rh": 50.0}, "oslo": {"tdb": 20.0, "rh": 40.0}}))
+    assert set(results) == {"aachen", "oslo"}
+    assert results["oslo"]["location"] == "oslo"
+    assert (replay / ".running_mean_oslo.json").exists()
+
+
+def test_set_provider_discards_location_weather(replay):
+    group = _group()
+    group.refresh()
+    get_weather.set_provider(ReplayProvider(str(replay)))
+    assert all(location.weather.is_stale() for location in group)
+
+
+def test_running_mean_retried_after_missing_weather(replay):
+    # recording without the temperatures of the past days
+    recording = json.loads((replay / "forecast.json").read_text())
+    temperature = recording["hourly"]["temperature_2m"]
+    recording["hourly"]["temperature_2m"] = [None] * (7 * 24) + temperature[7 * 24:]
+    (replay / "forecast.json").write_text(json.dumps(recording))
+    location = Location("aachen", latitude=50.7766, longitude=6.0834, timezone="Europe/Berlin")
+    assert location.running_mean_prediction() != location.running_mean_prediction()  # NaN
+    assert location.t_runningmean_date is None
+    assert not (replay / ".running_mean_aachen.json").exists()
+
+    # complete weather data: the running mean is updated on the next call, not only tomorrow
+    recording["hourly"]["temperature_2m"] = temperature
+    (replay / "forecast.json").write_text(json.dumps(recording))
+    get_weather.set_provider(ReplayProvider(str(replay)))
+    assert location.running_mean_prediction() == pytest.approx(10.0)
+    assert location.t_runningmean_date == location.weather.today
+    assert (replay / ".running_mean_aachen.json").exists()
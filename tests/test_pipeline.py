@@ -0,0 +1,58 @@
+import asyncio
+
+from pipeline import LatestPerKey, Pipeline
+
+
+class Reading:
+    def __init__(self, source, value):
+        self.source = source
+        self.device = "co2_box"
+        self.value = value
+
+
+class Source:
+    def __init__(self, readings):
+        self.readings = list(readings)
+
+    async def get(self):
+        if not self.readings:
+            await asyncio.sleep(3600)
+        return self.readings.pop(0)
+
+
+class Display:
+    async def show(self, text, category=None):
+        pass
+
+
+def test_latest_per_key():
+    async def run():
+        queue = LatestPerKey()
+        queue.put("COM11", 1)
+        queue.put("COM12", 2)
+        queue.put("COM11", 3)
+        return [await queue.get(), await queue.get()], queue.replaced
+
+    assert asyncio.run(run()) == ([3, 2], 1)
+
+
+def test_slow_evaluation_keeps_readings_of_each_device():
+    evaluated = []
+
+    async def evaluate(reading):
+        evaluated.append((reading.source, reading.value))
+        await asyncio.sleep(0.05)
+        return reading.value
+
+    async def run():
+        # bursts of readings of two devices, faster than the evaluation
+        readings = [Reading("COM11", 1), Reading("COM12", 1), Reading("COM11", 2), Reading("COM12", 2)]
+        pipeline = Pipeline(Source(readings), evaluate=evaluate, render=lambda value: (str(value), None), display=Display())
+        task = asyncio.create_task(pipeline.run())
+        await asyncio.sleep(0.3)
+        task.cancel()
+        await asyncio.gather(task, return_exceptions=True)
+
+    asyncio.run(run())
+    # the latest reading of each device is evaluated, none replaced by a reading of the other device
+    assert ("COM11", 2) in evaluated and ("COM12", 2) in evaluated
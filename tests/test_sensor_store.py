@@ -0,0 +1,42 @@
+from datetime import datetime, timedelta
+
+import numpy as np
+
+from sensor_store import SensorStore
+
+
+def test_rollup_updated_over_several_flushes(tmp_path):
+    store = SensorStore(str(tmp_path / "store"), columns=["SCD30_CO2"])
+    start = datetime(2026, 10, 17, 8, 0)
+    for minute in range(3):
+        store.append(start + timedelta(minutes=minute), {"SCD30_CO2": 600.0 + minute}, device="office")
+        # each flush replaces the rollup file of the day written before
+        store.flush()
+    store.close()
+
+    data = store.query(start, start + timedelta(hours=1), ["SCD30_CO2"], device="office", tier="1h")
+    assert len(data["time"]) == 1
+    assert data["SCD30_CO2_count"][0] == 3
+    assert np.isclose(data["SCD30_CO2_mean"][0], 601.0)
+
+
+def test_append_to_existing_day_and_reopen(tmp_path):
+    root = str(tmp_path / "store")
+    start = datetime(2026, 10, 17, 8, 0)
+    store = SensorStore(root, columns=["SCD30_CO2", "BME280_Temperature"])
+    store.append(start, {"SCD30_CO2": 600.0, "BME280_Temperature": 21.0}, device="office")
+    store.flush()
+    # second flush appends to the segment of the same day
+    store.append(start + timedelta(minutes=1), {"SCD30_CO2": 700.0}, device="office")
+    store.flush()
+    store.close()
+
+    reopened = SensorStore(root)
+    reopened.append(start + timedelta(minutes=2), {"SCD30_CO2": 800.0, "BME280_Temperature": 22.0}, device="office")
+    reopened.flush()
+    data = reopened.query(start, start + timedelta(hours=1), device="office")
+    reopened.close()
+
+    assert list(data["SCD30_CO2"]) == [600.0, 700.0, 800.0]
+    assert np.isnan(data["BME280_Temperature"][1])
+    assert reopened.rows_written == 1
@@ -0,0 +1,56 @@
+import asyncio
+import json
+
+import pytest
+
+import serial_reader
+from serial_reader import AsyncMicrocontroller
+
+
+class FakeSerial:
+    def __init__(self, port, baud_rate, timeout=None):
+        self.count = 0
+
+    @property
+    def in_waiting(self):
+        return 0
+
+    def read(self, size=1):
+        # a new reading for every read, as fast as the reader thread takes them
+        self.count += 1
+        data = [{"Sensor": "SCD30", "Value": {"CO2": 400.0 + self.count}}]
+        return (json.dumps({"Device": "co2_box", "Time": self.count, "Data": data}) + "\n").encode()
+
+    def close(self):
+        pass
+
+
+def test_backpressure_keeps_reader_alive(monkeypatch):
+    monkeypatch.setattr(serial_reader.serial, "Serial", FakeSerial)
+
+    async def run():
+        mc = AsyncMicrocontroller("COM11", 115200, queue_size=2)
+        await mc.start()
+        try:
+            # queue full for longer than the wait of the reader thread (0.5 s)
+            await asyncio.sleep(1.2)
+            assert mc.queue.full()
+            times = [(await asyncio.wait_for(mc.get_data(), timeout=2))["Time"] for _ in range(5)]
+            assert mc._thread.is_alive()
+        finally:
+            mc.close()
+        return times
+
+    times = asyncio.run(run())
+    # no reading lost or reordered while waiting
+    assert times == sorted(times) and times[-1] - times[0] == 4
+
+
+def test_sensors_argument_deprecated(monkeypatch):
+    monkeypatch.setattr(serial_reader.serial, "Serial", FakeSerial)
+    # positional arguments of earlier versions
+    with pytest.warns(DeprecationWarning):
+        mc = serial_reader.microcontroller("COM11", 115200, ["BME280", "SCD30"], "office", False)
+    assert mc.filename == "office"
+    assert mc.save is False
+    mc.close()
@@ -1,155 +1,514 @@
-from pythermalcomfort.models import pmv_ppd, clo_tout
-from pythermalcomfort.models.adaptive_en import adaptive_en
-from pythermalcomfort.utilities import (
-    v_relative,
-    clo_dynamic,
-    running_mean_outdoor_temperature,
-)
-from get_weather import t_outdoor_6am, t_outdoor_avg_past7days
-from datetime import datetime
-
-
-updated = None
-last_update_date = None
-tout_6am = None
-
-
-def clo_prediction() -> float:
-    """
-    Predict clothing today (indoors) based on outdoor air temperature at 06:00 a.m.
-    No need to manually enter your current clothing insulation value.
-    The outdoor air temperature is updated only once a day.
-
-    Notes
-    -----
-    May not be accurate for extreme temperature ranges and naturally ventilated buildings.
-
-    Returns
-    -------
-    clo_prediction: float
-        predicted clothing insulation value [clo] indoors
-    """
-    global updated
-    global last_update_date
-    global tout_6am
-
-    if updated is True:
-        time_difference = datetime.now() - last_update_date
-        # if last update was more than one day ago, set updated status to False
-        if time_difference.days >= 1:
-            updated = False
-
-    else:
-        tout_6am = t_outdoor_6am()
-        # refresh update status
-        last_update_date = datetime.now()
-        updated = True
-
-    clo_predicted = clo_tout(tout_6am)
-
-    return clo_predicted
-
-
-def thermal_comfort_pmvppd(tdb, rh, tr=None, v=0, met=1.2) -> dict:
-    """
-    Returns 1) Predicted Mean Vote (PMV) from –3 to +3 corresponding to the categories:
-    cold, cool, slightly cool, neutral, slightly warm, warm, and hot.
-    2) Predicted Percentage of Dissatisfied (PPD) occupants in %.
-
-    Parameters
-    ----------
-    tdb: float, int
-        dry bulb air temperature in [°C] measured by air temperature sensor
-    rh: float, int
-        relative humidity in [%] measured by humidity sensor
-    tr: float, int, optional
-        mean radiant temperature in [°C] measuremd by globe thermometer.
-        If radiant temperature not given, assume it's equal to the dry bulb air temperature.
-    v: float, int, optional
-        air speed indoors in [m/s].
-        If air speed not given, assume it's equal to 0.
-    met: float, int, optional
-        metabolic rate in [met]. Defaults to 1.2 met (for seated office work regarding ISO 7730)
-
-    Returns
-    -------
-    Returns PMV (-3 ~ +3), PPD (%) and predicted clothing (clo) in a dict
-
-    Notes
-    -----
-    Because the Fanger model is a group model rather than an individual model,
-    it is impossible for the PPD to reach 0%, i.e. for everyone to be satisfied with the current indoor environment.
-
-    Examples
-    --------
-    >>> from thermal_comfort import thermal_comfort_pmvppd
-    >>> print(thermal_comfort_pmvppd(tdb=20,rh=50)) # 20 degreeC and 50% humidity
-    """
-    # if radiant temperature not given, assume it's equal to the dry bulb air temperature.
-    if tr is None:
-        tr = tdb
-
-    # calculate relative air speed
-    v_r = v_relative(v=v, met=met)
-
-    # predict clothing indoors based on outdoor temperature at 6 a.m.
-    clo = clo_prediction()
-    # calculate dynamic clothing
-    clo_d = clo_dynamic(clo=clo, met=met)
-    results = pmv_ppd(tdb=tdb, tr=tr, vr=v_r, rh=rh, met=met, clo=clo_d)
-    # add predicted clo in results for daily clothing suggestion
-    results["clo"] = clo
-
-    return results
-
-
-def thermal_comfort_adaptive(tdb, tr=None, v=0) -> list:
-    """
-    Returns results based on adaptive thermal comfort model (EN 16798-1:2019):
-    1) Acceptability of the current indoor thermal conditions (comply with comfort category I)
-    2) Calculated ideal comfort temperature at that specific running mean temperature in [°C]
-    3) lower & upper limits of acceptable indoor temperature range in [°C] (category I in EN 16798-1:2019)
-
-    Parameters
-    ----------
-    tdb: float, int
-        dry bulb air temperature in [°C] measured by air temperature sensor
-    tr: float, int, optional
-        mean radiant temperature in [°C] measuremd by globe thermometer.
-        If radiant temperature not given, assume it's equal to the dry bulb air temperature.
-    v: float, int, optional
-        air speed indoors in [m/s].
-        If air speed not given, assume it's equal to 0.
-
-    Returns
-    -------
-    t_comfort_acceptable: bool
-        if current indoor temperature acceptable, True or False
-    t_comfort_cat_i_low: float
-        lower limit of acceptable indoor temperature range in [°C] (category I in EN 16798-1:2019)
-    t_comfort: float
-        calculated ideal comfort temperature at that specific running mean temperature in [°C]
-    t_comfort_cat_i_up: float
-        upper limit of acceptable indoor temperature range in [°C] (category I in EN 16798-1:2019)
-    """
-    # if radiant temperature not given, assume it's equal to the dry bulb air temperature.
-    if tr is None:
-        tr = tdb
-
-    # calculate running mean temperature
-    tout_avg_past7days_ls = t_outdoor_avg_past7days()
-    t_runningmean = running_mean_outdoor_temperature(tout_avg_past7days_ls, alpha=0.8)
-
-    # Adaptive thermal comfort model based on EN 16798-1:2019
-    results = adaptive_en(tdb, tr, t_runningmean, v, limit_inputs=False)
-    # if current indoor temperature acceptable
-    t_comfort_acceptable = bool(results["acceptability_cat_i"])
-    # lower limit of acceptable range (category I in EN 16798-1:2019)
-    t_comfort_cat_i_low = float(results["tmp_cmf_cat_i_low"])
-    # calculated ideal comfort temperature
-    t_comfort = float(results["tmp_cmf"])
-    # upper limit of acceptable range (category I in EN 16798-1:2019)
-    t_comfort_cat_i_up = float(results["tmp_cmf_cat_i_up"])
-
-    return [t_comfort_acceptable, t_comfort_cat_i_low, t_comfort, t_comfort_cat_i_up]
-
+from lazy_import import lazy_import
+from comfort_warmup import numba_disk_cache
+from get_weather import t_outdoor_6am, t_outdoor_avg_past7days, t_outdoor_6am_days
+from datetime import datetime, date
+from collections import OrderedDict
+import numpy as np
+import json
+import os
+import logging
+import threading
+
+logger = logging.getLogger(__name__)
+
+# heavy dependencies, imported on first use
+pd = lazy_import("pandas")
+# pythermalcomfort compiles its models with numba when imported, cached on disk after the first start
+models = lazy_import("pythermalcomfort.models", context=numba_disk_cache)
+utilities = lazy_import("pythermalcomfort.utilities", context=numba_disk_cache)
+
+
+updated = None
+last_update_date = None
+tout_6am = None
+
+# running mean outdoor temperature, updated once a day and saved across restarts
+running_mean_file = ".running_mean.json"
+running_mean_alpha = 0.8
+t_runningmean = None
+t_runningmean_date = None
+
+# memoized PMV/PPD of single readings in thermal_comfort_pmvppd(), see PMVMemo
+# off by default: memoized results are evaluated at inputs rounded to the sensor resolution (0.05 K / 0.5 %RH)
+pmv_memo_enabled = False
+
+
+def clo_prediction() -> float:
+    """
+    Predict clothing today (indoors) based on outdoor air temperature at 06:00 a.m.
+    No need to manually enter your current clothing insulation value.
+    The outdoor air temperature is updated only once a day.
+
+    Notes
+    -----
+    May not be accurate for extreme temperature ranges and naturally ventilated buildings.
+
+    Returns
+    -------
+    clo_prediction: float
+        predicted clothing insulation value [clo] indoors
+    """
+    global updated
+    global last_update_date
+    global tout_6am
+
+    if updated is True:
+        time_difference = datetime.now() - last_update_date
+        # if last update was more than one day ago, set updated status to False
+        if time_difference.days >= 1:
+            updated = False
+
+    else:
+        tout_6am = t_outdoor_6am()
+        # refresh update status
+        last_update_date = datetime.now()
+        updated = True
+
+    clo_predicted = models.clo_tout(tout_6am)
+
+    return clo_predicted
+
+
+def clo_prediction_days(time) -> np.ndarray:
+    """
+    Predict clothing indoors for recorded readings, once per calendar day based on the outdoor temperature
+    at 6 a.m. of that day (see clo_prediction()).
+
+    Parameters
+    ----------
+    time: array-like of datetimes
+        local time of each reading
+
+    Returns
+    -------
+    clo_prediction: np.ndarray
+        predicted clothing insulation value [clo] of each reading, NaN for days without weather data
+    """
+    days = pd.to_datetime(np.asarray(time)).to_numpy(dtype="datetime64[D]")
+    days_unique, days_inverse = np.unique(days, return_inverse=True)
+    tout_6am_days = t_outdoor_6am_days(days_unique)
+    # days without weather data are not evaluated (NaN)
+    clo_days = np.where(np.isnan(tout_6am_days), np.nan, models.clo_tout(tout_6am_days))
+    return clo_days[days_inverse]
+
+
+def running_mean_prediction() -> float:
+    """
+    Get running mean outdoor temperature for today (EN 16798-1:2019), for the adaptive thermal comfort model.
+    It's only updated once a day and saved in running_mean_file, so restarts don't need to recalculate it:
+    t_rm(today) = (1 - alpha) * t_mean(yesterday) + alpha * t_rm(yesterday), with alpha = 0.8.
+    The running mean is calculated from the daily average outdoor temperature of the past 7 days
+    if there is no saved value of the past 7 days.
+
+    Returns
+    -------
+    t_runningmean: float
+        running mean outdoor temperature in [°C]
+    """
+    global t_runningmean
+    global t_runningmean_date
+
+    today = datetime.now().date()
+    if t_runningmean_date == today:
+        return t_runningmean
+
+    if t_runningmean_date is None:
+        t_runningmean, t_runningmean_date = _load_running_mean()
+
+    days_since_update = (today - t_runningmean_date).days if t_runningmean_date is not None else None
+    if days_since_update != 0:
+        # daily average outdoor temperature in descending order: t(day-1), t(day-2), ..., t(day-7)
+        t_rm = _update_running_mean(t_runningmean, days_since_update, t_outdoor_avg_past7days())
+        if not np.isfinite(t_rm):
+            # incomplete weather data: keep the last value and retry on the next call
+            logger.warning("Running mean outdoor temperature not available, weather data incomplete")
+            return t_rm
+        t_runningmean, t_runningmean_date = t_rm, today
+        _save_running_mean(t_runningmean, t_runningmean_date)
+
+    return t_runningmean
+
+
+def _update_running_mean(t_rm: float, days_since_update: int, tout_avg_past_days: list) -> float:
+    """
+    Update the last running mean with the daily averages (descending order) of the days since then,
+    recalculated from all past days if there is no last value or it's older than the past days.
+    """
+    if t_rm is not None and days_since_update is not None and 0 < days_since_update <= len(tout_avg_past_days):
+        # from oldest to newest
+        for tout_avg in reversed(tout_avg_past_days[:days_since_update]):
+            t_rm = (1 - running_mean_alpha) * tout_avg + running_mean_alpha * t_rm
+        return t_rm
+    return utilities.running_mean_outdoor_temperature(tout_avg_past_days, alpha=running_mean_alpha)
+
+
+def _load_running_mean(file_name: str = None) -> list:
+    """
+    Load running mean outdoor temperature and its date from file_name (running_mean_file if None),
+    [None, None] if not available.
+    """
+    file_name = file_name or running_mean_file
+    try:
+        with open(file_name, "r") as f:
+            state = json.load(f)
+        if state["alpha"] != running_mean_alpha:
+            return [None, None]
+        return [float(state["t_runningmean"]), date.fromisoformat(state["date"])]
+    except (OSError, ValueError, KeyError):
+        return [None, None]
+
+
+def _save_running_mean(t_rm: float, t_rm_date: date, file_name: str = None):
+    """
+    Save running mean outdoor temperature and its date to file_name (running_mean_file if None).
+    Written to a temporary file first, so an interrupted write doesn't corrupt the saved value.
+    """
+    if np.isnan(t_rm):
+        return
+    file_name = file_name or running_mean_file
+    state = {"date": t_rm_date.isoformat(), "t_runningmean": t_rm, "alpha": running_mean_alpha}
+    try:
+        with open(f"{file_name}.tmp", "w") as f:
+            json.dump(state, f)
+        os.replace(f"{file_name}.tmp", file_name)
+    except OSError as e:
+        logger.error(f"Saving running mean outdoor temperature failed: {e}")
+
+
+class PMVMemo:
+    def __init__(self, t_resolution: float = 0.05, rh_resolution: float = 0.5, v_resolution: float = 0.01,
+                 met_resolution: float = 0.01, max_size: int = 4096):
+        """
+        Example:
+        memo = PMVMemo(t_resolution=0.05, rh_resolution=0.5)
+        results = memo.pmv_ppd(tdb=22.03, rh=45.2, tr=22.03, v=0, met=1.2, clo=0.61)
+
+        Memoized PMV/PPD model for single readings. In steady state the readings only change below the sensor
+        accuracy and the clothing is fixed per day, so the same PMV/PPD would be calculated over and over.
+        Inputs are rounded to the given resolution and the model is evaluated at the rounded inputs,
+        so the results don't depend on which reading came first.
+        The memo is cleared when the predicted clothing changes (once a day).
+
+        t_resolution: resolution of air / radiant temperature in [°C].
+        rh_resolution: resolution of relative humidity in [%].
+        v_resolution: resolution of air speed in [m/s].
+        met_resolution: resolution of metabolic rate in [met].
+        max_size: number of memoized results, the least recently used are dropped.
+        """
+        self.t_resolution = t_resolution
+        self.rh_resolution = rh_resolution
+        self.v_resolution = v_resolution
+        self.met_resolution = met_resolution
+        self.max_size = max_size
+
+        # counters
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+        self.clo = None
+        self._results = OrderedDict()
+        self._lock = threading.Lock()
+
+    def pmv_ppd(self, tdb, rh, tr, v, met, clo) -> dict:
+        """
+        PMV, PPD and clo in a dict like thermal_comfort_pmvppd(), clo is the predicted clothing (not dynamic).
+        """
+        inputs = (tdb, rh, tr, v, met, clo)
+        if any(np.ndim(x) for x in inputs) or any(x != x for x in inputs):
+            # arrays and missing values are not memoized
+            return _pmvppd(*inputs)
+
+        key = (
+            round(tdb / self.t_resolution),
+            round(rh / self.rh_resolution),
+            round(tr / self.t_resolution),
+            round(v / self.v_resolution),
+            round(met / self.met_resolution),
+        )
+        with self._lock:
+            if clo != self.clo:
+                if self._results:
+                    self.invalidations += 1
+                self._results.clear()
+                self.clo = clo
+            results = self._results.get(key)
+            if results is not None:
+                self._results.move_to_end(key)
+                self.hits += 1
+                return dict(results)
+            self.misses += 1
+
+        results = _pmvppd(
+            key[0] * self.t_resolution,
+            key[1] * self.rh_resolution,
+            key[2] * self.t_resolution,
+            key[3] * self.v_resolution,
+            key[4] * self.met_resolution,
+            clo,
+        )
+        with self._lock:
+            if clo == self.clo:
+                self._results[key] = results
+                if len(self._results) > self.max_size:
+                    self._results.popitem(last=False)
+                    self.evictions += 1
+        return dict(results)
+
+    def clear(self):
+        with self._lock:
+            self._results.clear()
+            self.clo = None
+
+    def stats(self) -> dict:
+        """
+        Counters of hits / misses (model evaluated) / evictions / invalidations (clothing changed) and the size.
+        """
+        lookups = max(self.hits + self.misses, 1)
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups,
+            "evictions": self.evictions,
+            "invalidations": self.invalidations,
+            "size": len(self._results),
+        }
+
+
+# sensor resolution: BME280 air temperature and humidity
+pmv_memo = PMVMemo(t_resolution=0.05, rh_resolution=0.5)
+
+
+def thermal_comfort_pmvppd(tdb, rh, tr=None, v=0, met=1.2, clo=None, memo=None) -> dict:
+    """
+    Returns 1) Predicted Mean Vote (PMV) from –3 to +3 corresponding to the categories:
+    cold, cool, slightly cool, neutral, slightly warm, warm, and hot.
+    2) Predicted Percentage of Dissatisfied (PPD) occupants in %.
+
+    Parameters
+    ----------
+    tdb: float, int
+        dry bulb air temperature in [°C] measured by air temperature sensor
+    rh: float, int
+        relative humidity in [%] measured by humidity sensor
+    tr: float, int, optional
+        mean radiant temperature in [°C] measuremd by globe thermometer.
+        If radiant temperature not given, assume it's equal to the dry bulb air temperature.
+    v: float, int, optional
+        air speed indoors in [m/s].
+        If air speed not given, assume it's equal to 0.
+    met: float, int, optional
+        metabolic rate in [met]. Defaults to 1.2 met (for seated office work regarding ISO 7730)
+    clo: float, int, optional
+        clothing insulation indoors in [clo], predicted by clo_prediction() if not given.
+    memo: bool or PMVMemo, optional
+        use the memoized model pmv_memo (or the given PMVMemo). Defaults to pmv_memo_enabled (False).
+        Memoized results are evaluated at the inputs rounded to the sensor resolution (0.05 K / 0.5 %RH),
+        not at the exact inputs.
+
+    Returns
+    -------
+    Returns PMV (-3 ~ +3), PPD (%) and predicted clothing (clo) in a dict
+
+    Notes
+    -----
+    Because the Fanger model is a group model rather than an individual model,
+    it is impossible for the PPD to reach 0%, i.e. for everyone to be satisfied with the current indoor environment.
+
+    Examples
+    --------
+    >>> from thermal_comfort import thermal_comfort_pmvppd
+    >>> print(thermal_comfort_pmvppd(tdb=20,rh=50)) # 20 degreeC and 50% humidity
+    """
+    # if radiant temperature not given, assume it's equal to the dry bulb air temperature.
+    if tr is None:
+        tr = tdb
+
+    # predict clothing indoors based on outdoor temperature at 6 a.m.
+    if clo is None:
+        clo = clo_prediction()
+
+    if isinstance(memo, PMVMemo):
+        return memo.pmv_ppd(tdb=tdb, rh=rh, tr=tr, v=v, met=met, clo=clo)
+    if pmv_memo_enabled if memo is None else memo:
+        return pmv_memo.pmv_ppd(tdb=tdb, rh=rh, tr=tr, v=v, met=met, clo=clo)
+    return _pmvppd(tdb, rh, tr, v, met, clo)
+
+
+def _pmvppd(tdb, rh, tr, v, met, clo) -> dict:
+    # calculate relative air speed
+    v_r = utilities.v_relative(v=v, met=met)
+    # calculate dynamic clothing
+    clo_d = utilities.clo_dynamic(clo=clo, met=met)
+    results = models.pmv_ppd(tdb=tdb, tr=tr, vr=v_r, rh=rh, met=met, clo=clo_d)
+    # add predicted clo in results for daily clothing suggestion
+    results["clo"] = clo
+
+    return results
+
+
+def thermal_comfort_pmvppd_batch(tdb, rh, tr=None, v=0, met=1.2, time=None, clo=None) -> dict:
+    """
+    Batch version of thermal_comfort_pmvppd() for recorded sensor data, e.g. saved csv logs.
+    All readings are evaluated with a single vectorized call of the PMV/PPD model.
+
+    Parameters
+    ----------
+    tdb: array-like
+        dry bulb air temperature in [°C] measured by air temperature sensor
+    rh: array-like
+        relative humidity in [%] measured by humidity sensor
+    tr: float, int or array-like, optional
+        mean radiant temperature in [°C] measuremd by globe thermometer.
+        If radiant temperature not given, assume it's equal to the dry bulb air temperature.
+    v: float, int or array-like, optional
+        air speed indoors in [m/s].
+        If air speed not given, assume it's equal to 0.
+    met: float, int or array-like, optional
+        metabolic rate in [met]. Defaults to 1.2 met (for seated office work regarding ISO 7730)
+    time: array-like of datetimes, optional
+        local time of each reading. Used to predict the clothing once per calendar day
+        based on the outdoor temperature at 6 a.m. of that day.
+        If not given, all readings are evaluated with today's predicted clothing.
+    clo: float, int or array-like, optional
+        clothing insulation in [clo]. If given, it's used instead of the predicted clothing.
+
+    Returns
+    -------
+    Returns PMV (-3 ~ +3), PPD (%) and predicted clothing (clo) as numpy arrays in a dict
+
+    Examples
+    --------
+    >>> from serial_reader import read_sensor_log
+    >>> from thermal_comfort import thermal_comfort_pmvppd_batch
+    >>> log = read_sensor_log("test.csv")
+    >>> results = thermal_comfort_pmvppd_batch(
+    ...     tdb=log["BME280_Temperature"], rh=log["BME280_Humidity"], time=log["time"]
+    ... )
+    >>> # recorded data in a sensor_store.SensorStore, evaluated day by day without loading it at once
+    >>> for chunk in store.scan("2025-01-01", "2025-04-01", ["BME280_Temperature", "BME280_Humidity"]):
+    ...     results = thermal_comfort_pmvppd_batch(
+    ...         tdb=chunk["BME280_Temperature"], rh=chunk["BME280_Humidity"], time=chunk["time"]
+    ...     )
+    """
+    tdb = np.asarray(tdb, dtype=np.float64)
+    rh = np.asarray(rh, dtype=np.float64)
+    # if radiant temperature not given, assume it's equal to the dry bulb air temperature.
+    tr = tdb if tr is None else np.asarray(tr, dtype=np.float64)
+    met = np.asarray(met, dtype=np.float64)
+
+    # calculate relative air speed
+    v_r = utilities.v_relative(v=np.asarray(v, dtype=np.float64), met=met)
+
+    if clo is None:
+        if time is None:
+            # predict clothing indoors based on today's outdoor temperature at 6 a.m.
+            clo = clo_prediction()
+        else:
+            clo = clo_prediction_days(time)
+    clo = np.broadcast_to(np.asarray(clo, dtype=np.float64), tdb.shape)
+
+    # calculate dynamic clothing
+    clo_d = utilities.clo_dynamic(clo=clo, met=met)
+    results = models.pmv_ppd(tdb=tdb, tr=tr, vr=v_r, rh=rh, met=met, clo=clo_d)
+    # add clo in results for daily clothing suggestion
+    results["clo"] = clo
+
+    return results
+
+
+def thermal_comfort_adaptive(tdb, tr=None, v=0, t_rm=None) -> list:
+    """
+    Returns results based on adaptive thermal comfort model (EN 16798-1:2019):
+    1) Acceptability of the current indoor thermal conditions (comply with comfort category I)
+    2) Calculated ideal comfort temperature at that specific running mean temperature in [°C]
+    3) lower & upper limits of acceptable indoor temperature range in [°C] (category I in EN 16798-1:2019)
+
+    Parameters
+    ----------
+    tdb: float, int
+        dry bulb air temperature in [°C] measured by air temperature sensor
+    tr: float, int, optional
+        mean radiant temperature in [°C] measuremd by globe thermometer.
+        If radiant temperature not given, assume it's equal to the dry bulb air temperature.
+    v: float, int, optional
+        air speed indoors in [m/s].
+        If air speed not given, assume it's equal to 0.
+    t_rm: float, optional
+        running mean outdoor temperature in [°C], running_mean_prediction() if not given.
+
+    Returns
+    -------
+    t_comfort_acceptable: bool
+        if current indoor temperature acceptable, True or False
+    t_comfort_cat_i_low: float
+        lower limit of acceptable indoor temperature range in [°C] (category I in EN 16798-1:2019)
+    t_comfort: float
+        calculated ideal comfort temperature at that specific running mean temperature in [°C]
+    t_comfort_cat_i_up: float
+        upper limit of acceptable indoor temperature range in [°C] (category I in EN 16798-1:2019)
+    """
+    # if radiant temperature not given, assume it's equal to the dry bulb air temperature.
+    if tr is None:
+        tr = tdb
+
+    # running mean temperature, only updated once a day
+    if t_rm is None:
+        t_rm = running_mean_prediction()
+
+    # Adaptive thermal comfort model based on EN 16798-1:2019
+    results = models.adaptive_en(tdb, tr, t_rm, v, limit_inputs=False)
+    # if current indoor temperature acceptable
+    t_comfort_acceptable = bool(results["acceptability_cat_i"])
+    # lower limit of acceptable range (category I in EN 16798-1:2019)
+    t_comfort_cat_i_low = float(results["tmp_cmf_cat_i_low"])
+    # calculated ideal comfort temperature
+    t_comfort = float(results["tmp_cmf"])
+    # upper limit of acceptable range (category I in EN 16798-1:2019)
+    t_comfort_cat_i_up = float(results["tmp_cmf_cat_i_up"])
+
+    return [t_comfort_acceptable, t_comfort_cat_i_low, t_comfort, t_comfort_cat_i_up]
+
+
+def thermal_comfort_adaptive_batch(tdb, tr=None, v=0, t_rm=None) -> dict:
+    """
+    Batch version of thermal_comfort_adaptive() for many readings at once, e.g. requests of several rooms.
+    All readings are evaluated with today's running mean outdoor temperature in a single vectorized call.
+
+    Parameters
+    ----------
+    tdb: array-like
+        dry bulb air temperature in [°C] measured by air temperature sensor
+    tr: float, int or array-like, optional
+        mean radiant temperature in [°C] measuremd by globe thermometer.
+        If radiant temperature not given, assume it's equal to the dry bulb air temperature.
+    v: float, int or array-like, optional
+        air speed indoors in [m/s].
+        If air speed not given, assume it's equal to 0.
+    t_rm: float, optional
+        running mean outdoor temperature in [°C], running_mean_prediction() if not given.
+
+    Returns
+    -------
+    Returns acceptability (category I), lower limit, comfort temperature and upper limit (category I) in [°C]
+    as numpy arrays and the running mean outdoor temperature t_rm in [°C] in a dict
+    """
+    tdb = np.asarray(tdb, dtype=np.float64)
+    # if radiant temperature not given, assume it's equal to the dry bulb air temperature.
+    tr = tdb if tr is None else np.asarray(tr, dtype=np.float64)
+
+    # running mean temperature, only updated once a day
+    if t_rm is None:
+        t_rm = running_mean_prediction()
+
+    results = models.adaptive_en(tdb, tr, t_rm, np.asarray(v, dtype=np.float64), limit_inputs=False)
+    # the comfort temperature only depends on t_rm, same shape as the readings
+    shape = np.broadcast_shapes(tdb.shape, tr.shape, np.shape(v))
+    return {
+        "t_comfort_acceptable": np.broadcast_to(results["acceptability_cat_i"], shape),
+        "t_comfort_cat_i_low": np.broadcast_to(results["tmp_cmf_cat_i_low"], shape),
+        "t_comfort": np.broadcast_to(results["tmp_cmf"], shape),
+        "t_comfort_cat_i_up": np.broadcast_to(results["tmp_cmf_cat_i_up"], shape),
+        "t_rm": t_rm,
+    }
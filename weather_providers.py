@@ -0,0 +1,402 @@
+"""
+Weather providers for get_weather, so the comfort evaluation can also run without internet access.
+- OpenMeteoProvider: the Open-Meteo API (default), can also be pointed at a WeatherStandIn server
+- ReplayProvider: serves recorded responses from disk, Open-Meteo JSON or FlatBuffers format
+- WeatherStandIn: tiny local HTTP server speaking the Open-Meteo API, e.g. for tests, benchmarks and air-gapped sites
+
+Example (record once, replay later):
+    from weather_providers import OpenMeteoProvider, ReplayProvider, record_weather
+    import get_weather
+    record_weather(OpenMeteoProvider(), get_weather.url, get_weather.weather.params(), "./weather/forecast.json")
+    get_weather.set_provider(ReplayProvider("./weather"))
+"""
+
+import json
+import logging
+import os
+import threading
+from datetime import datetime, timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlsplit, parse_qs
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+
+class HourlyWeather:
+    def __init__(
+        self,
+        latitude: float,
+        longitude: float,
+        utc_offset_seconds: int,
+        timezone: str,
+        timezone_abbreviation: str,
+        time: int,
+        interval: int,
+        variables: dict,
+    ):
+        """
+        Hourly weather data of one location, independent of the provider.
+        time: start of the hourly values as unix timestamp (UTC) in seconds, interval in seconds.
+        variables: hourly values as numpy arrays, keyed by Open-Meteo variable name, e.g. "temperature_2m".
+        """
+        self.latitude = latitude
+        self.longitude = longitude
+        self.utc_offset_seconds = utc_offset_seconds
+        self.timezone = timezone
+        self.timezone_abbreviation = timezone_abbreviation
+        self.time = time
+        self.interval = interval
+        self.variables = variables
+
+    def local_start(self) -> datetime:
+        """
+        Local time of the first hourly value.
+        """
+        return datetime(1970, 1, 1) + timedelta(seconds=self.time + self.utc_offset_seconds)
+
+    def select(self, names: list) -> "HourlyWeather":
+        """
+        Copy with only the given variables, in the given order.
+        """
+        return HourlyWeather(
+            self.latitude,
+            self.longitude,
+            self.utc_offset_seconds,
+            self.timezone,
+            self.timezone_abbreviation,
+            self.time,
+            self.interval,
+            {name: self.variables[name] for name in names},
+        )
+
+
+class WeatherProvider:
+    """
+    Interface of weather providers used by get_weather.
+    """
+
+    def fetch(self, url: str, params: dict) -> list:
+        """
+        Get hourly weather data for the Open-Meteo API url (e.g. ".../v1/forecast") and request parameters.
+        Returns a list of HourlyWeather, one per location.
+        """
+        raise NotImplementedError
+
+
+class OpenMeteoProvider(WeatherProvider):
+    def __init__(self, base_url: str = None, cache: str = ".cache", expire_after: int = 3600):
+        """
+        Open-Meteo API client with cache and retry on error, created on first use.
+        base_url replaces scheme and host of the requested urls, e.g. "http://127.0.0.1:8080" for a WeatherStandIn.
+        cache: file name of the sqlite response cache, None to disable caching.
+        """
+        self.base_url = base_url
+        self.cache = cache
+        self.expire_after = expire_after
+        self._client = None
+
+    def client(self):
+        if self._client is None:
+            import openmeteo_requests
+            import requests
+            import requests_cache
+            from retry_requests import retry
+
+            # Setup the Open-Meteo API client with cache and retry on error
+            if self.cache is None:
+                session = requests.Session()
+            else:
+                session = requests_cache.CachedSession(self.cache, expire_after=self.expire_after)
+            retry_session = retry(session, retries=5, backoff_factor=0.2)
+            self._client = openmeteo_requests.Client(session=retry_session)
+        return self._client
+
+    def fetch(self, url: str, params: dict) -> list:
+        if self.base_url is not None:
+            url = self.base_url.rstrip("/") + urlsplit(url).path
+        responses = self.client().weather_api(url, params=params)
+        for response in responses:
+            logger.info(f"Coordinates {response.Latitude()}°N {response.Longitude()}°E")
+            logger.info(f"Timezone {response.Timezone()} {response.TimezoneAbbreviation()}")
+
+        return [_weather_from_flatbuffers(response) for response in responses]
+
+
+class ReplayProvider(WeatherProvider):
+    def __init__(self, path: str):
+        """
+        Serves recorded weather API responses from disk, no network access.
+        path: a single recording used for all requests, or a directory with one recording per API endpoint,
+        e.g. "forecast.json" / "archive.json". Recordings are Open-Meteo JSON responses (".json")
+        or FlatBuffers responses as returned with format=flatbuffers (any other extension).
+        Only the requested hourly variables are returned, time range is as recorded.
+        One response per requested location (comma-separated coordinates): the closest recorded location,
+        so several locations can be replayed from a recording of one location.
+        """
+        self.path = path
+        self._recordings = {}
+
+    def fetch(self, url: str, params: dict) -> list:
+        recording = self._load(urlsplit(url).path.rsplit("/", 1)[-1])
+        names = _hourly_names(params)
+        coordinates = _coordinates(params)
+        if not coordinates:
+            return [weather.select(names) for weather in recording]
+
+        responses = []
+        for latitude, longitude in coordinates:
+            weather = min(recording, key=lambda w: (w.latitude - latitude) ** 2 + (w.longitude - longitude) ** 2)
+            responses.append(weather.select(names))
+        return responses
+
+    def _load(self, endpoint: str) -> list:
+        if endpoint not in self._recordings:
+            file_name = self.path
+            if os.path.isdir(self.path):
+                candidates = [name for name in sorted(os.listdir(self.path)) if os.path.splitext(name)[0] == endpoint]
+                if not candidates:
+                    raise FileNotFoundError(f"No recorded weather data for '{endpoint}' in {self.path}")
+                file_name = os.path.join(self.path, candidates[0])
+            self._recordings[endpoint] = read_weather(file_name)
+        return self._recordings[endpoint]
+
+
+class WeatherStandIn:
+    def __init__(self, provider: WeatherProvider, host: str = "127.0.0.1", port: int = 0):
+        """
+        Local HTTP stand-in for the Open-Meteo API, answering from another provider (usually a ReplayProvider).
+        Speaks JSON and, with format=flatbuffers, the binary format used by openmeteo_requests.
+
+        Example:
+        with WeatherStandIn(ReplayProvider("./weather")) as stand_in:
+            get_weather.set_provider(OpenMeteoProvider(base_url=stand_in.url, cache=None))
+        """
+        provider_ = provider
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                request = urlsplit(self.path)
+                params = parse_qs(request.query)
+                try:
+                    weather = provider_.fetch(request.path, params)
+                except Exception as e:
+                    self._send(400, "application/json", json.dumps({"error": True, "reason": str(e)}).encode())
+                    return
+                if params.get("format", ["json"])[0] == "flatbuffers":
+                    self._send(200, "application/octet-stream", b"".join(_weather_to_flatbuffers(w) for w in weather))
+                else:
+                    body = [_weather_to_json(w) for w in weather]
+                    self._send(200, "application/json", json.dumps(body[0] if len(body) == 1 else body).encode())
+
+            def _send(self, status: int, content_type: str, body: bytes):
+                self.send_response(status)
+                self.send_header("Content-Type", content_type)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                logger.debug(format % args)
+
+        self.server = ThreadingHTTPServer((host, port), Handler)
+        self.url = f"http://{host}:{self.server.server_address[1]}"
+        self._thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self._thread.start()
+
+    def close(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def record_weather(provider: WeatherProvider, url: str, params: dict, file_name: str):
+    """
+    Fetch weather data from a provider and save it as Open-Meteo JSON, to be served by ReplayProvider later.
+    """
+    weather = provider.fetch(url, params)
+    body = [_weather_to_json(w) for w in weather]
+    os.makedirs(os.path.dirname(os.path.abspath(file_name)), exist_ok=True)
+    with open(file_name, "w") as f:
+        json.dump(body[0] if len(body) == 1 else body, f)
+
+
+def read_weather(file_name: str) -> list:
+    """
+    Read a recorded weather API response, Open-Meteo JSON (".json") or FlatBuffers, as list of HourlyWeather.
+    """
+    if file_name.endswith(".json"):
+        with open(file_name, "r") as f:
+            body = json.load(f)
+        return [_weather_from_json(response) for response in (body if isinstance(body, list) else [body])]
+
+    from openmeteo_sdk.WeatherApiResponse import WeatherApiResponse
+
+    with open(file_name, "rb") as f:
+        data = f.read()
+    # length-prefixed messages, one per location
+    weather = []
+    pos = 0
+    while pos < len(data):
+        length = int.from_bytes(data[pos : pos + 4], byteorder="little")
+        weather.append(_weather_from_flatbuffers(WeatherApiResponse.GetRootAs(data, pos + 4)))
+        pos += length + 4
+    return weather
+
+
+def _hourly_names(params: dict) -> list:
+    """
+    Hourly variable names from request parameters, given as list and/or comma-separated.
+    """
+    hourly = params.get("hourly", [])
+    if isinstance(hourly, str):
+        hourly = [hourly]
+    return [name for value in hourly for name in value.split(",") if name]
+
+
+def _coordinates(params: dict) -> list:
+    """
+    Requested locations (latitude, longitude) from request parameters, given as list and/or comma-separated.
+    Empty if no coordinates are given.
+    """
+    values = []
+    for name in ("latitude", "longitude"):
+        value = params.get(name, [])
+        if not isinstance(value, (list, tuple)):
+            value = [value]
+        values.append([float(x) for v in value for x in str(v).split(",") if x.strip()])
+    latitudes, longitudes = values
+    if len(latitudes) != len(longitudes):
+        raise ValueError(f"Got {len(latitudes)} latitudes and {len(longitudes)} longitudes")
+    return list(zip(latitudes, longitudes))
+
+
+def _variable_name(variable: int, altitude: int) -> str:
+    """
+    Open-Meteo variable name from FlatBuffers variable enum and altitude, e.g. (47, 2) -> "temperature_2m".
+    """
+    from openmeteo_sdk.Variable import Variable
+
+    name = next(key for key, value in vars(Variable).items() if value == variable and not key.startswith("_"))
+    return f"{name}_{altitude}m" if altitude else name
+
+
+def _variable_enum(name: str) -> tuple:
+    """
+    FlatBuffers variable enum and altitude from Open-Meteo variable name, e.g. "temperature_2m" -> (47, 2).
+    """
+    from openmeteo_sdk.Variable import Variable
+
+    base, _, suffix = name.rpartition("_")
+    if base and suffix.endswith("m") and suffix[:-1].isdigit():
+        return getattr(Variable, base), int(suffix[:-1])
+    return getattr(Variable, name), 0
+
+
+def _weather_from_flatbuffers(response) -> HourlyWeather:
+    hourly = response.Hourly()
+    variables = {}
+    for i in range(hourly.VariablesLength()):
+        variable = hourly.Variables(i)
+        variables[_variable_name(variable.Variable(), variable.Altitude())] = variable.ValuesAsNumpy()
+    return HourlyWeather(
+        latitude=response.Latitude(),
+        longitude=response.Longitude(),
+        utc_offset_seconds=response.UtcOffsetSeconds(),
+        timezone=(response.Timezone() or b"").decode(),
+        timezone_abbreviation=(response.TimezoneAbbreviation() or b"").decode(),
+        time=hourly.Time(),
+        interval=hourly.Interval(),
+        variables=variables,
+    )
+
+
+def _weather_from_json(response: dict) -> HourlyWeather:
+    hourly = dict(response["hourly"])
+    utc_offset_seconds = response.get("utc_offset_seconds", 0)
+    times = hourly.pop("time")
+    if isinstance(times[0], str):
+        # local ISO 8601 time, e.g. "2025-01-11T06:00"
+        epoch = datetime(1970, 1, 1)
+        times = [int((datetime.fromisoformat(t) - epoch).total_seconds()) - utc_offset_seconds for t in times]
+    return HourlyWeather(
+        latitude=response["latitude"],
+        longitude=response["longitude"],
+        utc_offset_seconds=utc_offset_seconds,
+        timezone=response.get("timezone", "GMT"),
+        timezone_abbreviation=response.get("timezone_abbreviation", "GMT"),
+        time=int(times[0]),
+        interval=int(times[1] - times[0]) if len(times) > 1 else 3600,
+        variables={name: np.asarray(values, dtype=np.float32) for name, values in hourly.items()},
+    )
+
+
+def _weather_to_json(weather: HourlyWeather) -> dict:
+    n = len(next(iter(weather.variables.values()))) if weather.variables else 0
+    return {
+        "latitude": weather.latitude,
+        "longitude": weather.longitude,
+        "utc_offset_seconds": weather.utc_offset_seconds,
+        "timezone": weather.timezone,
+        "timezone_abbreviation": weather.timezone_abbreviation,
+        "hourly": {
+            "time": [weather.time + i * weather.interval for i in range(n)],
+            **{name: [None if np.isnan(v) else float(v) for v in values] for name, values in weather.variables.items()},
+        },
+    }
+
+
+def _weather_to_flatbuffers(weather: HourlyWeather) -> bytes:
+    """
+    Encode as length-prefixed FlatBuffers message of the Open-Meteo SDK schema (WeatherApiResponse).
+    The field slots follow the generated readers in openmeteo_sdk.
+    """
+    import flatbuffers
+
+    builder = flatbuffers.Builder(1024)
+    n = 0
+    variable_offsets = []
+    for name, values in weather.variables.items():
+        values = np.asarray(values, dtype=np.float32)
+        n = len(values)
+        variable, altitude = _variable_enum(name)
+        values_offset = builder.CreateNumpyVector(values)
+        # VariableWithValues: variable (0), values (3), altitude (5)
+        builder.StartObject(13)
+        builder.PrependUint8Slot(0, variable, 0)
+        builder.PrependUOffsetTRelativeSlot(3, values_offset, 0)
+        builder.PrependInt16Slot(5, altitude, 0)
+        variable_offsets.append(builder.EndObject())
+
+    builder.StartVector(4, len(variable_offsets), 4)
+    for offset in reversed(variable_offsets):
+        builder.PrependUOffsetTRelative(offset)
+    variables_offset = builder.EndVector()
+    # VariablesWithTime: time (0), time_end (1), interval (2), variables (3)
+    builder.StartObject(4)
+    builder.PrependInt64Slot(0, weather.time, 0)
+    builder.PrependInt64Slot(1, weather.time + n * weather.interval, 0)
+    builder.PrependInt32Slot(2, weather.interval, 0)
+    builder.PrependUOffsetTRelativeSlot(3, variables_offset, 0)
+    hourly_offset = builder.EndObject()
+
+    timezone_offset = builder.CreateString(weather.timezone)
+    timezone_abbreviation_offset = builder.CreateString(weather.timezone_abbreviation)
+    # WeatherApiResponse: latitude (0), longitude (1), utc_offset_seconds (6), timezone (7), abbreviation (8), hourly (11)
+    builder.StartObject(15)
+    builder.PrependFloat32Slot(0, weather.latitude, 0)
+    builder.PrependFloat32Slot(1, weather.longitude, 0)
+    builder.PrependInt32Slot(6, weather.utc_offset_seconds, 0)
+    builder.PrependUOffsetTRelativeSlot(7, timezone_offset, 0)
+    builder.PrependUOffsetTRelativeSlot(8, timezone_abbreviation_offset, 0)
+    builder.PrependUOffsetTRelativeSlot(11, hourly_offset, 0)
+    builder.Finish(builder.EndObject())
+
+    message = bytes(builder.Output())
+    return len(message).to_bytes(4, byteorder="little") + message